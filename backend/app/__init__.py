@@ -1,3 +1,5 @@
+import os
+
 from flask import Flask
 from flask_cors import CORS
 
@@ -8,15 +10,53 @@ def create_app():
     # Load configuration
     app.config.from_mapping(
         SECRET_KEY='your_secret_key',
-        SQLALCHEMY_DATABASE_URI='sqlite:///skillbridge.db'
+        SQLALCHEMY_DATABASE_URI=os.environ.get('DATABASE_URL', 'sqlite:///skillbridge.db'),
+        # SQLite connection tuning (WAL, busy timeout, cache and mmap sizes), see services/db_engine.py
+        SQLITE_TUNING=os.environ.get('SQLITE_TUNING', '1') == '1',
+        SQLITE_BUSY_TIMEOUT_MS=int(os.environ.get('SQLITE_BUSY_TIMEOUT_MS', 5000)),
+        SQLITE_CACHE_SIZE_KIB=int(os.environ.get('SQLITE_CACHE_SIZE_KIB', 64 * 1024)),
+        SQLITE_MMAP_SIZE=int(os.environ.get('SQLITE_MMAP_SIZE', 256 * 1024 * 1024)),
+        # Connection pool per worker process for server databases (PostgreSQL)
+        DB_POOL_SIZE=int(os.environ.get('DB_POOL_SIZE', 10)),
+        DB_MAX_OVERFLOW=int(os.environ.get('DB_MAX_OVERFLOW', 20)),
+        DB_POOL_TIMEOUT=float(os.environ.get('DB_POOL_TIMEOUT', 30)),
+        DB_POOL_RECYCLE=int(os.environ.get('DB_POOL_RECYCLE', 1800)),
+        # Load the spaCy model at startup (set for pre-fork servers, see gunicorn.conf.py)
+        NLP_PRELOAD=os.environ.get('NLP_PRELOAD', '0') == '1',
+        # Resume analysis cache: in-process LRU size and optional SQLite file
+        ANALYSIS_CACHE_SIZE=int(os.environ.get('ANALYSIS_CACHE_SIZE', 1024)),
+        ANALYSIS_CACHE_PATH=os.environ.get('ANALYSIS_CACHE_PATH'),
+        # Serialized user profiles cached per worker
+        PROFILE_CACHE_SIZE=int(os.environ.get('PROFILE_CACHE_SIZE', 4096)),
+        # Verified bearer tokens cached per worker (seconds; 0 disables)
+        AUTH_CACHE_TTL=float(os.environ.get('AUTH_CACHE_TTL', 30)),
+        AUTH_CACHE_SIZE=int(os.environ.get('AUTH_CACHE_SIZE', 10000)),
+        # Password hashing cost profile (Werkzeug method string) and its bounded thread pool
+        PASSWORD_HASH_METHOD=os.environ.get('PASSWORD_HASH_METHOD', 'scrypt:32768:8:1'),
+        PASSWORD_HASH_WORKERS=int(os.environ.get('PASSWORD_HASH_WORKERS', 2)),
+        PASSWORD_HASH_MAX_PENDING=int(os.environ.get('PASSWORD_HASH_MAX_PENDING', 32)),
+        PASSWORD_HASH_TIMEOUT=float(os.environ.get('PASSWORD_HASH_TIMEOUT', 10)),
+        # Skill taxonomy data file and how often workers check it for changes (seconds)
+        TAXONOMY_PATH=os.environ.get('TAXONOMY_PATH'),
+        TAXONOMY_RELOAD_INTERVAL=float(os.environ.get('TAXONOMY_RELOAD_INTERVAL', 30)),
+        # Load the sample job postings when the catalog table is empty
+        SEED_JOB_CATALOG=os.environ.get('SEED_JOB_CATALOG', '1') == '1',
+        # Near-duplicate postings at ingest: skip, merge or off, and the similarity threshold
+        DEDUPE_POLICY=os.environ.get('DEDUPE_POLICY', 'skip'),
+        DEDUPE_THRESHOLD=float(os.environ.get('DEDUPE_THRESHOLD', 0.85)),
+        # JSON file keeping the scraper's ETag / Last-Modified validators between runs
+        SCRAPER_STATE_PATH=os.environ.get('SCRAPER_STATE_PATH'),
+        # Shared secret for /api/admin endpoints (X-Admin-Key header); admin API is off when unset
+        ADMIN_API_KEY=os.environ.get('ADMIN_API_KEY')
     )
 
-    # Enable CORS for all routes (allow frontend dev server)
-    CORS(app, supports_credentials=True)
+    # Enable CORS for all routes (allow frontend dev server); the job data
+    # pagination headers have to be exposed for the frontend to read them
+    CORS(app, supports_credentials=True, expose_headers=['X-Next-Cursor', 'Link', 'ETag'])
 
 
     # Register blueprints
-    from .routes import profile, jobdata, gap, recommend, auth, password, avatar
+    from .routes import profile, jobdata, gap, recommend, auth, password, avatar, jobs, market, admin
     app.register_blueprint(profile.profile_bp, url_prefix='/api/profile')
     app.register_blueprint(jobdata.jobdata_bp)
     app.register_blueprint(gap.gap_bp)
@@ -24,13 +64,83 @@ def create_app():
     app.register_blueprint(auth.auth_bp, url_prefix='/api/auth')
     app.register_blueprint(password.password_bp, url_prefix='/api/password')
     app.register_blueprint(avatar.avatar_bp, url_prefix='/api/avatar')
+    app.register_blueprint(jobs.jobs_bp)
+    app.register_blueprint(market.market_bp)
+    app.register_blueprint(admin.admin_bp, url_prefix='/api/admin')
 
-    # Initialize database
+    # Initialize database with the engine profile for its dialect
     from .models import db
+    from .services import db_engine
+    db_engine.configure(app)
     db.init_app(app)
+    with app.app_context():
+        db_engine.install_for_app(app, db.engine)
 
-    # Create tables if they do not exist
+    # Keep in-memory catalog indexes in sync with committed job posting changes
+    from .services import catalog_events
+    catalog_events.install()
+    # Keep the skill demand table in step with ORM writes to postings
+    from .services import demand
+    demand.install()
+    # Drop cached profiles and authenticated users once profile writes commit
+    from .services import profiles
+    profiles.install()
+
+    # Create tables if they do not exist and add columns/indexes new since they were created
+    from .models import upgrade_schema
     with app.app_context():
         db.create_all()
+        upgrade_schema()
+        # Full-text index over postings (FTS5 on SQLite, LIKE fallback elsewhere)
+        from .services import search
+        search.install(db.engine)
+        # Skill demand counts for a catalog that predates the table
+        demand.ensure_built()
+        if app.config['SEED_JOB_CATALOG']:
+            from .services.importer import seed_catalog
+            seed_catalog()
+
+    # Maintenance commands (flask import-jobs ...)
+    from .cli import register_commands
+    register_commands(app)
+
+    # Point the skill taxonomy at its data file (hot reloaded on change)
+    from .services import taxonomy
+    taxonomy.configure(
+        path=app.config['TAXONOMY_PATH'],
+        reload_interval=app.config['TAXONOMY_RELOAD_INTERVAL']
+    )
+
+    # Move per-user skill rows from before the canonical skill catalog (no-op once done)
+    from .services.skills import migrate_legacy_skills
+    with app.app_context():
+        migrated = migrate_legacy_skills()
+        if migrated:
+            print(f"Migrated {migrated} user skills to the canonical skill catalog")
+
+    # Configure the shared resume analysis cache
+    from .services.cache import analysis_cache
+    analysis_cache.configure(
+        maxsize=app.config['ANALYSIS_CACHE_SIZE'],
+        path=app.config['ANALYSIS_CACHE_PATH']
+    )
+    from .services.profiles import profile_cache
+    profile_cache.configure(maxsize=app.config['PROFILE_CACHE_SIZE'])
+    from .services.auth_cache import token_cache
+    token_cache.configure(maxsize=app.config['AUTH_CACHE_SIZE'], ttl=app.config['AUTH_CACHE_TTL'])
+
+    # Hash passwords off the request threads, with the configured cost profile
+    from .services.passwords import password_hasher
+    password_hasher.configure(
+        method=app.config['PASSWORD_HASH_METHOD'],
+        workers=app.config['PASSWORD_HASH_WORKERS'],
+        max_pending=app.config['PASSWORD_HASH_MAX_PENDING'],
+        timeout=app.config['PASSWORD_HASH_TIMEOUT']
+    )
+
+    # Warm up NLP before workers fork so they share the model copy-on-write
+    if app.config['NLP_PRELOAD']:
+        from .services import nlp
+        nlp.warmup()
 
     return app
\ No newline at end of file
@@ -0,0 +1,138 @@
+"""
+Command Line Interface
+----------------------
+Maintenance commands registered on the Flask CLI (`flask --app run <command>`).
+"""
+
+import asyncio
+
+import click
+from flask import current_app
+from flask.cli import with_appcontext
+
+from app.services import dedupe, demand, importer, scraper, search, skills
+
+
+@click.command('import-jobs')
+@click.argument('path', type=click.Path(exists=True, dir_okay=False))
+@click.option('--batch-size', default=importer.DEFAULT_BATCH_SIZE, show_default=True,
+              help='Postings per insert batch and transaction.')
+@click.option('--extract/--no-extract', default=True, show_default=True,
+              help='Add skills extracted from each description.')
+@click.option('--dedupe', 'dedupe_policy', type=click.Choice(dedupe.POLICIES),
+              help='What to do with near-duplicates of stored postings (default: DEDUPE_POLICY).')
+@click.option('--threshold', type=float, help='Near-duplicate similarity threshold (default: DEDUPE_THRESHOLD).')
+@with_appcontext
+def import_jobs_command(path, batch_size, extract, dedupe_policy, threshold):
+    """Stream job postings from a JSONL or CSV file into the database."""
+    def report(stats):
+        click.echo(f"{stats.imported:,} imported, {stats.duplicates:,} duplicates, {stats.skipped:,} skipped "
+                   f"({stats.rate:,.0f} rows/s)")
+
+    stats = importer.import_file(path, batch_size=batch_size, extract_skills=extract, progress=report,
+                                 dedupe_policy=dedupe_policy, dedupe_threshold=threshold)
+    for message in stats.errors:
+        click.echo(f"skipped {message}", err=True)
+    click.echo(f"Done: {stats.imported:,} postings imported from {stats.read:,} records "
+               f"in {stats.elapsed:.1f}s")
+
+
+@click.command('rebuild-demand')
+@click.option('--check-only', is_flag=True, help='Report mismatches without rebuilding.')
+@with_appcontext
+def rebuild_demand_command(check_only):
+    """Check the skill demand table against the database and rebuild it."""
+    mismatches = demand.check()
+    for message in mismatches[:50]:
+        click.echo(message)
+    click.echo(f"{len(mismatches)} mismatching demand counts")
+    if not check_only:
+        rows = demand.rebuild()
+        remaining = demand.check()
+        click.echo(f"Rebuilt {rows:,} demand counts, {len(remaining)} mismatches left")
+
+
+@click.command('scrape-jobs')
+@click.argument('urls', nargs=-1, required=True)
+@click.option('--max-pages', default=scraper.ScraperConfig.max_pages, show_default=True)
+@click.option('--max-connections', default=scraper.ScraperConfig.max_connections, show_default=True)
+@click.option('--per-host', default=scraper.ScraperConfig.per_host, show_default=True,
+              help='Concurrent requests per host.')
+@click.option('--rate', default=scraper.ScraperConfig.rate_per_host, show_default=True,
+              help='Requests per second per host.')
+@click.option('--extract/--no-extract', default=True, show_default=True,
+              help='Add skills extracted from each description.')
+@click.option('--state', 'state_path', type=click.Path(dir_okay=False),
+              help='JSON file keeping ETag / Last-Modified validators between runs (default: SCRAPER_STATE_PATH).')
+@with_appcontext
+def scrape_jobs_command(urls, max_pages, max_connections, per_host, rate, extract, state_path):
+    """Crawl job board pages from URLS and import the postings found."""
+    state_path = state_path or current_app.config['SCRAPER_STATE_PATH']
+    config = scraper.ScraperConfig(max_pages=max_pages, max_connections=max_connections,
+                                   per_host=per_host, rate_per_host=rate)
+    validators = scraper.load_validators(state_path) if state_path else {}
+    crawler = scraper.Scraper(config, validators=validators)
+    try:
+        crawl_stats, import_stats = asyncio.run(scraper.scrape_into_catalog(
+            urls, config, extract_skills=extract, progress=lambda stats: click.echo(stats.summary()),
+            scraper=crawler,
+        ))
+    finally:
+        # Pages fetched before a failure still get their conditional GET next time
+        if state_path:
+            scraper.save_validators(state_path, crawler.validators)
+    for message in import_stats.errors:
+        click.echo(f"skipped {message}", err=True)
+    click.echo(f"Done: {crawl_stats.summary()}; {import_stats.imported:,} postings imported")
+
+
+@click.command('dedupe-jobs')
+@click.option('--threshold', type=float, help='Near-duplicate similarity threshold (default: DEDUPE_THRESHOLD).')
+@click.option('--merge', is_flag=True, help="Add the duplicates' skills to the posting that is kept.")
+@click.option('--dry-run', is_flag=True, help='Only report the duplicates.')
+@with_appcontext
+def dedupe_jobs_command(threshold, merge, dry_run):
+    """Remove near-duplicate job postings, keeping the oldest copy."""
+    if threshold is None:
+        threshold = current_app.config['DEDUPE_THRESHOLD']
+    stats = dedupe.dedupe_catalog(
+        threshold=threshold,
+        policy=dedupe.DEDUPE_MERGE if merge else dedupe.DEDUPE_SKIP,
+        dry_run=dry_run,
+        progress=lambda s: click.echo(f"{s.scanned:,} scanned, {s.duplicates:,} duplicates"),
+    )
+    verb = 'found' if dry_run else 'removed'
+    click.echo(f"Done: {stats.duplicates:,} duplicates {verb} in {stats.scanned:,} postings "
+               f"({stats.signed:,} newly signed)")
+
+
+@click.command('rebuild-search')
+@with_appcontext
+def rebuild_search_command():
+    """Re-index every job posting for full-text search."""
+    from app.models import db
+
+    if not search.install(db.engine):
+        click.echo("Full-text search is not available on this database (LIKE fallback in use).")
+        return
+    search.rebuild(db.engine)
+    click.echo("Search index rebuilt.")
+
+
+@click.command('migrate-skills')
+@click.option('--batch-size', default=skills.MIGRATION_BATCH_SIZE, show_default=True,
+              help='Old skill rows per transaction.')
+@with_appcontext
+def migrate_skills_command(batch_size):
+    """Move per-user skill rows into the canonical skill catalog."""
+    migrated = skills.migrate_legacy_skills(batch_size=batch_size)
+    click.echo(f"Done: {migrated:,} user skills migrated")
+
+
+def register_commands(app):
+    app.cli.add_command(import_jobs_command)
+    app.cli.add_command(rebuild_demand_command)
+    app.cli.add_command(scrape_jobs_command)
+    app.cli.add_command(dedupe_jobs_command)
+    app.cli.add_command(rebuild_search_command)
+    app.cli.add_command(migrate_skills_command)
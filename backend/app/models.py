@@ -1,6 +1,9 @@
 
+import json
+from datetime import datetime, timezone
+
 from flask_sqlalchemy import SQLAlchemy
-from werkzeug.security import generate_password_hash, check_password_hash
+from sqlalchemy import inspect, text
 
 db = SQLAlchemy()
 
@@ -10,33 +13,177 @@ class User(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     username = db.Column(db.String(80), unique=True, nullable=False)
     email = db.Column(db.String(120), unique=True, nullable=False)
-    password_hash = db.Column(db.String(128), nullable=False)
+    password_hash = db.Column(db.String(256), nullable=False)  # scrypt hashes are ~160 characters
     location = db.Column(db.String(120))
     bio = db.Column(db.Text)
     education = db.Column(db.Text)  # Store as JSON string
     experience = db.Column(db.Text)  # Store as JSON string
     resume_url = db.Column(db.String(255))
     image_url = db.Column(db.String(255))
-    skills = db.relationship('Skill', backref='user', lazy=True, cascade='all, delete-orphan')
+    # Bumped on every profile write so cached serializations (services/profiles.py) go stale
+    profile_version = db.Column(db.Integer, default=0)
+    skills = db.relationship('Skill', secondary='user_skill', lazy=True, order_by='Skill.name')
+    # Free-text skill rows from before the canonical catalog, emptied by services/skills.py
+    legacy_skills = db.relationship('LegacySkill', lazy=True, cascade='all, delete-orphan')
 
+    # Hashing runs in the bounded pool of services/passwords.py and may raise PasswordHasherBusy
     def set_password(self, password):
-        self.password_hash = generate_password_hash(password)
+        from app.services.passwords import password_hasher
+        self.password_hash = password_hasher.hash(password)
 
     def check_password(self, password):
-        return check_password_hash(self.password_hash, password)
+        from app.services.passwords import password_hasher
+        return password_hasher.verify(self.password_hash, password)
+
+    def upgrade_password_hash(self, password):
+        """Rehash a just-verified password if it was stored with outdated parameters."""
+        from app.services.passwords import password_hasher
+        new_hash = password_hasher.upgrade(self.password_hash, password)
+        if new_hash:
+            self.password_hash = new_hash
+        return new_hash is not None
 
 class Skill(db.Model):
+    """Canonical skill, stored once and shared by every user who has it."""
+    __tablename__ = 'canonical_skill'
+
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(100), nullable=False)
-    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    normalized_name = db.Column(db.String(100), nullable=False, unique=True)
+    type = db.Column(db.String(20), nullable=False, default='technical')  # technical or soft
+    category = db.Column(db.String(100), index=True)
+
+class UserSkill(db.Model):
+    __table_args__ = (
+        # "Users with skill X" and cohort queries start from the skill side
+        db.Index('ix_user_skill_skill_user', 'skill_id', 'user_id'),
+    )
+
+    # The composite primary key is the unique (user_id, skill_id) index
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id', ondelete='CASCADE'), primary_key=True)
+    skill_id = db.Column(db.Integer, db.ForeignKey('canonical_skill.id'), primary_key=True)
+
+class LegacySkill(db.Model):
+    __tablename__ = 'skill'
+
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(100), nullable=False)
+    type = db.Column(db.String(20), default='technical')
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False, index=True)
+
+def utcnow():
+    return datetime.now(timezone.utc).replace(tzinfo=None)
 
 class JobPosting(db.Model):
+    # Filter columns are indexed together with id so keyset pages stay index scans
+    __table_args__ = (
+        db.Index('ix_job_posting_title_id', 'title', 'id'),
+        db.Index('ix_job_posting_location_id', 'location', 'id'),
+    )
+
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(200), nullable=False)
     description = db.Column(db.Text, nullable=False)
-    required_skills = db.relationship('RequiredSkill', backref='job_posting', lazy=True)
+    company = db.Column(db.String(200))
+    location = db.Column(db.String(200))
+    salary_range = db.Column(db.String(100))
+    salary_min = db.Column(db.Integer, index=True)  # Parsed from salary_range
+    salary_max = db.Column(db.Integer, index=True)
+    requirements = db.Column(db.Text)  # Store as JSON string
+    updated_at = db.Column(db.DateTime, default=utcnow, onupdate=utcnow)
+    minhash = db.Column(db.LargeBinary)  # Near-duplicate signature, see services/dedupe.py
+    duplicate_count = db.Column(db.Integer, default=0)  # Reposts merged into this posting
+    required_skills = db.relationship('RequiredSkill', backref='job_posting', lazy=True, cascade='all, delete-orphan')
+    buckets = db.relationship('PostingBucket', lazy=True, cascade='all, delete-orphan')
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "title": self.title,
+            "company": self.company,
+            "location": self.location,
+            "salary_range": self.salary_range,
+            "salary_min": self.salary_min,
+            "salary_max": self.salary_max,
+            "description": self.description,
+            "requirements": json.loads(self.requirements) if self.requirements else [],
+            "skills": [s.skill_name for s in self.required_skills]
+        }
 
 class RequiredSkill(db.Model):
+    __table_args__ = (
+        db.Index('ix_required_skill_name_posting', 'skill_name', 'job_posting_id'),
+    )
+
     id = db.Column(db.Integer, primary_key=True)
     skill_name = db.Column(db.String(100), nullable=False)
-    job_posting_id = db.Column(db.Integer, db.ForeignKey('job_posting.id'), nullable=False)
\ No newline at end of file
+    job_posting_id = db.Column(db.Integer, db.ForeignKey('job_posting.id'), nullable=False, index=True)
+
+
+class PostingBucket(db.Model):
+    """LSH bucket of a job posting's MinHash signature (one row per band)."""
+    id = db.Column(db.Integer, primary_key=True)
+    bucket = db.Column(db.BigInteger, nullable=False, index=True)
+    job_posting_id = db.Column(db.Integer, db.ForeignKey('job_posting.id'), nullable=False, index=True)
+
+
+class SkillDemand(db.Model):
+    """Postings requiring a skill, overall or within one title/location (see services/demand.py)."""
+    __tablename__ = 'skill_demand'
+
+    scope = db.Column(db.String(10), primary_key=True)  # all, title or location
+    value = db.Column(db.String(200), primary_key=True)  # the title/location, '' for all
+    skill_name = db.Column(db.String(100), primary_key=True)
+    postings = db.Column(db.Integer, nullable=False)
+
+
+# Rankings read in index order: most postings first, then by name
+db.Index('ix_skill_demand_ranked', SkillDemand.scope, SkillDemand.value,
+         SkillDemand.postings.desc(), SkillDemand.skill_name)
+
+
+def upgrade_schema():
+    """
+    Bring tables created by older versions up to date: `db.create_all()`
+    only creates missing tables, so add missing nullable columns and
+    indexes to the existing ones, and fill the added columns of existing
+    rows where they can be derived.
+    """
+    inspector = inspect(db.engine)
+    added = set()
+    with db.engine.begin() as conn:
+        for table in db.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+            existing = {c['name'] for c in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name not in existing and column.nullable:
+                    column_type = column.type.compile(dialect=conn.dialect)
+                    conn.execute(text(f'ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}'))
+                    added.add((table.name, column.name))
+            for index in table.indexes:
+                index.create(conn, checkfirst=True)
+        _backfill(conn, added)
+
+
+def _backfill(conn, added):
+    """Fill columns just added to an existing table the way new rows get them."""
+    postings = JobPosting.__table__
+    if ('job_posting', 'salary_min') in added or ('job_posting', 'salary_max') in added:
+        # Parsed from salary_range on import; without them the salary filters skip older postings
+        from app.services.importer import parse_salary_range
+        rows = conn.execute(
+            db.select(postings.c.id, postings.c.salary_range).where(postings.c.salary_range.is_not(None))
+        ).all()
+        bounds = [(row.id, *parse_salary_range(row.salary_range)) for row in rows]
+        params = [{'posting_id': pid, 'low': low, 'high': high} for pid, low, high in bounds if low is not None]
+        if params:
+            conn.execute(
+                postings.update()
+                .where(postings.c.id == db.bindparam('posting_id'))
+                .values(salary_min=db.bindparam('low'), salary_max=db.bindparam('high')),
+                params,
+            )
+    if ('job_posting', 'updated_at') in added:
+        # Pages need a modification time for Last-Modified
+        conn.execute(postings.update().values(updated_at=utcnow()))
\ No newline at end of file
@@ -0,0 +1,97 @@
+from flask import Blueprint, request, jsonify, current_app
+from app.models import db, User
+from app.services.skills import resolve_skills, skill_entries, sync_user_skills, canonical_key
+import hmac
+
+admin_bp = Blueprint('admin', __name__)
+
+MAX_SYNC_USERS = 1000
+
+
+# ------------------- AUTH HELPER -------------------
+def is_admin_request():
+    """True when the X-Admin-Key header matches the configured ADMIN_API_KEY (never when unset)."""
+    expected = current_app.config.get('ADMIN_API_KEY')
+    provided = request.headers.get('X-Admin-Key', '')
+    return bool(expected) and hmac.compare_digest(provided.encode(), expected.encode())
+
+
+# ------------------- BULK SKILL SYNC -------------------
+@admin_bp.route('/skills/sync', methods=['POST'])
+def sync_skills():
+    """
+    Sync the skills of many users in one transaction (admin imports).
+    Expects JSON: {"users": [{"user_id": int, "skills": [{"name": str, "type": str}]}],
+                   "mode": "replace" (default) or "add"}
+    Only skills that differ from the stored ones are written.
+    """
+    if not is_admin_request():
+        return jsonify({'error': 'Forbidden'}), 403
+
+    data = request.get_json() or {}
+    users = data.get('users')
+    mode = data.get('mode', 'replace')
+    if not isinstance(users, list) or not users:
+        return jsonify({"error": "users must be a non-empty list."}), 400
+    if len(users) > MAX_SYNC_USERS:
+        return jsonify({"error": f"At most {MAX_SYNC_USERS} users per request."}), 400
+    if mode not in ('replace', 'add'):
+        return jsonify({"error": "mode must be 'replace' or 'add'."}), 400
+
+    requested = {}
+    for entry in users:
+        if not isinstance(entry, dict) or not isinstance(entry.get('user_id'), int) \
+                or not isinstance(entry.get('skills', []), list):
+            return jsonify({"error": "Each user needs an integer user_id and a skills list."}), 400
+        try:
+            skills = skill_entries(entry.get('skills', []))
+        except ValueError as e:
+            return jsonify({"error": str(e), "user_id": entry['user_id']}), 400
+        requested.setdefault(entry['user_id'], []).extend(skills)
+
+    found = set(db.session.scalars(db.select(User.id).where(User.id.in_(list(requested)))))
+    unknown = sorted(set(requested) - found)
+    if unknown:
+        return jsonify({"error": "Unknown users.", "user_ids": unknown}), 400
+
+    # Resolve every name once for the whole batch
+    resolved = {
+        skill.normalized_name: skill
+        for skill in resolve_skills(entry for skills in requested.values() for entry in skills)
+    }
+    desired = {
+        user_id: [resolved[key] for key in dict.fromkeys(
+            canonical_key(name) for name, _ in skills
+        ) if key in resolved]
+        for user_id, skills in requested.items()
+    }
+
+    result = sync_user_skills(desired, replace=(mode == 'replace'))
+    db.session.commit()
+
+    return jsonify({
+        "message": "Skills synced successfully.",
+        "users": len(desired),
+        "changed_users": len(result.changed_users),
+        "inserted": result.inserted,
+        "deleted": result.deleted
+    }), 200
+
+
+# ------------------- CACHE STATS -------------------
+@admin_bp.route('/cache/stats', methods=['GET'])
+def cache_stats():
+    """Hit/miss counters of this worker's caches and the password hashing pool."""
+    if not is_admin_request():
+        return jsonify({'error': 'Forbidden'}), 403
+
+    from app.services.auth_cache import token_cache
+    from app.services.cache import analysis_cache
+    from app.services.passwords import password_hasher
+    from app.services.profiles import profile_cache
+    return jsonify({
+        "auth": token_cache.stats(),
+        "profiles": profile_cache.stats(),
+        "analysis": analysis_cache.stats(),
+        "password_hashing": password_hasher.stats()
+    }), 200
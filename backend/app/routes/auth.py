@@ -1,12 +1,20 @@
 from flask import Blueprint, request, jsonify
-from werkzeug.security import generate_password_hash, check_password_hash
 from app.models import db, User
+from app.services.passwords import PasswordHasherBusy
 import jwt
 import datetime
 from flask import current_app
 
 auth_bp = Blueprint('auth', __name__)
 
+
+@auth_bp.app_errorhandler(PasswordHasherBusy)
+def password_hasher_busy(e):
+    # Raised by any route that hashes passwords while the hashing pool is saturated
+    response = jsonify({'error': 'Server is busy, please retry shortly.'})
+    response.headers['Retry-After'] = '1'
+    return response, 503
+
 @auth_bp.route('/register', methods=['POST'])
 def register():
     data = request.get_json()
@@ -20,8 +28,8 @@ def register():
     if User.query.filter((User.username == username) | (User.email == email)).first():
         return jsonify({'error': 'User already exists'}), 409
 
-    hashed_password = generate_password_hash(password)
-    user = User(username=username, email=email, password_hash=hashed_password)
+    user = User(username=username, email=email)
+    user.set_password(password)
     db.session.add(user)
     db.session.commit()
 
@@ -37,8 +45,11 @@ def login():
         return jsonify({'error': 'Missing email or password'}), 400
 
     user = User.query.filter_by(email=email).first()
-    if not user or not check_password_hash(user.password_hash, password):
+    if not user or not user.check_password(password):
         return jsonify({'error': 'Invalid credentials'}), 401
+    # Stored with an older cost profile: store it again with the current one
+    if user.upgrade_password_hash(password):
+        db.session.commit()
 
     token = jwt.encode({
         'user_id': user.id,
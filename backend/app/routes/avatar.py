@@ -1,6 +1,7 @@
 from flask import request, jsonify
 from app.models import db
 from app.routes.profile import get_user_from_token
+from app.services.profiles import mark_changed
 from flask import Blueprint
 import os
 from werkzeug.utils import secure_filename
@@ -29,6 +30,7 @@ def upload_avatar():
         os.makedirs(UPLOAD_FOLDER, exist_ok=True)
         file.save(filepath)
         user.image_url = f"/{filepath}"
+        mark_changed(user)
         db.session.commit()
         return jsonify({'message': 'Avatar uploaded successfully.', 'image_url': user.image_url}), 201
     return jsonify({'error': 'Invalid file type'}), 400
@@ -1,8 +1,9 @@
 
 from flask import Blueprint, request, jsonify
-from app.services.nlp import extract_skills
-from app.utils import compare_skills, categorize_skills, find_similar_skills
-from app.routes.jobdata import get_job_data
+from app.services.nlp import extract_skills_cached
+from app.utils import compare_skills, categorize_skills, categorize_skills_indexed, find_similar_skills_bulk
+from app.services.market_index import get_market_index
+from app.services.interner import gap_report
 
 gap_bp = Blueprint('gap', __name__)
 
@@ -18,32 +19,31 @@ def analyze_gap():
     job_titles = data.get('job_titles', [])
 
     # Extract user skills from resume
-    user_skills = extract_skills(resume_text)
+    extracted = extract_skills_cached(resume_text)
+    user_skills = extracted["technical_skills"] + extracted["soft_skills"]
 
-    # Get job data (mocked from jobdata route)
-    job_data = get_job_data().json
-    market_skills = set()
-    for job in job_data:
-        if not job_titles or job['title'] in job_titles:
-            market_skills.update(job['skills'])
-    market_skills = list(market_skills)
+    # Market skills for the requested titles (all titles when none given)
+    market_skills = get_market_index().skills_for_titles(job_titles)
 
     # Find missing skills
     missing_skills = compare_skills(user_skills, market_skills)
 
     # Categorize user and missing skills
     categorized_user_skills = categorize_skills(user_skills)
-    categorized_missing_skills = categorize_skills(missing_skills)
+    categorized_missing_skills, missing_skill_category = categorize_skills_indexed(missing_skills)
 
     # Suggest resources and similar skills for missing skills
+    # (one missing x user similarity matrix for the whole request)
+    similar_by_skill = find_similar_skills_bulk(missing_skills, user_skills, threshold=0.5,
+                                                exclude_identical=True)
     recommendations = []
     for skill in missing_skills:
-        similar = find_similar_skills(skill, user_skills, threshold=0.5)
+        similar = similar_by_skill[skill]
         recommendations.append({
             "skill": skill,
-            "category": next((cat for cat, skills in categorized_missing_skills.items() if skill in skills), "Other"),
+            "category": missing_skill_category[skill],
             "resource": f"Learn {skill} at https://www.google.com/search?q={skill}+tutorial",
-            "similar_user_skills": [s for s, score in similar if score < 1.0]
+            "similar_user_skills": [s for s, _ in similar]
         })
 
     return jsonify({
@@ -55,4 +55,68 @@ def analyze_gap():
         "recommendations": recommendations
     })
 
-    # Looking for recommendations? haaa! No longer needed, they are generated inline above
\ No newline at end of file
+@gap_bp.route('/api/gap/analyze/bulk', methods=['POST'])
+def analyze_gap_bulk():
+    """
+    Analyze the skill gap between one resume and many job titles in one call.
+    Expects JSON: {"resume_text": str, "job_titles": [str]} (every known title when empty)
+    Results are sorted by coverage, best first.
+    """
+    data = request.get_json() or {}
+    resume_text = data.get('resume_text', '')
+    job_titles = data.get('job_titles', [])
+    if not isinstance(resume_text, str):
+        return jsonify({"error": "resume_text must be a string."}), 400
+    if not isinstance(job_titles, list) or not all(isinstance(t, str) for t in job_titles):
+        return jsonify({"error": "job_titles must be a list of strings."}), 400
+
+    # Skills are extracted once for all titles
+    extracted = extract_skills_cached(resume_text)
+    user_skills = extracted["technical_skills"] + extracted["soft_skills"]
+
+    # Building the index interns every market skill, so look it up before
+    # mapping the user's skills to bits (with the index's own interner)
+    index = get_market_index()
+    interner = index.interner
+    user_bits = interner.to_bits(user_skills, add=False)
+    titles = list(dict.fromkeys(job_titles)) or index.titles
+    known = [(title, index.title_bits(title)) for title in titles if index.title_bits(title) is not None]
+    unknown_titles = [title for title in titles if index.title_bits(title) is None]
+
+    # One bitset pass over every title, then one categorization and one
+    # similarity matrix for the union of the missing skills
+    report = list(gap_report(user_bits, known))
+    all_missing_bits = 0
+    for _, missing_bits, _, _ in report:
+        all_missing_bits |= missing_bits
+    all_missing = interner.to_names(all_missing_bits)
+    _, missing_skill_category = categorize_skills_indexed(all_missing)
+    similar_by_skill = find_similar_skills_bulk(all_missing, user_skills, threshold=0.5,
+                                                exclude_identical=True)
+
+    results = []
+    for title, missing_bits, overlap_bits, coverage in report:
+        missing_skills = interner.to_names(missing_bits)
+        results.append({
+            "job_title": title,
+            "coverage": round(coverage * 100, 1),
+            "matched_skills": interner.to_names(overlap_bits),
+            "missing_skills": missing_skills,
+            "recommendations": [
+                {
+                    "skill": skill,
+                    "category": missing_skill_category[skill],
+                    "resource": f"Learn {skill} at https://www.google.com/search?q={skill}+tutorial",
+                    "similar_user_skills": [s for s, _ in similar_by_skill[skill]]
+                }
+                for skill in missing_skills
+            ]
+        })
+    results.sort(key=lambda r: (-r["coverage"], r["job_title"]))
+
+    return jsonify({
+        "user_skills": user_skills,
+        "categorized_user_skills": categorize_skills(user_skills),
+        "results": results,
+        "unknown_titles": unknown_titles
+    })
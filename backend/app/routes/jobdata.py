@@ -1,75 +1,119 @@
-from flask import Blueprint, jsonify
+from flask import Blueprint, request, jsonify
+from app.models import db, JobPosting, RequiredSkill
+import json
+from urllib.parse import urlencode
 
 jobdata_bp = Blueprint('jobdata', __name__)
 
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+# Fields a client can ask for with ?fields=...; "skills" comes from RequiredSkill
+POSTING_FIELDS = {
+    'id': JobPosting.id,
+    'title': JobPosting.title,
+    'company': JobPosting.company,
+    'location': JobPosting.location,
+    'salary_range': JobPosting.salary_range,
+    'salary_min': JobPosting.salary_min,
+    'salary_max': JobPosting.salary_max,
+    'description': JobPosting.description,
+    'requirements': JobPosting.requirements,
+}
+ALL_FIELDS = list(POSTING_FIELDS) + ['skills']
+
+
+def _int_arg(name, default=None):
+    value = request.args.get(name)
+    if value in (None, ''):
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"{name} must be an integer.")
+
+
 @jobdata_bp.route('/api/jobdata', methods=['GET'])
 def get_job_data():
-    # More detailed mock job data
-    job_data = [
-        {
-            "title": "Software Engineer",
-            "company": "TechNova",
-            "location": "Remote",
-            "salary_range": "Ksh.80,000 - Ksh.120,000",
-            "description": "Develop and maintain scalable web applications using Python and modern frameworks.",
-            "requirements": [
-                "Bachelor's degree in Computer Science or related field",
-                "3+ years experience in software development",
-                "Strong problem-solving skills"
-            ],
-            "skills": ["Python", "Flask", "React", "Docker", "Git", "REST APIs", "Unit Testing"]
-        },
-        {
-            "title": "Data Scientist",
-            "company": "Insight Analytics",
-            "location": "Nairobi, Kenya",
-            "salary_range": "Ksh.70,000 - Ksh.110,000",
-            "description": "Analyze large datasets to extract actionable insights and build predictive models.",
-            "requirements": [
-                "Master's degree in Data Science, Statistics, or related field",
-                "Experience with machine learning algorithms",
-                "Excellent communication skills"
-            ],
-            "skills": ["Python", "SQL", "Machine Learning", "Pandas", "TensorFlow", "Data Visualization", "Statistics"]
-        },
-        {
-            "title": "Frontend Developer",
-            "company": "WebWorks",
-            "location": "Hybrid (Nairobi/Remote)",
-            "salary_range": "Ksh.60,000 - Ksh.90,000",
-            "description": "Design and implement user interfaces for web applications using modern JavaScript frameworks.",
-            "requirements": [
-                "2+ years experience in frontend development",
-                "Portfolio of web projects",
-                "Attention to detail"
-            ],
-            "skills": ["JavaScript", "React", "CSS", "HTML", "Redux", "Figma", "Responsive Design"]
-        },
-        {
-            "title": "DevOps Engineer",
-            "company": "CloudOps Ltd.",
-            "location": "Remote",
-            "salary_range": "Ksh.85,000 - Ksh.130,000",
-            "description": "Automate deployment pipelines and manage cloud infrastructure for high-availability systems.",
-            "requirements": [
-                "Experience with AWS or Azure",
-                "Knowledge of CI/CD tools",
-                "Scripting skills (Bash, Python)"
-            ],
-            "skills": ["AWS", "Docker", "Kubernetes", "CI/CD", "Linux", "Terraform", "Python"]
-        },
-        {
-            "title": "Backend Developer",
-            "company": "FinTech Solutions",
-            "location": "Nairobi, Kenya",
-            "salary_range": "Ksh.75,000 - Ksh.115,000",
-            "description": "Build robust backend services and APIs for financial applications.",
-            "requirements": [
-                "Experience with RESTful API design",
-                "Familiarity with databases (SQL/NoSQL)",
-                "Strong debugging skills"
-            ],
-            "skills": ["Python", "Django", "PostgreSQL", "REST APIs", "Celery", "Redis", "Unit Testing"]
-        }
-    ]
-    return jsonify(job_data)
\ No newline at end of file
+    """
+    Job postings, one page at a time, ordered by id.
+    Query params:
+        cursor: id of the last posting of the previous page (X-Next-Cursor header)
+        limit: page size (default 50, max 200)
+        fields: comma-separated fields to return (default all)
+        title, location: exact match
+        skill: required skill, repeatable (postings must require all of them)
+        min_salary, max_salary: salary band the posting's range must overlap
+    The body stays a JSON array; the next page is linked from the X-Next-Cursor
+    and Link headers. Pages carry ETag/Last-Modified and answer 304 when unchanged.
+    """
+    try:
+        cursor = _int_arg('cursor', 0)
+        limit = min(max(_int_arg('limit', DEFAULT_PAGE_SIZE), 1), MAX_PAGE_SIZE)
+        min_salary = _int_arg('min_salary')
+        max_salary = _int_arg('max_salary')
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    fields = [f.strip() for f in request.args.get('fields', '').split(',') if f.strip()] or ALL_FIELDS
+    unknown = [f for f in fields if f not in ALL_FIELDS]
+    if unknown:
+        return jsonify({"error": f"Unknown fields: {', '.join(unknown)}"}), 400
+    if 'id' not in fields:
+        fields = ['id'] + fields
+
+    columns = [POSTING_FIELDS[f] for f in fields if f in POSTING_FIELDS]
+    query = db.select(*columns, JobPosting.updated_at).where(JobPosting.id > cursor)
+
+    if request.args.get('title'):
+        query = query.where(JobPosting.title == request.args['title'])
+    if request.args.get('location'):
+        query = query.where(JobPosting.location == request.args['location'])
+    for skill in request.args.getlist('skill'):
+        # Served from the (skill_name, job_posting_id) index
+        query = query.where(JobPosting.id.in_(
+            db.select(RequiredSkill.job_posting_id).where(RequiredSkill.skill_name == skill)
+        ))
+    if min_salary is not None:
+        query = query.where(JobPosting.salary_max >= min_salary)
+    if max_salary is not None:
+        query = query.where(JobPosting.salary_min <= max_salary)
+
+    # One extra row tells whether there is a next page
+    rows = db.session.execute(query.order_by(JobPosting.id).limit(limit + 1)).all()
+    has_next = len(rows) > limit
+    rows = rows[:limit]
+
+    postings = []
+    for row in rows:
+        posting = {f: getattr(row, f) for f in fields if f in POSTING_FIELDS}
+        if 'requirements' in posting:
+            posting['requirements'] = json.loads(posting['requirements']) if posting['requirements'] else []
+        postings.append(posting)
+
+    if 'skills' in fields and postings:
+        by_id = {p['id']: p for p in postings}
+        for p in postings:
+            p['skills'] = []
+        skill_rows = db.session.execute(
+            db.select(RequiredSkill.job_posting_id, RequiredSkill.skill_name)
+            .where(RequiredSkill.job_posting_id.in_(by_id))
+            .order_by(RequiredSkill.id)
+        )
+        for posting_id, skill_name in skill_rows:
+            by_id[posting_id]['skills'].append(skill_name)
+
+    response = jsonify(postings)
+    if has_next:
+        next_cursor = rows[-1].id
+        args = request.args.to_dict(flat=False)
+        args['cursor'] = [str(next_cursor)]
+        response.headers['X-Next-Cursor'] = str(next_cursor)
+        response.headers['Link'] = f'<{request.base_url}?{urlencode(args, doseq=True)}>; rel="next"'
+
+    modified = [row.updated_at for row in rows if row.updated_at]
+    if modified:
+        response.last_modified = max(modified)
+    response.headers['Cache-Control'] = 'no-cache'
+    response.add_etag()
+    return response.make_conditional(request)
@@ -0,0 +1,84 @@
+from flask import Blueprint, request, jsonify
+from app.services.nlp import extract_skills_cached
+from app.services.job_matcher import get_job_matcher, DEFAULT_TOP_K
+from app.services.search import search_postings, SearchQueryError
+
+jobs_bp = Blueprint('jobs', __name__)
+
+MAX_TOP_K = 100
+DEFAULT_SEARCH_LIMIT = 20
+MAX_SEARCH_LIMIT = 100
+MAX_SEARCH_OFFSET = 1000
+
+
+@jobs_bp.route('/api/jobs/match', methods=['POST'])
+def match_jobs():
+    """
+    Rank job postings against the user's skills.
+    Expects JSON: {"skills": [str]} and/or {"resume_text": str}, optional "k": int, "min_score": float
+    """
+    data = request.get_json() or {}
+    skills = data.get('skills', [])
+    if not isinstance(skills, list) or not all(isinstance(s, str) for s in skills):
+        return jsonify({"error": "Skills must be a list of strings."}), 400
+
+    resume_text = data.get('resume_text')
+    if resume_text is not None and not isinstance(resume_text, str):
+        return jsonify({"error": "resume_text must be a string."}), 400
+    if resume_text:
+        extracted = extract_skills_cached(resume_text)
+        skills = skills + extracted["technical_skills"] + extracted["soft_skills"]
+    if not skills:
+        return jsonify({"error": "Provide skills or resume_text."}), 400
+
+    try:
+        k = min(int(data.get('k', DEFAULT_TOP_K)), MAX_TOP_K)
+        min_score = float(data.get('min_score', 0.0))
+    except (TypeError, ValueError):
+        return jsonify({"error": "k must be an integer and min_score a number."}), 400
+
+    matcher = get_job_matcher()
+    matches = matcher.top_k(skills, k=k, min_score=min_score)
+
+    return jsonify({
+        "skills": skills,
+        "total_postings": len(matcher),
+        "matches": [match.to_dict() for match in matches]
+    })
+
+
+@jobs_bp.route('/api/jobs/search', methods=['GET'])
+def search_jobs():
+    """
+    Full-text search over job titles, companies and descriptions.
+    Query params:
+        q: search words, all required; a trailing * matches prefixes ("pyth*")
+        skill: required skill, repeatable (postings must require all of them)
+        location: exact match
+        limit: page size (default 20, max 100), offset: results to skip (max 1000)
+    Results are ranked best first (BM25) with an HTML snippet, matches in <mark>.
+    """
+    try:
+        limit = min(max(int(request.args.get('limit', DEFAULT_SEARCH_LIMIT)), 1), MAX_SEARCH_LIMIT)
+        offset = min(max(int(request.args.get('offset', 0)), 0), MAX_SEARCH_OFFSET)
+    except ValueError:
+        return jsonify({"error": "limit and offset must be integers."}), 400
+
+    query = request.args.get('q', '')
+    try:
+        results, has_more = search_postings(
+            query,
+            skills=request.args.getlist('skill'),
+            location=request.args.get('location'),
+            limit=limit,
+            offset=offset
+        )
+    except SearchQueryError as e:
+        return jsonify({"error": str(e)}), 400
+
+    return jsonify({
+        "query": query,
+        "results": results,
+        "offset": offset,
+        "has_more": has_more
+    })
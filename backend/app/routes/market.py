@@ -0,0 +1,46 @@
+from flask import Blueprint, request, jsonify
+from app.services import demand
+
+market_bp = Blueprint('market', __name__)
+
+DEMAND_GROUPS = ('title', 'location')
+DEFAULT_DEMAND_LIMIT = 20
+MAX_DEMAND_LIMIT = 500
+
+
+@market_bp.route('/api/market/demand', methods=['GET'])
+def get_skill_demand():
+    """
+    Number of postings requiring each skill, most demanded first.
+    Query params:
+        by: "title" or "location" to count within groups (overall when omitted)
+        value: the title/location to return (every group when omitted)
+        limit: skills per group (default 20, at most 500)
+    """
+    by = request.args.get('by')
+    value = request.args.get('value')
+    if by is not None and by not in DEMAND_GROUPS:
+        return jsonify({"error": f"by must be one of: {', '.join(DEMAND_GROUPS)}"}), 400
+    try:
+        limit = int(request.args.get('limit', DEFAULT_DEMAND_LIMIT))
+    except ValueError:
+        return jsonify({"error": "limit must be an integer."}), 400
+    if limit < 1:
+        return jsonify({"error": "limit must be at least 1."}), 400
+    limit = min(limit, MAX_DEMAND_LIMIT)
+
+    def ranked(counts):
+        return [{"skill": skill, "count": count} for skill, count in counts]
+
+    # Served from the skill_demand table, read in index order
+    if by is None or value is not None:
+        result = ranked(demand.top_demand(by, value, limit))
+    else:
+        result = {group: ranked(counts) for group, counts in demand.top_demand_by_group(by, limit).items()}
+
+    return jsonify({
+        "by": by,
+        "value": value,
+        "total_postings": demand.total_postings(),
+        "demand": result
+    })
@@ -1,8 +1,7 @@
 from flask import request, jsonify
 from app.models import db
 from app.routes.profile import get_user_from_token
-
-from werkzeug.security import check_password_hash
+from app.services.profiles import mark_changed
 
 from flask import Blueprint
 password_bp = Blueprint('password', __name__)
@@ -23,5 +22,6 @@ def change_password():
     if new != confirm:
         return jsonify({'error': 'New passwords do not match.'}), 400
     user.set_password(new)
+    mark_changed(user)
     db.session.commit()
     return jsonify({'message': 'Password changed successfully.'})
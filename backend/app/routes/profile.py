@@ -1,22 +1,50 @@
 from flask import Blueprint, request, jsonify, current_app
-from app.models import db, User, Skill
+from app.models import db, User, UserSkill
+from app.services.profiles import profile_cache, mark_changed, note_changed
+from app.services.auth_cache import token_cache, UserSnapshot
+from app.services.skills import resolve_skills, find_skill, skill_entries, sync_user_skills
 import jwt, json
 
 profile_bp = Blueprint('profile', __name__)
 
 # ------------------- AUTH HELPER -------------------
-def get_user_from_token():
+def get_identity_from_token():
+    """
+    Snapshot (id, username, email, profile_version) of the authenticated user.
+    Verified tokens are cached briefly, so repeated calls skip the JWT decode
+    and the database.
+    """
     auth_header = request.headers.get('Authorization')
     if not auth_header or not auth_header.startswith('Bearer '):
         return None
     token = auth_header.split(' ')[1]
+    snapshot = token_cache.get(token)
+    if snapshot is not None:
+        return snapshot
     try:
         payload = jwt.decode(token, current_app.config['SECRET_KEY'], algorithms=['HS256'])
-        user = User.query.get(payload['user_id'])
-        return user
+        user = db.session.get(User, payload['user_id'])
     except Exception as e:
         print(f"JWT decode error: {e}")
         return None
+    if not user:
+        return None
+    snapshot = UserSnapshot(user.id, user.username, user.email, user.profile_version or 0)
+    token_cache.put(token, snapshot, token_expires=payload.get('exp'))
+    return snapshot
+
+
+def get_user_from_token():
+    """The authenticated user as a model instance, for handlers that write."""
+    identity = get_identity_from_token()
+    if not identity:
+        return None
+    # Already in the session when the token was just verified
+    user = db.session.get(User, identity.id)
+    if user is None:
+        # Deleted since its token was cached
+        token_cache.invalidate_user(identity.id)
+    return user
 
 
 # ------------------- RESUME UPLOAD -------------------
@@ -34,6 +62,7 @@ def upload_resume():
     filepath = f"static/resumes/{filename}"
     file.save(filepath)
     user.resume_url = f"/{filepath}"
+    mark_changed(user)
     db.session.commit()
 
     return jsonify({
@@ -51,37 +80,34 @@ def add_skills():
     if not user:
         return jsonify({'error': 'Unauthorized'}), 401
 
-    skills = request.json.get('skills', [])
-    if not isinstance(skills, list):
-        return jsonify({"error": "Skills must be a list."}), 400
-
-    added = []
-    existing = {s.name.lower() for s in user.skills}
-
-    for skill in skills:
-        name = skill.get('name')
-        skill_type = skill.get('type', 'technical').lower()  # default to technical
-
-        if name and name.lower() not in existing:
-            db.session.add(Skill(name=name, type=skill_type, user_id=user.id))
-            added.append(name)
+    try:
+        # type defaults to technical
+        entries = skill_entries(request.json.get('skills', []))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
 
+    resolved = resolve_skills(entries)
+    added = sync_user_skills({user.id: resolved}, replace=False).added[user.id]
     db.session.commit()
     return jsonify({
         "message": "Skills added successfully.",
         "added": added,
-        "skills": [{"name": s.name, "type": s.type} for s in user.skills]
+        "skills": profile_cache.get(user)['skills']
     }), 201
 
 
 # Get all skills
 @profile_bp.route('/skills', methods=['GET'])
 def get_skills():
-    user = get_user_from_token()
+    user = get_identity_from_token()
     if not user:
         return jsonify({'error': 'Unauthorized'}), 401
 
-    all_skills = [{"name": s.name, "type": s.type} for s in user.skills]
+    profile = profile_cache.get(user)
+    if profile is None:
+        return jsonify({'error': 'Unauthorized'}), 401
+
+    all_skills = profile['skills']
     soft = [s for s in all_skills if s["type"] == "soft"]
     technical = [s for s in all_skills if s["type"] == "technical"]
 
@@ -100,19 +126,21 @@ def remove_skill():
         return jsonify({'error': 'Unauthorized'}), 401
 
     skill_name = request.json.get('skill')
-    if not skill_name:
+    if not skill_name or not isinstance(skill_name, str):
         return jsonify({'error': 'Skill name required.'}), 400
 
-    skill = Skill.query.filter_by(user_id=user.id, name=skill_name).first()
-    if not skill:
+    skill = find_skill(skill_name)
+    link = db.session.get(UserSkill, (user.id, skill.id)) if skill else None
+    if not link:
         return jsonify({'error': 'Skill not found.'}), 404
 
-    db.session.delete(skill)
+    db.session.delete(link)
+    mark_changed(user)
     db.session.commit()
 
     return jsonify({
         'message': f"Skill '{skill_name}' removed.",
-        'skills': [{"name": s.name, "type": s.type} for s in user.skills]
+        'skills': profile_cache.get(user)['skills']
     }), 200
 
 
@@ -123,23 +151,18 @@ def set_skills():
     if not user:
         return jsonify({'error': 'Unauthorized'}), 401
 
-    skills = request.json.get('skills', [])
-    if not isinstance(skills, list):
-        return jsonify({"error": "Skills must be a list."}), 400
-
-    # Wipe all old skills
-    Skill.query.filter_by(user_id=user.id).delete()
-
-    for skill in skills:
-        name = skill.get('name')
-        skill_type = skill.get('type', 'technical').lower()
-        if name:
-            db.session.add(Skill(name=name, type=skill_type, user_id=user.id))
+    try:
+        entries = skill_entries(request.json.get('skills', []))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
 
+    resolved = resolve_skills(entries)
+    # Only the skills that differ from the stored ones are written
+    sync_user_skills({user.id: resolved}, replace=True)
     db.session.commit()
     return jsonify({
         "message": "Skills updated successfully.",
-        "skills": [{"name": s.name, "type": s.type} for s in user.skills]
+        "skills": profile_cache.get(user)['skills']
     }), 200
 
 
@@ -147,22 +170,13 @@ def set_skills():
 
 @profile_bp.route('/profile', methods=['GET'])
 def get_profile():
-    user = get_user_from_token()
+    user = get_identity_from_token()
     if not user:
         return jsonify({'error': 'Unauthorized'}), 401
 
-    profile = {
-        'id': user.id,
-        'name': user.username,
-        'email': user.email,
-        'location': user.location,
-        'bio': user.bio,
-        'skills': [{"name": s.name, "type": s.type} for s in user.skills],
-        'education': json.loads(user.education) if user.education else [],
-        'experience': json.loads(user.experience) if user.experience else [],
-        'resume_url': user.resume_url,
-        'image_url': user.image_url
-    }
+    profile = profile_cache.get(user)
+    if profile is None:
+        return jsonify({'error': 'Unauthorized'}), 401
     return jsonify(profile), 200
 
 
@@ -185,22 +199,10 @@ def update_profile():
     if 'experience' in data:
         user.experience = json.dumps(data['experience'])
 
+    mark_changed(user)
     db.session.commit()
 
-    profile = {
-        'id': user.id,
-        'name': user.username,
-        'email': user.email,
-        'location': user.location,
-        'bio': user.bio,
-        'skills': [{"name": s.name, "type": s.type} for s in user.skills],
-        'education': json.loads(user.education) if user.education else [],
-        'experience': json.loads(user.experience) if user.experience else [],
-        'resume_url': user.resume_url,
-        'image_url': user.image_url
-    }
-
-    return jsonify({'message': 'Profile updated successfully.', 'profile': profile}), 200
+    return jsonify({'message': 'Profile updated successfully.', 'profile': profile_cache.get(user)}), 200
 
 
 @profile_bp.route('/profile', methods=['DELETE'])
@@ -210,5 +212,6 @@ def delete_profile():
         return jsonify({'error': 'Unauthorized'}), 401
 
     db.session.delete(user)
+    note_changed([user.id])
     db.session.commit()
     return jsonify({"message": "Profile deleted successfully."}), 200
@@ -1,8 +1,8 @@
 
 from flask import Blueprint, jsonify, request
-from app.services.nlp import extract_skills
-from app.utils import compare_skills, categorize_skills
-from app.routes.jobdata import get_job_data
+from app.services.nlp import extract_skills_cached
+from app.utils import compare_skills, categorize_skills, categorize_skills_indexed
+from app.services.market_index import get_market_index
 
 recommend_bp = Blueprint('recommend', __name__)
 
@@ -31,28 +31,24 @@ def get_recommendations():
     job_titles = data.get('job_titles', [])
 
     # Extract user skills from resume
-    user_skills = extract_skills(resume_text)
+    extracted = extract_skills_cached(resume_text)
+    user_skills = extracted["technical_skills"] + extracted["soft_skills"]
 
-    # Get job data (mocked from jobdata route)
-    job_data = get_job_data().json
-    market_skills = set()
-    for job in job_data:
-        if not job_titles or job['title'] in job_titles:
-            market_skills.update(job['skills'])
-    market_skills = list(market_skills)
+    # Market skills for the requested titles (all titles when none given)
+    market_skills = get_market_index().skills_for_titles(job_titles)
 
     # Find missing skills
     missing_skills = compare_skills(user_skills, market_skills)
 
     # Categorize user and missing skills
     categorized_user_skills = categorize_skills(user_skills)
-    categorized_missing_skills = categorize_skills(missing_skills)
+    categorized_missing_skills, missing_skill_category = categorize_skills_indexed(missing_skills)
 
     # Suggest resources for missing skills (mocked)
     recommendations = [
         {
             "skill": skill,
-            "category": next((cat for cat, skills in categorized_missing_skills.items() if skill in skills), "Other"),
+            "category": missing_skill_category[skill],
             "resource": f"Learn {skill} at https://www.google.com/search?q={skill}+tutorial"
         }
         for skill in missing_skills
@@ -0,0 +1,141 @@
+"""
+Authenticated User Cache
+------------------------
+Caches verified bearer tokens -> a snapshot of the user they belong to,
+so a burst of requests with the same token decodes the JWT and loads the
+user once instead of on every call.
+
+- Entries live for a short TTL (never past the token's own expiry) in a
+  bounded LRU.
+- Profile writes, password changes and deletions drop every entry of the
+  user in this worker (`invalidate_user()`); other workers see the change
+  once their entry's TTL runs out, which bounds how stale a snapshot can
+  be. Profile reads therefore check the stored `profile_version` instead
+  of the snapshot's (see services/profiles.py).
+- Handlers that only need the user's id (or the snapshot fields) use
+  `get_identity_from_token()` and skip the database on a hit.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, NamedTuple, Optional, Set, Tuple
+
+DEFAULT_AUTH_CACHE_SIZE = 10_000
+DEFAULT_AUTH_CACHE_TTL = 30.0  # seconds
+
+
+class UserSnapshot(NamedTuple):
+    id: int
+    username: str
+    email: str
+    profile_version: int
+
+
+class TokenCache:
+    """Bounded LRU of token -> UserSnapshot with a TTL per entry."""
+
+    def __init__(self, maxsize: int = DEFAULT_AUTH_CACHE_SIZE, ttl: float = DEFAULT_AUTH_CACHE_TTL):
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[float, UserSnapshot]]" = OrderedDict()
+        self._tokens_by_user: Dict[int, Set[str]] = {}
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._reset_counters()
+
+    def configure(self, maxsize: Optional[int] = None, ttl: Optional[float] = None) -> None:
+        with self._lock:
+            if maxsize is not None:
+                self.maxsize = maxsize
+            if ttl is not None:
+                self.ttl = ttl
+            self._evict()
+
+    @property
+    def enabled(self) -> bool:
+        return self.maxsize > 0 and self.ttl > 0
+
+    def get(self, token: str) -> Optional[UserSnapshot]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry is not None:
+                expires_at, snapshot = entry
+                if expires_at > now:
+                    self._entries.move_to_end(token)
+                    self.hits += 1
+                    return snapshot
+                self._drop(token)
+                self.expirations += 1
+            self.misses += 1
+            return None
+
+    def put(self, token: str, snapshot: UserSnapshot, token_expires: Optional[float] = None) -> None:
+        """Remember a verified token; `token_expires` is the JWT `exp` (Unix time)."""
+        if not self.enabled:
+            return
+        ttl = self.ttl
+        if token_expires is not None:
+            ttl = min(ttl, token_expires - time.time())
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._drop(token)
+            self._entries[token] = (time.monotonic() + ttl, snapshot)
+            self._tokens_by_user.setdefault(snapshot.id, set()).add(token)
+            self._evict()
+
+    def invalidate_user(self, user_id: int) -> None:
+        with self._lock:
+            tokens = self._tokens_by_user.pop(user_id, set())
+            for token in tokens:
+                self._entries.pop(token, None)
+            if tokens:
+                self.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._tokens_by_user.clear()
+            self._reset_counters()
+
+    def _drop(self, token: str) -> None:
+        """Remove one entry (caller holds the lock)."""
+        entry = self._entries.pop(token, None)
+        if entry is not None:
+            tokens = self._tokens_by_user.get(entry[1].id)
+            if tokens is not None:
+                tokens.discard(token)
+                if not tokens:
+                    del self._tokens_by_user[entry[1].id]
+
+    def _evict(self) -> None:
+        while self._entries and len(self._entries) > self.maxsize:
+            self._drop(next(iter(self._entries)))
+            self.evictions += 1
+
+    def _reset_counters(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.expirations = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "expirations": self.expirations,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+# Shared token cache (configured in create_app)
+token_cache = TokenCache()
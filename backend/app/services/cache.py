@@ -0,0 +1,194 @@
+"""
+Content-Addressed Result Cache
+------------------------------
+Caches analysis results keyed by a hash of the normalized input text plus
+the skill taxonomy version. A bounded in-process LRU sits in front of an
+optional on-disk SQLite tier shared by all workers on the host.
+
+- Disk entries are scoped by taxonomy version (in the key and the
+  lookup), so workers or deploys on different versions share the file
+  without wiping each other's entries. Only the in-process tier is
+  emptied when this worker sees a new version.
+- SQLite connections cannot be used across fork(): the disk tier is
+  opened lazily by the process that uses it, so workers forked from a
+  preloaded master each open their own connection.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+DEFAULT_CACHE_SIZE = 1024
+
+
+class ResultCache:
+    """Two-tier (LRU + optional SQLite) cache for JSON-serializable results."""
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE, path: Optional[str] = None):
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, Any]" = OrderedDict()
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_pid: Optional[int] = None
+        self._version: Optional[str] = None
+        self.maxsize = maxsize
+        self.path = path
+        self._reset_counters()
+
+    # ------------------------------------------------------------------
+    # Configuration
+    # ------------------------------------------------------------------
+    def configure(self, maxsize: Optional[int] = None, path: Optional[str] = None) -> None:
+        """Resize the LRU and/or attach an on-disk tier at `path`."""
+        with self._lock:
+            if maxsize is not None:
+                self.maxsize = maxsize
+                self._evict()
+            if path and path != self.path:
+                self._close()
+                self.path = path
+
+    def _conn(self) -> Optional[sqlite3.Connection]:
+        """This process's connection to the disk tier, opened on first use (caller holds the lock)."""
+        if self.path is None:
+            return None
+        if self._db_pid != os.getpid():
+            # Inherited from the parent across fork(): never touch it, not even to close it
+            self._db = None
+        if self._db is None:
+            db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                " key TEXT PRIMARY KEY, version TEXT NOT NULL, value TEXT NOT NULL)"
+            )
+            self._db, self._db_pid = db, os.getpid()
+        return self._db
+
+    def _close(self) -> None:
+        if self._db is not None and self._db_pid == os.getpid():
+            self._db.close()
+        self._db = None
+        self._db_pid = None
+        self.path = None
+
+    # ------------------------------------------------------------------
+    # Keys & versioning
+    # ------------------------------------------------------------------
+    @staticmethod
+    def make_key(namespace: str, normalized_text: str, version: str) -> str:
+        digest = hashlib.sha256(normalized_text.encode("utf-8")).hexdigest()
+        return f"{namespace}:{version}:{digest}"
+
+    def _check_version(self, version: str) -> None:
+        """Drop in-process entries of another taxonomy version (caller holds the lock)."""
+        if version == self._version:
+            return
+        if self._version is not None:
+            self._memory.clear()
+            self.invalidations += 1
+        self._version = version
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+    def get_or_compute(
+        self,
+        namespace: str,
+        normalized_text: str,
+        version: str,
+        compute: Callable[[str], Any],
+    ) -> Any:
+        """
+        Return the cached result for (namespace, text, version), computing
+        and storing it on a miss. Returned values are shared; treat them
+        as read-only.
+        """
+        key = self.make_key(namespace, normalized_text, version)
+
+        with self._lock:
+            self._check_version(version)
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return self._memory[key]
+
+            db = self._conn()
+            if db is not None:
+                row = db.execute(
+                    "SELECT value FROM results WHERE key = ? AND version = ?", (key, version)
+                ).fetchone()
+                if row is not None:
+                    value = json.loads(row[0])
+                    self._remember(key, value)
+                    self.hits += 1
+                    self.disk_hits += 1
+                    return value
+
+            self.misses += 1
+
+        # Compute outside the lock so slow analyses don't serialize requests
+        value = compute(normalized_text)
+
+        with self._lock:
+            if version == self._version:
+                self._remember(key, value)
+                db = self._conn()
+                if db is not None:
+                    db.execute(
+                        "INSERT OR REPLACE INTO results (key, version, value) VALUES (?, ?, ?)",
+                        (key, version, json.dumps(value)),
+                    )
+        return value
+
+    def _remember(self, key: str, value: Any) -> None:
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        self._evict()
+
+    def _evict(self) -> None:
+        while len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
+            self.evictions += 1
+
+    # ------------------------------------------------------------------
+    # Maintenance & stats
+    # ------------------------------------------------------------------
+    def clear(self) -> None:
+        """Empty both tiers and reset counters."""
+        with self._lock:
+            self._memory.clear()
+            db = self._conn()
+            if db is not None:
+                db.execute("DELETE FROM results")
+            self._reset_counters()
+
+    def _reset_counters(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "disk_hits": self.disk_hits,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "size": len(self._memory),
+                "maxsize": self.maxsize,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "taxonomy_version": self._version,
+                "disk_path": self.path,
+            }
+
+
+# Shared cache for resume analysis results (configured in create_app)
+analysis_cache = ResultCache()
@@ -0,0 +1,82 @@
+"""
+Job Catalog Reads
+-----------------
+Shared database reads for the in-memory catalog indexes (market index,
+job matcher): postings with their required skills, streamed in chunks so
+large catalogs never load as ORM objects.
+"""
+
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+CHUNK_SIZE = 500
+
+
+class PostingSkills(NamedTuple):
+    id: int
+    title: str
+    location: Optional[str]
+    skills: List[str]
+
+
+def iter_posting_skills(posting_ids: Optional[Iterable[int]] = None) -> Iterator[PostingSkills]:
+    """
+    Yield (posting id, title, location, required skill names) for every
+    posting, or only for `posting_ids`. IDs that no longer exist are simply
+    not yielded.
+    """
+    from app.models import db, JobPosting, RequiredSkill
+
+    query = (
+        db.select(JobPosting.id, JobPosting.title, JobPosting.location, RequiredSkill.skill_name)
+        .outerjoin(RequiredSkill, RequiredSkill.job_posting_id == JobPosting.id)
+        .order_by(JobPosting.id, RequiredSkill.id)
+    )
+
+    with db.engine.connect() as conn:
+        if posting_ids is None:
+            yield from _group(conn.execution_options(yield_per=CHUNK_SIZE).execute(query))
+            return
+        ids = sorted(set(posting_ids))
+        for i in range(0, len(ids), CHUNK_SIZE):
+            yield from _group(conn.execute(query.where(JobPosting.id.in_(ids[i:i + CHUNK_SIZE]))))
+
+
+def _group(rows) -> Iterator[PostingSkills]:
+    """Collapse (id, title, location, skill) rows ordered by id into one tuple per posting."""
+    current: Optional[PostingSkills] = None
+    for posting_id, title, location, skill_name in rows:
+        if current is None or current.id != posting_id:
+            if current is not None:
+                yield current
+            current = PostingSkills(posting_id, title, location, [])
+        if skill_name:
+            current.skills.append(skill_name)
+    if current is not None:
+        yield current
+
+
+def skill_demand_from_db(by: Optional[str] = None) -> Dict[Optional[str], Dict[str, int]]:
+    """
+    Skill demand computed with GROUP BY in the database, for consistency
+    checks of the in-memory aggregates: {group value -> {skill -> postings}},
+    with a single None group when `by` is not given.
+    """
+    from app.models import db, JobPosting, RequiredSkill
+
+    group = {None: None, "title": JobPosting.title, "location": JobPosting.location}[by]
+    count = db.func.count(db.distinct(RequiredSkill.job_posting_id))
+    if group is None:
+        query = db.select(db.null(), RequiredSkill.skill_name, count).group_by(RequiredSkill.skill_name)
+    else:
+        query = (
+            db.select(group, RequiredSkill.skill_name, count)
+            .join(JobPosting, JobPosting.id == RequiredSkill.job_posting_id)
+            .where(group.isnot(None))
+            .group_by(group, RequiredSkill.skill_name)
+        )
+
+    demand: Dict[Optional[str], Dict[str, int]] = {}
+    with db.engine.connect() as conn:
+        for value, skill_name, postings in conn.execute(query):
+            demand.setdefault(value, {})[skill_name] = postings
+    return demand
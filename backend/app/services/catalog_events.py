@@ -0,0 +1,93 @@
+"""
+Job Catalog Change Events
+-------------------------
+Tracks which job postings change in each database transaction and, once
+the transaction commits, tells the subscribed in-memory indexes which
+posting IDs to refresh or drop.
+
+ORM writes are picked up from SQLAlchemy session events. Bulk paths that
+bypass the unit of work (Core inserts/deletes) call `notify()` themselves
+after committing.
+"""
+
+from typing import Callable, Iterable, List, Set
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+# Listener signature: (changed posting ids, deleted posting ids) -> None
+CatalogListener = Callable[[Set[int], Set[int]], None]
+
+_listeners: List[CatalogListener] = []
+_installed = False
+
+_CHANGED_KEY = "catalog_changed"
+_DELETED_KEY = "catalog_deleted"
+
+
+def subscribe(listener: CatalogListener) -> None:
+    if listener not in _listeners:
+        _listeners.append(listener)
+
+
+def unsubscribe(listener: CatalogListener) -> None:
+    if listener in _listeners:
+        _listeners.remove(listener)
+
+
+def notify(changed: Iterable[int] = (), deleted: Iterable[int] = ()) -> None:
+    """Tell every subscriber about committed catalog changes."""
+    changed, deleted = set(changed), set(deleted)
+    changed -= deleted
+    if not changed and not deleted:
+        return
+    for listener in list(_listeners):
+        try:
+            listener(changed, deleted)
+        except Exception as e:
+            # An index failing to refresh must not fail the committed write
+            print(f"Catalog listener {getattr(listener, '__qualname__', listener)} failed: {e}")
+
+
+# ------------------------------------------------------------------
+# 🔹 SESSION EVENTS
+# ------------------------------------------------------------------
+def _after_flush(session: Session, flush_context) -> None:
+    from app.models import JobPosting, RequiredSkill
+
+    changed = session.info.setdefault(_CHANGED_KEY, set())
+    deleted = session.info.setdefault(_DELETED_KEY, set())
+
+    for obj in list(session.new) + list(session.dirty):
+        if isinstance(obj, JobPosting):
+            changed.add(obj.id)
+        elif isinstance(obj, RequiredSkill) and obj.job_posting_id is not None:
+            changed.add(obj.job_posting_id)
+
+    for obj in session.deleted:
+        if isinstance(obj, JobPosting):
+            deleted.add(obj.id)
+        elif isinstance(obj, RequiredSkill) and obj.job_posting_id is not None:
+            changed.add(obj.job_posting_id)
+
+
+def _after_commit(session: Session) -> None:
+    changed = session.info.pop(_CHANGED_KEY, set())
+    deleted = session.info.pop(_DELETED_KEY, set())
+    notify(changed, deleted)
+
+
+def _after_rollback(session: Session) -> None:
+    session.info.pop(_CHANGED_KEY, None)
+    session.info.pop(_DELETED_KEY, None)
+
+
+def install() -> None:
+    """Register the session event hooks (idempotent)."""
+    global _installed
+    if _installed:
+        return
+    event.listen(Session, "after_flush", _after_flush)
+    event.listen(Session, "after_commit", _after_commit)
+    event.listen(Session, "after_rollback", _after_rollback)
+    _installed = True
@@ -0,0 +1,86 @@
+"""
+Skill Categorizer
+-----------------
+Classifies skills into taxonomy categories. A categorizer is built once per
+taxonomy version and memoizes the category of every skill it has seen, so
+repeated lookups are a single dict access.
+
+A skill's category is its declared taxonomy category when the skill (or an
+alias) is known, otherwise the first category whose keywords appear in it,
+otherwise "Other".
+"""
+
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from app.services.taxonomy import SkillTaxonomy, get_taxonomy
+
+OTHER = "Other"
+MAX_MEMO_SIZE = 50_000
+
+
+def _memo_key(skill: str) -> str:
+    return " ".join(skill.lower().split())
+
+
+class SkillCategorizer:
+    """Memoizing skill -> category classifier for one taxonomy version."""
+
+    def __init__(self, taxonomy: SkillTaxonomy):
+        self.version = taxonomy.version
+        self.categories: Tuple[str, ...] = taxonomy.categories + (OTHER,)
+        self._taxonomy = taxonomy
+        self._rules = taxonomy.category_rules
+        self._memo: Dict[str, str] = {}
+
+    def category_of(self, skill: str) -> str:
+        key = _memo_key(skill)
+        category = self._memo.get(key)
+        if category is None:
+            category = self._classify(key)
+            if len(self._memo) >= MAX_MEMO_SIZE:
+                self._memo.clear()
+            self._memo[key] = category
+        return category
+
+    def _classify(self, skill_lower: str) -> str:
+        declared = self._taxonomy.category_of(skill_lower)
+        if declared:
+            return declared
+        for category, keywords in self._rules:
+            if any(keyword in skill_lower for keyword in keywords):
+                return category
+        return OTHER
+
+    def categorize(self, skills: Iterable[str]) -> Tuple[Dict[str, List[str]], Dict[str, str]]:
+        """
+        Group skills by category.
+
+        Returns:
+            Tuple of (category -> skills, without empty categories,
+                      skill -> category reverse map)
+        """
+        grouped: Dict[str, List[str]] = {category: [] for category in self.categories}
+        skill_to_category: Dict[str, str] = {}
+        for skill in skills:
+            category = self.category_of(skill)
+            grouped.setdefault(category, []).append(skill)
+            skill_to_category[skill] = category
+        return {k: v for k, v in grouped.items() if v}, skill_to_category
+
+
+_categorizer: Optional[SkillCategorizer] = None
+_build_lock = threading.Lock()
+
+
+def get_categorizer() -> SkillCategorizer:
+    """Categorizer for the current taxonomy version (rebuilt when it changes)."""
+    global _categorizer
+    taxonomy = get_taxonomy()
+    categorizer = _categorizer
+    if categorizer is None or categorizer.version != taxonomy.version:
+        with _build_lock:
+            if _categorizer is None or _categorizer.version != taxonomy.version:
+                _categorizer = SkillCategorizer(taxonomy)
+            categorizer = _categorizer
+    return categorizer
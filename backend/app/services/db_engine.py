@@ -0,0 +1,127 @@
+"""
+Database Engine Profiles
+------------------------
+Engine settings for the database behind `SQLALCHEMY_DATABASE_URI`, picked
+by its dialect.
+
+- SQLite: every new connection is tuned through a connect event. WAL lets
+  readers run alongside the single writer instead of blocking on it,
+  `synchronous=NORMAL` is safe with WAL and syncs only at checkpoints, and
+  `busy_timeout` makes a worker wait for the write lock instead of failing
+  with "database is locked". The page cache and mmap sizes are per
+  connection.
+- PostgreSQL: an explicit `QueuePool` sized per worker process, with
+  pre-ping (dropped connections are replaced instead of failing the
+  request) and recycling (stay below server/proxy idle timeouts). Needs a
+  driver such as psycopg2 installed.
+
+Both can be applied without Flask (`engine_options()`, `install()`), which
+the concurrency benchmark uses.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import QueuePool
+
+
+@dataclass
+class SQLiteTuning:
+    journal_mode: str = "WAL"
+    synchronous: str = "NORMAL"
+    busy_timeout_ms: int = 5000
+    cache_size_kib: int = 64 * 1024
+    mmap_size: int = 256 * 1024 * 1024
+    temp_store: str = "MEMORY"
+
+    def pragmas(self, in_memory: bool = False) -> List[str]:
+        pragmas = [
+            f"PRAGMA busy_timeout = {int(self.busy_timeout_ms)}",
+            f"PRAGMA synchronous = {self.synchronous}",
+            # Negative cache_size is in KiB rather than pages
+            f"PRAGMA cache_size = -{int(self.cache_size_kib)}",
+            f"PRAGMA temp_store = {self.temp_store}",
+        ]
+        if not in_memory:
+            pragmas.insert(0, f"PRAGMA journal_mode = {self.journal_mode}")
+            pragmas.append(f"PRAGMA mmap_size = {int(self.mmap_size)}")
+        return pragmas
+
+
+@dataclass
+class PoolSettings:
+    size: int = 10
+    max_overflow: int = 20
+    timeout: float = 30.0
+    recycle: int = 1800
+    pre_ping: bool = True
+
+
+def normalize_url(uri: str) -> str:
+    """Accept the common `postgres://` spelling, which SQLAlchemy does not."""
+    if uri.startswith("postgres://"):
+        return "postgresql://" + uri[len("postgres://"):]
+    return uri
+
+
+def engine_options(uri: str, pool: Optional[PoolSettings] = None) -> Dict[str, Any]:
+    """`create_engine()` keyword arguments (SQLALCHEMY_ENGINE_OPTIONS) for the URI's dialect."""
+    backend = make_url(uri).get_backend_name()
+    if backend == "postgresql":
+        pool = pool or PoolSettings()
+        return {
+            "poolclass": QueuePool,
+            "pool_size": pool.size,
+            "max_overflow": pool.max_overflow,
+            "pool_timeout": pool.timeout,
+            "pool_recycle": pool.recycle,
+            "pool_pre_ping": pool.pre_ping,
+        }
+    return {}
+
+
+def install(engine, tuning: Optional[SQLiteTuning]) -> None:
+    """Apply `tuning` to every new connection of a SQLite engine (no-op otherwise or when None)."""
+    if engine.dialect.name != "sqlite" or tuning is None:
+        return
+    in_memory = make_url(str(engine.url)).database in (None, "", ":memory:")
+    pragmas = tuning.pragmas(in_memory=in_memory)
+
+    @event.listens_for(engine, "connect")
+    def _tune(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+
+# ------------------------------------------------------------------
+# 🔹 FLASK CONFIGURATION
+# ------------------------------------------------------------------
+def configure(app) -> None:
+    """Derive SQLALCHEMY_ENGINE_OPTIONS from the app config. Call before `db.init_app()`."""
+    config = app.config
+    config["SQLALCHEMY_DATABASE_URI"] = normalize_url(config["SQLALCHEMY_DATABASE_URI"])
+    options = engine_options(config["SQLALCHEMY_DATABASE_URI"], PoolSettings(
+        size=config["DB_POOL_SIZE"],
+        max_overflow=config["DB_MAX_OVERFLOW"],
+        timeout=config["DB_POOL_TIMEOUT"],
+        recycle=config["DB_POOL_RECYCLE"],
+    ))
+    config["SQLALCHEMY_ENGINE_OPTIONS"] = {**options, **config.get("SQLALCHEMY_ENGINE_OPTIONS", {})}
+
+
+def install_for_app(app, engine) -> None:
+    """Tune the app's SQLite engine from its config. Call right after `db.init_app()`."""
+    config = app.config
+    if not config["SQLITE_TUNING"]:
+        return
+    install(engine, SQLiteTuning(
+        busy_timeout_ms=config["SQLITE_BUSY_TIMEOUT_MS"],
+        cache_size_kib=config["SQLITE_CACHE_SIZE_KIB"],
+        mmap_size=config["SQLITE_MMAP_SIZE"],
+    ))
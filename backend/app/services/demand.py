@@ -0,0 +1,316 @@
+"""
+Skill Demand Aggregate
+----------------------
+Materialized counts of the postings requiring each skill - overall, per
+title and per location - in the `skill_demand` table, so every worker
+process serves /api/market/demand from the same numbers and a rebuild
+reaches all of them. The number of postings is kept there too, in the
+row keyed `TOTAL_KEY`, so the endpoint never counts the catalog.
+
+Counts change in the same transaction as the postings they describe.
+Writers take the demand of the postings they touch before and after the
+write (`track()`), or of postings they just inserted (`add_postings()`),
+and upsert the difference, so a write costs O(the postings it touches).
+
+- ORM writes are tracked by session hooks (`install()`).
+- Core bulk writers (importer, catalog dedupe) call the helpers on their
+  own connection.
+- `check()` compares the table with a GROUP BY over required_skill (and a
+  count of job_posting) and `rebuild()` recomputes it
+  (`flask rebuild-demand`).
+"""
+
+from collections import Counter
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from sqlalchemy import bindparam, delete, event, func, insert, literal, select, update
+from sqlalchemy.orm import Session
+
+from app.services.catalog import skill_demand_from_db
+
+SCOPE_ALL = "all"
+SCOPE_TOTAL = "total"
+TOTAL_KEY = (SCOPE_TOTAL, "", "")  # postings in the catalog, skills or not
+GROUPS = ("title", "location")
+CHUNK_SIZE = 500
+
+_installed = False
+_BEFORE_KEY = "demand_before"
+
+
+# ------------------------------------------------------------------
+# 🔹 INCREMENTAL UPDATES
+# ------------------------------------------------------------------
+def posting_demand(conn, posting_ids: Iterable[int]) -> Counter:
+    """Demand contributed by `posting_ids` as they are stored right now."""
+    from app.models import JobPosting, RequiredSkill
+
+    demand: Counter = Counter()
+    ids = sorted(set(posting_ids))
+    for i in range(0, len(ids), CHUNK_SIZE):
+        stored = conn.execute(
+            select(func.count(JobPosting.id)).where(JobPosting.id.in_(ids[i:i + CHUNK_SIZE]))
+        ).scalar_one()
+        if stored:
+            demand[TOTAL_KEY] += stored
+        rows = conn.execute(
+            select(RequiredSkill.job_posting_id, RequiredSkill.skill_name, JobPosting.title, JobPosting.location)
+            .outerjoin(JobPosting, JobPosting.id == RequiredSkill.job_posting_id)
+            .where(RequiredSkill.job_posting_id.in_(ids[i:i + CHUNK_SIZE]))
+            .distinct()
+        )
+        for _, skill_name, title, location in rows:
+            demand[(SCOPE_ALL, "", skill_name)] += 1
+            if title is not None:
+                demand[("title", title, skill_name)] += 1
+            if location is not None:
+                demand[("location", location, skill_name)] += 1
+    return demand
+
+
+def apply_delta(conn, delta: Counter) -> None:
+    """Add `delta` to the stored counts, dropping counts that reach zero."""
+    from app.models import SkillDemand
+
+    rows = [
+        {"scope": scope, "value": value, "skill_name": skill_name, "postings": postings}
+        for (scope, value, skill_name), postings in delta.items() if postings
+    ]
+    if not rows:
+        return
+    dialect = conn.dialect.name
+    if dialect in ("sqlite", "postgresql"):
+        if dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        stmt = dialect_insert(SkillDemand)
+        conn.execute(stmt.on_conflict_do_update(
+            index_elements=[SkillDemand.scope, SkillDemand.value, SkillDemand.skill_name],
+            set_={"postings": SkillDemand.postings + stmt.excluded.postings},
+        ), rows)
+    else:
+        for row in rows:
+            updated = conn.execute(
+                update(SkillDemand).where(_key_matches(SkillDemand, row))
+                .values(postings=SkillDemand.postings + row["postings"])
+            )
+            if not updated.rowcount:
+                conn.execute(insert(SkillDemand), row)
+
+    decreased = [
+        {"key_scope": row["scope"], "key_value": row["value"], "key_skill": row["skill_name"]}
+        for row in rows if row["postings"] < 0
+    ]
+    if decreased:
+        conn.execute(
+            delete(SkillDemand)
+            .where(SkillDemand.scope == bindparam("key_scope"))
+            .where(SkillDemand.value == bindparam("key_value"))
+            .where(SkillDemand.skill_name == bindparam("key_skill"))
+            .where(SkillDemand.postings <= 0),
+            decreased,
+        )
+
+
+def _key_matches(model, row):
+    return (model.scope == row["scope"]) & (model.value == row["value"]) & (model.skill_name == row["skill_name"])
+
+
+def add_postings(conn, posting_ids: Iterable[int]) -> None:
+    """Count postings that were just inserted on `conn`."""
+    apply_delta(conn, posting_demand(conn, posting_ids))
+
+
+@contextmanager
+def track(conn, posting_ids: Iterable[int]) -> Iterator[None]:
+    """Apply the demand change of existing `posting_ids` written (or deleted) inside the block."""
+    ids = set(posting_ids)
+    before = posting_demand(conn, ids)
+    yield
+    after = posting_demand(conn, ids)
+    after.subtract(before)
+    apply_delta(conn, after)
+
+
+# ------------------------------------------------------------------
+# 🔹 SESSION EVENTS
+# ------------------------------------------------------------------
+def _touched_postings(session: Session) -> Set[int]:
+    """Stored postings whose demand the pending changes of `session` may change."""
+    from sqlalchemy import inspect
+    from app.models import JobPosting, RequiredSkill
+
+    posting_ids: Set[int] = set()
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        if isinstance(obj, JobPosting):
+            if obj.id is not None:
+                posting_ids.add(obj.id)
+        elif isinstance(obj, RequiredSkill):
+            # A skill row moved to another posting changes both
+            history = inspect(obj).attrs.job_posting_id.history
+            posting_ids.update(pid for pid in (*history.unchanged, *history.added, *history.deleted)
+                               if pid is not None)
+            # Attached through the relationship, the id is only set by the flush
+            posting = obj.__dict__.get("job_posting")
+            if posting is not None and posting.id is not None:
+                posting_ids.add(posting.id)
+    return posting_ids
+
+
+def _before_flush(session: Session, flush_context, instances) -> None:
+    posting_ids = _touched_postings(session)
+    if posting_ids:
+        session.info[_BEFORE_KEY] = (posting_ids, posting_demand(session.connection(), posting_ids))
+
+
+def _after_flush(session: Session, flush_context) -> None:
+    from app.models import JobPosting
+
+    posting_ids, before = session.info.pop(_BEFORE_KEY, (set(), Counter()))
+    # Postings inserted by this flush have their ids now and had no demand before
+    posting_ids = posting_ids | {obj.id for obj in session.new if isinstance(obj, JobPosting)}
+    if not posting_ids:
+        return
+    conn = session.connection()
+    after = posting_demand(conn, posting_ids)
+    after.subtract(before)
+    apply_delta(conn, after)
+
+
+def install() -> None:
+    """Register the session event hooks (idempotent)."""
+    global _installed
+    if _installed:
+        return
+    event.listen(Session, "before_flush", _before_flush)
+    event.listen(Session, "after_flush", _after_flush)
+    _installed = True
+
+
+# ------------------------------------------------------------------
+# 🔹 REBUILD & CONSISTENCY CHECK
+# ------------------------------------------------------------------
+def rebuild() -> int:
+    """Recompute every count from required_skill in one transaction; returns the rows written."""
+    from app.models import db, JobPosting, RequiredSkill, SkillDemand
+
+    count = func.count(func.distinct(RequiredSkill.job_posting_id))
+    columns = ["scope", "value", "skill_name", "postings"]
+    with db.engine.begin() as conn:
+        conn.execute(delete(SkillDemand))
+        apply_delta(conn, Counter({TOTAL_KEY: conn.execute(select(func.count(JobPosting.id))).scalar_one()}))
+        conn.execute(insert(SkillDemand).from_select(columns, (
+            select(literal(SCOPE_ALL), literal(""), RequiredSkill.skill_name, count)
+            .group_by(RequiredSkill.skill_name)
+        )))
+        for by in GROUPS:
+            group = getattr(JobPosting, by)
+            conn.execute(insert(SkillDemand).from_select(columns, (
+                select(literal(by), group, RequiredSkill.skill_name, count)
+                .join(JobPosting, JobPosting.id == RequiredSkill.job_posting_id)
+                .where(group.isnot(None))
+                .group_by(group, RequiredSkill.skill_name)
+            )))
+        return conn.execute(select(func.count()).select_from(SkillDemand)).scalar_one()
+
+
+def ensure_built() -> None:
+    """Fill the table for a catalog that predates it (or its posting total); no-op once built."""
+    from app.models import db, JobPosting, SkillDemand
+
+    with db.engine.connect() as conn:
+        if conn.execute(select(SkillDemand.scope).where(SkillDemand.scope == SCOPE_TOTAL)).first() is not None:
+            return
+        if conn.execute(select(JobPosting.id).limit(1)).first() is None:
+            return
+    rebuild()
+
+
+def check() -> List[str]:
+    """
+    Compare the stored counts with a GROUP BY over the database.
+    Returns one message per mismatching count (empty when consistent).
+    """
+    from app.models import db, JobPosting, SkillDemand
+
+    stored: Dict[str, Dict[Optional[str], Dict[str, int]]] = {}
+    with db.engine.connect() as conn:
+        for scope, value, skill_name, postings in conn.execute(
+            select(SkillDemand.scope, SkillDemand.value, SkillDemand.skill_name, SkillDemand.postings)
+        ):
+            stored.setdefault(scope, {}).setdefault(None if scope == SCOPE_ALL else value, {})[skill_name] = postings
+        postings = conn.execute(select(func.count(JobPosting.id))).scalar_one()
+
+    mismatches = []
+    total = stored.get(SCOPE_TOTAL, {}).get("", {}).get("", 0)
+    if total != postings:
+        mismatches.append(f"total postings: table {total}, database {postings}")
+    for by in (None, *GROUPS):
+        expected = skill_demand_from_db(by)
+        actual = stored.get(by or SCOPE_ALL, {})
+        for value in set(expected) | set(actual):
+            wanted, have = expected.get(value, {}), actual.get(value, {})
+            for skill in set(wanted) | set(have):
+                if have.get(skill, 0) != wanted.get(skill, 0):
+                    scope = f"{by}={value!r}" if by else "overall"
+                    mismatches.append(
+                        f"{scope} {skill!r}: table {have.get(skill, 0)}, database {wanted.get(skill, 0)}"
+                    )
+    return mismatches
+
+
+# ------------------------------------------------------------------
+# 🔹 READS
+# ------------------------------------------------------------------
+def total_postings() -> int:
+    """Number of postings in the catalog, read from the table."""
+    from app.models import db, SkillDemand
+
+    scope, value, skill_name = TOTAL_KEY
+    postings = db.session.scalar(
+        select(SkillDemand.postings)
+        .where(SkillDemand.scope == scope, SkillDemand.value == value, SkillDemand.skill_name == skill_name)
+    )
+    return postings or 0
+
+
+def top_demand(by: Optional[str] = None, value: Optional[str] = None,
+               limit: Optional[int] = None) -> List[Tuple[str, int]]:
+    """
+    Skills ranked by the number of postings requiring them, overall or
+    within one title/location (`by` = "title" or "location").
+    """
+    from app.models import db, SkillDemand
+
+    query = (
+        select(SkillDemand.skill_name, SkillDemand.postings)
+        .where(SkillDemand.scope == (by or SCOPE_ALL), SkillDemand.value == (value if by else ""))
+        .order_by(SkillDemand.postings.desc(), SkillDemand.skill_name)
+        .limit(limit)
+    )
+    return [tuple(row) for row in db.session.execute(query)]
+
+
+def top_demand_by_group(by: str, limit: Optional[int] = None) -> Dict[str, List[Tuple[str, int]]]:
+    """`top_demand()` for every title or location at once."""
+    from app.models import db, SkillDemand
+
+    rank = func.row_number().over(
+        partition_by=SkillDemand.value,
+        order_by=(SkillDemand.postings.desc(), SkillDemand.skill_name),
+    ).label("rank")
+    ranked = (
+        select(SkillDemand.value, SkillDemand.skill_name, SkillDemand.postings, rank)
+        .where(SkillDemand.scope == by)
+        .subquery()
+    )
+    query = select(ranked.c.value, ranked.c.skill_name, ranked.c.postings).order_by(ranked.c.value, ranked.c.rank)
+    if limit is not None:
+        query = query.where(ranked.c.rank <= limit)
+
+    groups: Dict[str, List[Tuple[str, int]]] = {}
+    for value, skill_name, postings in db.session.execute(query):
+        groups.setdefault(value, []).append((skill_name, postings))
+    return groups
@@ -0,0 +1,371 @@
+"""
+Job Posting Importer
+--------------------
+Streams job postings from JSONL or CSV files into the database in constant
+memory: records are read lazily, processed in fixed-size batches (skill
+extraction over the batch's descriptions with nlp.pipe, then one bulk
+INSERT per table) and each batch is committed in its own transaction.
+Near-duplicates of stored postings (MinHash/LSH, see dedupe.py) are
+dropped or merged into the original before they are written.
+
+Record fields: title, description (required), company, location,
+salary_range (or salary_min/salary_max), requirements, skills. In CSV
+files the list fields are separated by ";" or "|". When skill extraction
+is on, skills found in the description are added to the listed ones.
+"""
+
+import csv
+import json
+import re
+import time
+from dataclasses import dataclass, field
+from itertools import islice
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from sqlalchemy import insert, update
+
+from app.services import catalog_events, dedupe, demand
+
+DEFAULT_BATCH_SIZE = 1000
+MAX_ERRORS_KEPT = 20
+SAMPLE_CATALOG_PATH = Path(__file__).resolve().parent.parent / "data" / "sample_jobs.jsonl"
+
+
+@dataclass
+class ImportStats:
+    """Running totals of an import, passed to the progress callback after every batch."""
+    read: int = 0
+    imported: int = 0
+    skipped: int = 0
+    duplicates: int = 0
+    batches: int = 0
+    started: float = field(default_factory=time.perf_counter)
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    @property
+    def rate(self) -> float:
+        """Imported rows per second."""
+        return self.imported / self.elapsed if self.elapsed else 0.0
+
+    def error(self, message: str) -> None:
+        self.skipped += 1
+        if len(self.errors) < MAX_ERRORS_KEPT:
+            self.errors.append(message)
+
+
+# ------------------------------------------------------------------
+# 🔹 READING
+# ------------------------------------------------------------------
+def _text(raw: Dict[str, Any], name: str) -> str:
+    value = raw.get(name)
+    if value is None:
+        return ""
+    if not isinstance(value, str):
+        raise ValueError(f"{name} must be a string")
+    return value.strip()
+
+
+def _split_list(raw: Dict[str, Any], name: str) -> List[str]:
+    value = raw.get(name)
+    if value is None:
+        return []
+    if isinstance(value, str):
+        separator = "|" if "|" in value else ";"
+        return [item.strip() for item in value.split(separator) if item.strip()]
+    if not isinstance(value, list):
+        raise ValueError(f"{name} must be a list or a string")
+    return [str(item).strip() for item in value if str(item).strip()]
+
+
+def parse_salary_range(salary_range: Optional[str]) -> Tuple[Optional[int], Optional[int]]:
+    """Bounds of a salary string like "Ksh.80,000 - Ksh.120,000" (None when absent)."""
+    amounts = [int(m.replace(",", "")) for m in re.findall(r"\d[\d,]*", salary_range or "")]
+    if not amounts:
+        return None, None
+    return min(amounts), max(amounts)
+
+
+def _optional_int(value: Any) -> Optional[int]:
+    if value in (None, ""):
+        return None
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        raise ValueError(f"invalid salary amount {value!r}")
+
+
+def normalize_record(raw: Dict[str, Any]) -> Dict[str, Any]:
+    """Validate one raw record and coerce it to the importer's fields."""
+    title = _text(raw, "title")
+    description = _text(raw, "description")
+    if not title or not description:
+        raise ValueError("title and description are required")
+    salary_range = _text(raw, "salary_range")
+    salary_min, salary_max = parse_salary_range(salary_range)
+    explicit_min, explicit_max = _optional_int(raw.get("salary_min")), _optional_int(raw.get("salary_max"))
+    return {
+        "title": title[:200],
+        "description": description,
+        "company": _text(raw, "company")[:200] or None,
+        "location": _text(raw, "location")[:200] or None,
+        "salary_range": salary_range[:100] or None,
+        "salary_min": salary_min if explicit_min is None else explicit_min,
+        "salary_max": salary_max if explicit_max is None else explicit_max,
+        "requirements": _split_list(raw, "requirements"),
+        "skills": _split_list(raw, "skills"),
+    }
+
+
+def iter_records(path: Path, stats: ImportStats) -> Iterator[Dict[str, Any]]:
+    """Lazily yield valid records from a .csv file, or any other file as JSON lines."""
+    path = Path(path)
+    with path.open(newline="", encoding="utf-8") as f:
+        if path.suffix.lower() == ".csv":
+            rows: Iterable[Tuple[int, Any]] = enumerate(csv.DictReader(f), start=2)
+        else:
+            rows = ((n, line) for n, line in enumerate(f, start=1) if line.strip())
+
+        for line_number, row in rows:
+            stats.read += 1
+            try:
+                raw = json.loads(row) if isinstance(row, str) else row
+                if not isinstance(raw, dict):
+                    raise ValueError("record is not an object")
+                yield normalize_record(raw)
+            except ValueError as e:
+                stats.error(f"{path.name}:{line_number}: {e}")
+
+
+def _batches(records: Iterable[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    iterator = iter(records)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+# ------------------------------------------------------------------
+# 🔹 WRITING
+# ------------------------------------------------------------------
+def _with_extracted_skills(batch: List[Dict[str, Any]]) -> None:
+    from app.services.nlp import extract_skills_batch
+
+    extracted = extract_skills_batch([record["description"] for record in batch])
+    for record, found in zip(batch, extracted):
+        merged = dict.fromkeys(record["skills"])
+        merged.update(dict.fromkeys(found["technical_skills"] + found["soft_skills"]))
+        record["skills"] = list(merged)
+
+
+def _with_signatures(batch: List[Dict[str, Any]]) -> None:
+    """Add the "minhash" signature and its "buckets" to every record."""
+    for record in batch:
+        sig = dedupe.signature(dedupe.posting_text(record["title"], record["company"], record["description"]))
+        record["minhash"] = sig
+        record["buckets"] = dedupe.band_keys(sig)
+
+
+def _split_duplicates(conn, batch: List[Dict[str, Any]], threshold: float):
+    """
+    Separate near-duplicates (of stored postings or of earlier records in
+    the batch) from new postings. Records need their signatures
+    (`_with_signatures()`); "minhash" is left serialized for the insert.
+
+    Returns:
+        Tuple of (new records, [(stored posting id or None, index into new records, duplicate record)])
+    """
+    finder = dedupe.DuplicateFinder(conn, threshold)
+    finder.prefetch(key for record in batch for key in record["buckets"])
+    fresh: List[Dict[str, Any]] = []
+    duplicates = []
+    for record in batch:
+        sig = record["minhash"]
+        match, _ = finder.find(sig, record["buckets"])
+        if match is None:
+            # Records of this batch are refs ("new", index into fresh)
+            finder.add(("new", len(fresh)), sig, record["buckets"])
+            fresh.append(record)
+        elif isinstance(match, tuple):
+            duplicates.append((None, match[1], record))
+        else:
+            duplicates.append((match, None, record))
+        record["minhash"] = dedupe.to_bytes(sig)
+    return fresh, duplicates
+
+
+def _insert_batch(
+    batch: List[Dict[str, Any]],
+    extract_skills: bool,
+    policy: str,
+    threshold: float,
+) -> Tuple[List[int], List[int], int]:
+    """
+    Insert one batch in its own transaction.
+
+    Returns:
+        Tuple of (new posting IDs, IDs of existing postings that absorbed
+        duplicates, number of duplicates dropped)
+    """
+    from app.models import db, JobPosting, RequiredSkill, PostingBucket
+
+    # CPU-bound work happens before the write transaction, which on SQLite
+    # holds the database lock. Skills are extracted for the whole batch
+    # since duplicates are only known once the buckets are read.
+    if extract_skills:
+        _with_extracted_skills(batch)
+    if policy != dedupe.DEDUPE_OFF:
+        _with_signatures(batch)
+
+    with db.engine.begin() as conn:
+        if policy == dedupe.DEDUPE_OFF:
+            fresh, duplicates = batch, []
+        else:
+            fresh, duplicates = _split_duplicates(conn, batch, threshold)
+
+        posting_ids: List[int] = []
+        if fresh:
+            posting_rows = [
+                {
+                    "title": record["title"],
+                    "description": record["description"],
+                    "company": record["company"],
+                    "location": record["location"],
+                    "salary_range": record["salary_range"],
+                    "salary_min": record["salary_min"],
+                    "salary_max": record["salary_max"],
+                    "requirements": json.dumps(record["requirements"]),
+                    "minhash": record.get("minhash"),
+                }
+                for record in fresh
+            ]
+            # executemany with RETURNING, ids come back in parameter order
+            result = conn.execute(
+                insert(JobPosting).returning(JobPosting.id, sort_by_parameter_order=True),
+                posting_rows,
+            )
+            posting_ids = list(result.scalars())
+            skill_rows = [
+                {"skill_name": skill[:100], "job_posting_id": posting_id}
+                for posting_id, record in zip(posting_ids, fresh)
+                for skill in dict.fromkeys(record["skills"])
+            ]
+            if skill_rows:
+                conn.execute(insert(RequiredSkill), skill_rows)
+            bucket_rows = [
+                {"bucket": key, "job_posting_id": posting_id}
+                for posting_id, record in zip(posting_ids, fresh)
+                for key in record.get("buckets", ())
+            ]
+            if bucket_rows:
+                conn.execute(insert(PostingBucket), bucket_rows)
+            demand.add_postings(conn, posting_ids)
+
+        # Duplicates only bump the original's repost count (and, when merging, add new skills)
+        originals: Dict[int, List[Dict[str, Any]]] = {}
+        for posting_id, pending, record in duplicates:
+            original = posting_id if posting_id is not None else posting_ids[pending]
+            originals.setdefault(original, []).append(record)
+        if originals:
+            conn.execute(
+                update(JobPosting)
+                .where(JobPosting.id == db.bindparam("posting_id"))
+                .values(duplicate_count=db.func.coalesce(JobPosting.duplicate_count, 0) + db.bindparam("reposts")),
+                [{"posting_id": pid, "reposts": len(records)} for pid, records in originals.items()],
+            )
+            if policy == dedupe.DEDUPE_MERGE:
+                with demand.track(conn, originals):
+                    _merge_skills(conn, originals)
+
+    return posting_ids, list(originals), len(duplicates)
+
+
+def _merge_skills(conn, originals: Dict[int, List[Dict[str, Any]]]) -> None:
+    from app.models import db, RequiredSkill
+
+    existing: Dict[int, set] = {pid: set() for pid in originals}
+    rows = conn.execute(
+        db.select(RequiredSkill.job_posting_id, RequiredSkill.skill_name)
+        .where(RequiredSkill.job_posting_id.in_(list(originals)))
+    )
+    for posting_id, skill_name in rows:
+        existing[posting_id].add(skill_name)
+    new_rows = []
+    for posting_id, records in originals.items():
+        for record in records:
+            for skill in record["skills"]:
+                if skill[:100] not in existing[posting_id]:
+                    existing[posting_id].add(skill[:100])
+                    new_rows.append({"skill_name": skill[:100], "job_posting_id": posting_id})
+    if new_rows:
+        conn.execute(insert(RequiredSkill), new_rows)
+
+
+def import_records(
+    records: Iterable[Dict[str, Any]],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    extract_skills: bool = True,
+    progress: Optional[Callable[[ImportStats], None]] = None,
+    stats: Optional[ImportStats] = None,
+    dedupe_policy: Optional[str] = None,
+    dedupe_threshold: Optional[float] = None,
+) -> ImportStats:
+    """
+    Import normalized records batch by batch. Each batch commits on its
+    own, so an interrupted import keeps every batch written before it.
+    Near-duplicates of stored postings are dropped per `dedupe_policy`
+    (DEDUPE_POLICY / DEDUPE_THRESHOLD config by default).
+    Requires an application context.
+    """
+    from flask import current_app
+
+    policy = dedupe_policy
+    if policy is None:
+        policy = current_app.config.get("DEDUPE_POLICY", dedupe.DEDUPE_SKIP)
+    threshold = dedupe_threshold
+    if threshold is None:
+        threshold = current_app.config.get("DEDUPE_THRESHOLD", dedupe.DEFAULT_THRESHOLD)
+    if policy not in dedupe.POLICIES:
+        raise ValueError(f"Unknown dedupe policy: {policy}")
+
+    stats = stats or ImportStats()
+    for batch in _batches(records, batch_size):
+        posting_ids, originals, duplicates = _insert_batch(batch, extract_skills, policy, threshold)
+        # Core inserts bypass the session events, so announce them here
+        catalog_events.notify(changed=posting_ids + originals)
+        stats.imported += len(posting_ids)
+        stats.duplicates += duplicates
+        stats.batches += 1
+        if progress:
+            progress(stats)
+    return stats
+
+
+def import_file(
+    path: Path,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    extract_skills: bool = True,
+    progress: Optional[Callable[[ImportStats], None]] = None,
+    dedupe_policy: Optional[str] = None,
+    dedupe_threshold: Optional[float] = None,
+) -> ImportStats:
+    """Stream a JSONL or CSV file of postings into the database."""
+    stats = ImportStats()
+    return import_records(iter_records(path, stats), batch_size, extract_skills, progress, stats,
+                          dedupe_policy, dedupe_threshold)
+
+
+def seed_catalog(path: Path = SAMPLE_CATALOG_PATH) -> Optional[ImportStats]:
+    """Load the sample postings into an empty catalog (no-op otherwise)."""
+    from app.models import db, JobPosting
+
+    with db.engine.connect() as conn:
+        if conn.execute(db.select(JobPosting.id).limit(1)).first() is not None:
+            return None
+    # The sample file lists its skills, so the NLP model is not needed
+    return import_file(path, extract_skills=False)
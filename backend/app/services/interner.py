@@ -0,0 +1,158 @@
+"""
+Skill Interning & Bitset Skill Sets
+-----------------------------------
+Maps canonical (normalized) skills to dense integer IDs and represents
+skill sets as Python int bitsets (bit i set <=> skill ID i present).
+Gap, overlap and coverage between a resume and any number of postings
+become bitwise AND/NOT plus a popcount.
+
+IDs are only ever appended, so bitsets built earlier stay valid.
+
+An interner resolves aliases with the taxonomy version it was created
+for, so its IDs never change meaning. `get_skill_interner()` hands out a
+fresh one when the taxonomy is reloaded, and the indexes built on an
+interner (market index, job matcher) rebuild themselves once their
+interner's version is no longer current.
+"""
+
+import threading
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from app.services.taxonomy import SkillTaxonomy, get_taxonomy, normalize_skill_name
+
+
+class SkillInterner:
+    """Dense integer IDs for normalized skill names (append-only, thread-safe)."""
+
+    def __init__(self, skills: Iterable[str] = (), taxonomy: Optional[SkillTaxonomy] = None):
+        self.taxonomy = taxonomy or get_taxonomy()
+        self.version = self.taxonomy.version
+        self._ids: Dict[str, int] = {}
+        self._names: List[str] = []  # display name of each ID
+        self._lock = threading.Lock()
+        for skill in skills:
+            self.intern(skill)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def _resolve(self, skill: str) -> Tuple[str, Optional[str]]:
+        normalized = normalize_skill_name(skill)
+        canonical = self.taxonomy.canonical_by_normalized.get(normalized)
+        return (normalize_skill_name(canonical), canonical) if canonical else (normalized, None)
+
+    def key(self, skill: str) -> str:
+        """
+        Interning key: the canonical taxonomy name when known, else the
+        normalized form. Two spellings are the same skill iff their keys
+        match, so comparisons need no ID (and intern nothing).
+        """
+        return self._resolve(skill)[0]
+
+    def intern(self, skill: str) -> int:
+        """Return the ID of `skill`, assigning the next free one if new."""
+        key, canonical = self._resolve(skill)
+        skill_id = self._ids.get(key)
+        if skill_id is not None:
+            return skill_id
+        with self._lock:
+            skill_id = self._ids.get(key)
+            if skill_id is None:
+                skill_id = len(self._names)
+                # Display the canonical taxonomy name, else the first seen spelling
+                self._names.append(canonical or skill)
+                self._ids[key] = skill_id
+        return skill_id
+
+    def lookup(self, skill: str) -> Optional[int]:
+        """ID of `skill` if it has been interned, without assigning one."""
+        return self._ids.get(self.key(skill))
+
+    def name(self, skill_id: int) -> str:
+        return self._names[skill_id]
+
+    # ------------------------------------------------------------------
+    # Bitsets
+    # ------------------------------------------------------------------
+    def to_bits(self, skills: Iterable[str], add: bool = True) -> int:
+        """
+        Bitset of `skills`. With `add=False`, unknown skills are ignored
+        instead of being interned (useful for untrusted input).
+        """
+        bits = 0
+        for skill in skills:
+            skill_id = self.intern(skill) if add else self.lookup(skill)
+            if skill_id is not None:
+                bits |= 1 << skill_id
+        return bits
+
+    def iter_ids(self, bits: int) -> Iterator[int]:
+        while bits:
+            low = bits & -bits
+            yield low.bit_length() - 1
+            bits ^= low
+
+    def to_names(self, bits: int) -> List[str]:
+        """Display names of the skills in `bits`, in ID order."""
+        return [self._names[i] for i in self.iter_ids(bits)]
+
+
+# ------------------------------------------------------------------
+# 🔹 BITSET OPERATIONS
+# ------------------------------------------------------------------
+def count(bits: int) -> int:
+    return bits.bit_count()
+
+
+def missing(user_bits: int, required_bits: int) -> int:
+    """Required skills the user lacks."""
+    return required_bits & ~user_bits
+
+
+def overlap(user_bits: int, required_bits: int) -> int:
+    """Required skills the user has."""
+    return required_bits & user_bits
+
+
+def coverage(user_bits: int, required_bits: int) -> float:
+    """Share of required skills the user has (1.0 when nothing is required)."""
+    required = required_bits.bit_count()
+    if not required:
+        return 1.0
+    return (required_bits & user_bits).bit_count() / required
+
+
+def gap_report(user_bits: int, jobs: Iterable[Tuple[str, int]]) -> Iterator[Tuple[str, int, int, float]]:
+    """
+    Score one skill set against many postings.
+
+    Yields:
+        (job key, missing bits, overlap bits, coverage) per posting
+    """
+    for job_key, required_bits in jobs:
+        yield (
+            job_key,
+            required_bits & ~user_bits,
+            required_bits & user_bits,
+            coverage(user_bits, required_bits),
+        )
+
+
+# ------------------------------------------------------------------
+# 🔹 SHARED INTERNER (one per taxonomy version)
+# ------------------------------------------------------------------
+_skill_interner: Optional[SkillInterner] = None
+_build_lock = threading.Lock()
+
+
+def get_skill_interner() -> SkillInterner:
+    """Process-wide interner for the current taxonomy version (replaced when it changes)."""
+    global _skill_interner
+    taxonomy = get_taxonomy()
+    interner = _skill_interner
+    if interner is None or interner.version != taxonomy.version:
+        with _build_lock:
+            if _skill_interner is None or _skill_interner.version != taxonomy.version:
+                _skill_interner = SkillInterner(taxonomy=taxonomy)
+            interner = _skill_interner
+    return interner
@@ -0,0 +1,245 @@
+"""
+Job Matching Engine
+-------------------
+Ranks job postings against a user's skill set with an inverted index
+(skill ID -> posting IDs) built from `RequiredSkill`. A query only touches
+postings that share at least one skill with the user: their scores are
+accumulated with numpy over the matching posting lists and the top-k are
+selected with a partial sort.
+
+Score of a posting, in [0, 1]:
+    0.5 * coverage          share of the posting's required skills the user has
+  + 0.5 * weighted overlap  IDF-weighted share of the user's skills the posting uses,
+                            so rare shared skills count more than ubiquitous ones
+"""
+
+import math
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+from app.services import catalog_events
+from app.services.catalog import iter_posting_skills
+from app.services.interner import SkillInterner, get_skill_interner
+from app.services.taxonomy import get_taxonomy
+
+COVERAGE_WEIGHT = 0.5
+OVERLAP_WEIGHT = 0.5
+DEFAULT_TOP_K = 10
+
+
+@dataclass
+class JobMatch:
+    """One ranked posting."""
+    posting_id: int
+    title: str
+    score: float
+    coverage: float
+    matched_skills: List[str] = field(default_factory=list)
+    missing_skills: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "job_id": self.posting_id,
+            "title": self.title,
+            "score": round(self.score, 4),
+            "coverage": round(self.coverage * 100, 1),
+            "matched_skills": self.matched_skills,
+            "missing_skills": self.missing_skills,
+        }
+
+
+class JobMatcher:
+    """Inverted skill index over postings with top-k scoring."""
+
+    def __init__(self, interner: Optional[SkillInterner] = None):
+        self.interner = interner or get_skill_interner()
+        self._lock = threading.Lock()
+        self._postings: Dict[int, Tuple[str, FrozenSet[int]]] = {}
+        # Postings live in dense slots so scores accumulate into flat arrays
+        self._slots: Dict[int, int] = {}
+        self._slot_ids: List[Optional[int]] = []
+        self._free_slots: List[int] = []
+        self._sizes = np.zeros(0, dtype=np.int32)
+        self._inverted: Dict[int, Set[int]] = {}  # skill ID -> slots
+        self._arrays: Dict[int, np.ndarray] = {}  # frozen copies of _inverted, built on demand
+
+    def __len__(self) -> int:
+        return len(self._postings)
+
+    # ------------------------------------------------------------------
+    # Index maintenance
+    # ------------------------------------------------------------------
+    def add_posting(self, posting_id: int, title: str, skills: Iterable[str]) -> None:
+        """Add or replace a posting."""
+        skill_ids = frozenset(self.interner.intern(s) for s in skills)
+        with self._lock:
+            self._remove(posting_id)
+            slot = self._free_slots.pop() if self._free_slots else self._new_slot()
+            self._slots[posting_id] = slot
+            self._slot_ids[slot] = posting_id
+            self._sizes[slot] = len(skill_ids)
+            self._postings[posting_id] = (title, skill_ids)
+            for skill_id in skill_ids:
+                self._inverted.setdefault(skill_id, set()).add(slot)
+                self._arrays.pop(skill_id, None)
+
+    def remove_posting(self, posting_id: int) -> None:
+        with self._lock:
+            self._remove(posting_id)
+
+    def _new_slot(self) -> int:
+        slot = len(self._slot_ids)
+        self._slot_ids.append(None)
+        if slot >= len(self._sizes):
+            grown = np.zeros(max(1024, 2 * len(self._sizes)), dtype=np.int32)
+            grown[:len(self._sizes)] = self._sizes
+            self._sizes = grown
+        return slot
+
+    def _remove(self, posting_id: int) -> None:
+        entry = self._postings.pop(posting_id, None)
+        if entry is None:
+            return
+        slot = self._slots.pop(posting_id)
+        self._slot_ids[slot] = None
+        self._sizes[slot] = 0
+        self._free_slots.append(slot)
+        for skill_id in entry[1]:
+            self._arrays.pop(skill_id, None)
+            holders = self._inverted.get(skill_id)
+            if holders is not None:
+                holders.discard(slot)
+                if not holders:
+                    del self._inverted[skill_id]
+
+    def _holders(self, skill_id: int) -> np.ndarray:
+        array = self._arrays.get(skill_id)
+        if array is None:
+            array = np.fromiter(self._inverted.get(skill_id, ()), dtype=np.int64)
+            self._arrays[skill_id] = array
+        return array
+
+    # ------------------------------------------------------------------
+    # Scoring
+    # ------------------------------------------------------------------
+    def _idf(self, skill_id: int, total: int) -> float:
+        df = len(self._inverted.get(skill_id, ()))
+        return math.log((total + 1) / (df + 1)) + 1.0
+
+    def top_k(self, skills: Iterable[str], k: int = DEFAULT_TOP_K, min_score: float = 0.0) -> List[JobMatch]:
+        """
+        Best `k` postings for `skills`, highest score first.
+        Unknown skills cannot match any posting and are ignored.
+        """
+        user_ids = {i for i in (self.interner.lookup(s) for s in skills) if i is not None}
+        if not user_ids or k <= 0:
+            return []
+
+        with self._lock:
+            total = len(self._postings)
+            skill_ids = sorted(user_ids)
+            weights = np.array([self._idf(i, total) for i in skill_ids])
+            holders = [self._holders(i) for i in skill_ids]
+            slots = len(self._slot_ids)
+            sizes = self._sizes[:slots]
+
+            # Only slots listed under the user's skills are ever touched
+            hits = np.concatenate(holders)
+            if not len(hits):
+                return []
+            shared = np.bincount(hits, minlength=slots)
+            overlap_weight = np.bincount(
+                hits, weights=np.repeat(weights, [len(h) for h in holders]), minlength=slots
+            )
+            candidates = np.flatnonzero(shared)
+            coverage = shared[candidates] / sizes[candidates]
+            scores = COVERAGE_WEIGHT * coverage + OVERLAP_WEIGHT * overlap_weight[candidates] / weights.sum()
+
+            keep = scores >= min_score
+            candidates, coverage, scores = candidates[keep], coverage[keep], scores[keep]
+            if len(candidates) > k:
+                # Keep every posting tied with the k-th score so the tie-break below decides
+                cutoff = np.partition(scores, len(scores) - k)[len(scores) - k]
+                top = scores >= cutoff
+                candidates, coverage, scores = candidates[top], coverage[top], scores[top]
+
+            posting_ids = [self._slot_ids[slot] for slot in candidates]
+            best = sorted(
+                zip(scores.tolist(), coverage.tolist(), posting_ids),
+                key=lambda item: (-item[0], -item[1], item[2]),
+            )[:k]
+            entries = [(s, c, pid, self._postings[pid]) for s, c, pid in best]
+
+        return [
+            JobMatch(
+                posting_id=pid,
+                title=title,
+                score=score,
+                coverage=coverage,
+                matched_skills=[self.interner.name(i) for i in sorted(required & user_ids)],
+                missing_skills=[self.interner.name(i) for i in sorted(required - user_ids)],
+            )
+            for score, coverage, pid, (title, required) in entries
+        ]
+
+    # ------------------------------------------------------------------
+    # Database sync
+    # ------------------------------------------------------------------
+    def load_from_db(self, posting_ids: Optional[Iterable[int]] = None) -> None:
+        """
+        (Re)load postings and their required skills from the database,
+        all of them or only `posting_ids`. Requested IDs that no longer
+        exist are dropped from the index.
+        """
+        if posting_ids is not None:
+            posting_ids = set(posting_ids)
+        found = set()
+        for posting in iter_posting_skills(posting_ids):
+            self.add_posting(posting.id, posting.title, posting.skills)
+            found.add(posting.id)
+        for posting_id in set(posting_ids or ()) - found:
+            self.remove_posting(posting_id)
+
+    def on_catalog_change(self, changed: Set[int], deleted: Set[int]) -> None:
+        for posting_id in deleted:
+            self.remove_posting(posting_id)
+        if changed:
+            self.load_from_db(changed)
+
+
+# ------------------------------------------------------------------
+# 🔹 SHARED MATCHER
+# ------------------------------------------------------------------
+_job_matcher: Optional[JobMatcher] = None
+_build_lock = threading.Lock()
+
+
+def get_job_matcher() -> JobMatcher:
+    """
+    Process-wide matcher, loaded from the database on first use and kept
+    in sync after. Rebuilt when the taxonomy is reloaded, since its skill
+    IDs resolve aliases with the old version; the old matcher keeps
+    serving while one thread rebuilds.
+    """
+    global _job_matcher
+    version = get_taxonomy().version
+    matcher = _job_matcher
+    if matcher is None or matcher.interner.version != version:
+        if not _build_lock.acquire(blocking=matcher is None):
+            return matcher
+        try:
+            current = _job_matcher
+            if current is None or current.interner.version != version:
+                built = JobMatcher()
+                built.load_from_db()
+                catalog_events.subscribe(built.on_catalog_change)
+                if current is not None:
+                    catalog_events.unsubscribe(current.on_catalog_change)
+                _job_matcher = built
+            matcher = _job_matcher
+        finally:
+            _build_lock.release()
+    return matcher
@@ -0,0 +1,262 @@
+"""
+Market Skill Index
+------------------
+Holds the job catalog in memory with the lookups gap analysis needs
+precomputed: title -> skills (also as an interned skill bitset), skill ->
+jobs and the union of all market skills. Postings are added, updated and
+removed incrementally, so the request path only does dictionary lookups.
+
+Writers serialize on a lock and publish fresh values; readers only ever
+see complete ones. Views that cost O(skills) to build - a title's skill
+tuple and the skill union - are built on first read after a write that
+changed them (under the lock) and cached until the next one. Title
+bitsets are updated bit by bit as skills enter or leave a title, so
+adding a posting stays O(its skills).
+
+Skill IDs and bitsets come from the index's interner and so depend on
+the taxonomy version it resolves aliases with. `get_market_index()`
+rebuilds the index when the taxonomy is reloaded.
+"""
+
+import threading
+from collections import Counter
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Sequence, Set, Tuple
+
+from app.services import catalog_events
+from app.services.catalog import PostingSkills, iter_posting_skills
+from app.services.interner import SkillInterner, get_skill_interner
+from app.services.taxonomy import get_taxonomy
+
+
+class MarketIndex:
+    """Incrementally maintained title/skill index over job postings."""
+
+    def __init__(self, jobs: Iterable[Tuple[Hashable, Dict[str, Any]]] = (),
+                 interner: Optional[SkillInterner] = None):
+        self.interner = interner or get_skill_interner()
+        self._lock = threading.Lock()
+        self._jobs: Dict[Hashable, Dict[str, Any]] = {}
+        self._skill_jobs: Dict[str, Set[Hashable]] = {}
+        self._title_jobs: Dict[str, Set[Hashable]] = {}
+        self._title_skill_counts: Dict[str, Counter] = {}
+        # title -> skill ID -> number of the title's skills interned to it
+        # (aliases share an ID, so a bit is only cleared when all are gone)
+        self._title_id_counts: Dict[str, Counter] = {}
+        self._skill_ids: Dict[str, int] = {}
+        # Published, read-only views (None: stale, rebuilt on next read)
+        self._title_skills: Dict[str, Optional[Tuple[str, ...]]] = {}
+        self._title_bits: Dict[str, int] = {}
+        self._all_skills: Optional[Tuple[str, ...]] = ()
+        for key, job in jobs:
+            self.add_job(key, job)
+
+    # ------------------------------------------------------------------
+    # Reads (lock-free)
+    # ------------------------------------------------------------------
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    @property
+    def all_skills(self) -> Tuple[str, ...]:
+        """Union of the skills of every posting."""
+        skills = self._all_skills
+        if skills is None:
+            with self._lock:
+                skills = self._all_skills
+                if skills is None:
+                    skills = self._all_skills = tuple(self._skill_jobs)
+        return skills
+
+    @property
+    def titles(self) -> List[str]:
+        return list(self._title_skills)
+
+    def job(self, key: Hashable) -> Optional[Dict[str, Any]]:
+        return self._jobs.get(key)
+
+    def jobs(self) -> List[Dict[str, Any]]:
+        return list(self._jobs.values())
+
+    def skills_for_title(self, title: str) -> Tuple[str, ...]:
+        skills = self._title_skills.get(title, ())
+        if skills is None:
+            with self._lock:
+                skills = self._title_skills.get(title, ())
+                if skills is None:
+                    skills = self._title_skills[title] = tuple(self._title_skill_counts[title])
+        return skills
+
+    def title_bits(self, title: str) -> Optional[int]:
+        """Interned skill bitset of `title` (None for an unknown title)."""
+        return self._title_bits.get(title)
+
+    def skills_for_titles(self, titles: Optional[Sequence[str]] = None) -> List[str]:
+        """
+        Union of the skills required by postings with any of `titles`
+        (every posting when `titles` is empty).
+        """
+        if not titles:
+            return list(self.all_skills)
+        if len(titles) == 1:
+            return list(self.skills_for_title(titles[0]))
+        union: Dict[str, None] = {}
+        for title in titles:
+            union.update(dict.fromkeys(self.skills_for_title(title)))
+        return list(union)
+
+    def jobs_with_skill(self, skill: str) -> Set[Hashable]:
+        """Keys of the postings that require `skill`."""
+        return set(self._skill_jobs.get(skill, ()))
+
+    def demand(self, skill: str) -> int:
+        """Number of postings that require `skill`."""
+        return len(self._skill_jobs.get(skill, ()))
+
+    # ------------------------------------------------------------------
+    # Incremental updates
+    # ------------------------------------------------------------------
+    def add_job(self, key: Hashable, job: Dict[str, Any]) -> None:
+        """Add or replace the posting stored under `key`."""
+        with self._lock:
+            changed_titles = self._remove(key)
+            title = job["title"]
+            title_changed = title not in self._title_skill_counts
+            skills = list(dict.fromkeys(job.get("skills", [])))
+            self._jobs[key] = job
+            self._title_jobs.setdefault(title, set()).add(key)
+            counts = self._title_skill_counts.setdefault(title, Counter())
+            id_counts = self._title_id_counts.setdefault(title, Counter())
+            bits = self._title_bits.get(title, 0)
+            for skill in skills:
+                holders = self._skill_jobs.get(skill)
+                if holders is None:
+                    holders = self._skill_jobs[skill] = set()
+                    self._all_skills = None
+                holders.add(key)
+                if not counts[skill]:
+                    title_changed = True
+                    skill_id = self._skill_id(skill)
+                    if not id_counts[skill_id]:
+                        bits |= 1 << skill_id
+                    id_counts[skill_id] += 1
+                counts[skill] += 1
+            self._title_bits[title] = bits
+            if title_changed:
+                changed_titles.add(title)
+            self._publish(changed_titles)
+
+    update_job = add_job
+
+    def remove_job(self, key: Hashable) -> None:
+        with self._lock:
+            changed_titles = self._remove(key)
+            if changed_titles:
+                self._publish(changed_titles)
+
+    def on_catalog_change(self, changed: Set[int], deleted: Set[int]) -> None:
+        """Apply committed job posting changes (keys are posting IDs)."""
+        for posting_id in deleted:
+            self.remove_job(posting_id)
+        if changed:
+            found = set()
+            for posting in iter_posting_skills(changed):
+                self.add_job(posting.id, _job_entry(posting))
+                found.add(posting.id)
+            for posting_id in changed - found:
+                self.remove_job(posting_id)
+
+    def _remove(self, key: Hashable) -> Set[str]:
+        """Drop `key` from the internal maps; returns the titles whose skill set changed."""
+        job = self._jobs.pop(key, None)
+        if job is None:
+            return set()
+        title = job["title"]
+        counts = self._title_skill_counts[title]
+        id_counts = self._title_id_counts[title]
+        bits = self._title_bits[title]
+        title_changed = False
+        for skill in dict.fromkeys(job.get("skills", [])):
+            holders = self._skill_jobs[skill]
+            holders.discard(key)
+            if not holders:
+                del self._skill_jobs[skill]
+                self._all_skills = None
+            counts[skill] -= 1
+            if counts[skill] <= 0:
+                del counts[skill]
+                title_changed = True
+                skill_id = self._skill_ids[skill]
+                id_counts[skill_id] -= 1
+                if id_counts[skill_id] <= 0:
+                    del id_counts[skill_id]
+                    bits &= ~(1 << skill_id)
+        title_jobs = self._title_jobs[title]
+        title_jobs.discard(key)
+        if title_jobs:
+            self._title_bits[title] = bits
+        else:
+            del self._title_jobs[title]
+            del self._title_skill_counts[title]
+            del self._title_id_counts[title]
+            del self._title_bits[title]
+            title_changed = True
+        return {title} if title_changed else set()
+
+    def _skill_id(self, skill: str) -> int:
+        """Interned ID of `skill`, interned once per distinct spelling."""
+        skill_id = self._skill_ids.get(skill)
+        if skill_id is None:
+            skill_id = self._skill_ids[skill] = self.interner.intern(skill)
+        return skill_id
+
+    def _publish(self, titles: Iterable[str]) -> None:
+        """Mark the skill tuples of `titles`, whose skill sets changed, for rebuilding."""
+        for title in titles:
+            if title in self._title_skill_counts:
+                self._title_skills[title] = None
+            else:
+                self._title_skills.pop(title, None)
+
+
+# ------------------------------------------------------------------
+# 🔹 SHARED INDEX
+# ------------------------------------------------------------------
+_market_index: Optional[MarketIndex] = None
+_build_lock = threading.Lock()
+
+
+def _job_entry(posting: PostingSkills) -> Dict[str, Any]:
+    return {"title": posting.title, "location": posting.location, "skills": posting.skills}
+
+
+def build_market_index() -> MarketIndex:
+    """Build an index over the job postings in the database, keyed by posting ID."""
+    return MarketIndex((posting.id, _job_entry(posting)) for posting in iter_posting_skills())
+
+
+def get_market_index() -> MarketIndex:
+    """
+    Process-wide market index, built on first use and kept in sync after.
+    Rebuilt when the taxonomy is reloaded, since its cached skill IDs and
+    title bitsets resolve aliases with the old version; the old index
+    keeps serving while one thread rebuilds.
+    """
+    global _market_index
+    version = get_taxonomy().version
+    index = _market_index
+    if index is None or index.interner.version != version:
+        if not _build_lock.acquire(blocking=index is None):
+            return index
+        try:
+            current = _market_index
+            if current is None or current.interner.version != version:
+                built = build_market_index()
+                catalog_events.subscribe(built.on_catalog_change)
+                if current is not None:
+                    catalog_events.unsubscribe(current.on_catalog_change)
+                _market_index = built
+            index = _market_index
+        finally:
+            _build_lock.release()
+    return index
+
@@ -9,33 +9,29 @@ Author: Dr. John | SkillBridge AI
 """
 
 import re
-import spacy
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Tuple, Iterable, Iterator, Union
 from collections import Counter
 
-# Load spaCy model once at module level for performance
-nlp = spacy.load("en_core_web_sm")
+from app.services.cache import analysis_cache
+from app.services.nlp_registry import TASK_COMPONENTS, get_model, get_pipeline, warmup as warmup_models
+from app.services.pipeline import ResumePipeline, Stage
+from app.services.skill_matcher import SkillMatcher, get_compiled_matcher
+from app.services.taxonomy import SkillTaxonomy, get_taxonomy
+
+# The spaCy model is loaded lazily on first use by the shared registry
+# (app.services.nlp_registry); `nlp.nlp` still resolves to it.
+
+# Defaults for the batch (nlp.pipe) entry points
+DEFAULT_BATCH_SIZE = 256
+DEFAULT_N_PROCESS = 1
 
 # ------------------------------------------------------------------
-# 🔹 SKILL TAXONOMY (can be moved to a JSON or DB in production)
+# 🔹 SKILL TAXONOMY
 # ------------------------------------------------------------------
-TECHNICAL_SKILLS = [
-    "Python", "Java", "JavaScript", "TypeScript", "C++", "C#", "SQL", "NoSQL",
-    "Flask", "Django", "FastAPI", "React", "Next.js", "Node.js", "Angular", "Vue",
-    "HTML", "CSS", "Bootstrap", "Tailwind", "Git", "GitHub", "Linux", "Docker",
-    "Kubernetes", "TensorFlow", "PyTorch", "Pandas", "NumPy", "Matplotlib",
-    "Data Science", "Machine Learning", "Deep Learning", "Data Visualization",
-    "PostgreSQL", "MongoDB", "Redis", "AWS", "Azure", "Google Cloud",
-    "CI/CD", "REST API", "GraphQL", "Figma", "Redux", "JIRA"
-]
-
-SOFT_SKILLS = [
-    "Communication", "Leadership", "Problem Solving", "Creativity",
-    "Teamwork", "Critical Thinking", "Adaptability", "Collaboration",
-    "Decision Making", "Empathy", "Time Management", "Work Ethic",
-    "Attention to Detail", "Emotional Intelligence", "Conflict Resolution",
-    "Negotiation", "Flexibility", "Self Motivation"
-]
+# Technical and soft skills, aliases and categories live in the versioned
+# data file app/data/skill_taxonomy.json, indexed by app.services.taxonomy.
+# TECHNICAL_SKILLS, SOFT_SKILLS and TAXONOMY_VERSION remain available as
+# module attributes that always reflect the current taxonomy.
 
 # ------------------------------------------------------------------
 # 🔹 TEXT PREPROCESSING
@@ -55,7 +51,11 @@ def extract_entities(text: str) -> List[Dict[str, Any]]:
     """
     Extract named entities (like organizations, skills, locations) using spaCy.
     """
-    doc = nlp(text)
+    return entities_from_doc(get_pipeline("entities")(text))
+
+
+def entities_from_doc(doc) -> List[Dict[str, Any]]:
+    """Collect the relevant named entities from an already parsed Doc."""
     entities = [
         {"text": ent.text, "label": ent.label_}
         for ent in doc.ents
@@ -66,40 +66,79 @@ def extract_entities(text: str) -> List[Dict[str, Any]]:
 # ------------------------------------------------------------------
 # 🔹 SKILL EXTRACTION ENGINE
 # ------------------------------------------------------------------
+def get_skill_matcher(taxonomy: SkillTaxonomy = None) -> SkillMatcher:
+    """Return the skill matcher compiled for the (current) taxonomy version."""
+    taxonomy = taxonomy or get_taxonomy()
+    return get_compiled_matcher(
+        taxonomy.version,
+        lambda: SkillMatcher(
+            get_model(),
+            taxonomy.technical,
+            taxonomy.soft,
+            normalize=clean_text,
+            version=taxonomy.version,
+            aliases=taxonomy.aliases,
+        ),
+    )
+
+
 def extract_skills(text: str) -> Dict[str, List[str]]:
     """
-    Extract both technical and soft skills using a hybrid of keyword, 
-    pattern, and NLP-based extraction.
+    Extract both technical and soft skills by running the compiled
+    taxonomy matcher over the tokenized, cleaned text.
     Returns structured dict of technical & soft skills.
     """
-    cleaned = clean_text(text)
-    doc = nlp(cleaned)
+    return _match_skills(clean_text(text))
 
-    found_technical = set()
-    found_soft = set()
 
-    # Token & phrase matching
-    for token in doc:
-        token_text = token.text.lower()
-        for skill in TECHNICAL_SKILLS:
-            if skill.lower() == token_text:
-                found_technical.add(skill)
-        for skill in SOFT_SKILLS:
-            if skill.lower() == token_text:
-                found_soft.add(skill)
+def _match_skills(cleaned: str, taxonomy: SkillTaxonomy = None) -> Dict[str, List[str]]:
+    doc = get_pipeline("tokenize").make_doc(cleaned)  # matching only needs tokens
+    return get_skill_matcher(taxonomy)(doc)
 
-    # Phrase-based (multiword skills)
-    for skill in TECHNICAL_SKILLS + SOFT_SKILLS:
-        if " " in skill and skill.lower() in cleaned:
-            if skill in TECHNICAL_SKILLS:
-                found_technical.add(skill)
-            else:
-                found_soft.add(skill)
 
-    return {
-        "technical_skills": sorted(found_technical),
-        "soft_skills": sorted(found_soft),
-    }
+def extract_skills_cached(text: str) -> Dict[str, List[str]]:
+    """
+    `extract_skills` through the shared analysis cache, keyed by the
+    cleaned text and the taxonomy version. Treat the result as read-only.
+    """
+    taxonomy = get_taxonomy()
+    return analysis_cache.get_or_compute(
+        "skills",
+        clean_text(text),
+        taxonomy.version,
+        lambda cleaned: _match_skills(cleaned, taxonomy),
+    )
+
+
+def iter_extract_skills(
+    texts: Iterable[str],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    n_process: int = DEFAULT_N_PROCESS,
+) -> Iterator[Dict[str, List[str]]]:
+    """
+    Stream skill extraction over many texts, yielding one result per text
+    in input order. Texts are consumed lazily, so memory stays flat.
+    """
+    matcher = get_skill_matcher()
+    cleaned = (clean_text(text) for text in texts)
+    # Matching only needs tokens, so every pipeline component is disabled
+    docs = get_pipeline("tokenize").pipe(cleaned, batch_size=batch_size, n_process=n_process)
+    for doc in docs:
+        yield matcher(doc)
+
+
+def extract_skills_batch(
+    texts: Iterable[str],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    n_process: int = DEFAULT_N_PROCESS,
+    stream: bool = False,
+) -> Union[List[Dict[str, List[str]]], Iterator[Dict[str, List[str]]]]:
+    """
+    Batched `extract_skills` built on nlp.pipe.
+    Returns a list of results in input order, or a generator when `stream` is set.
+    """
+    results = iter_extract_skills(texts, batch_size=batch_size, n_process=n_process)
+    return results if stream else list(results)
 
 # ------------------------------------------------------------------
 # 🔹 KEYWORD & TOPIC MINING
@@ -108,7 +147,11 @@ def extract_keywords(text: str, top_n: int = 10) -> List[str]:
     """
     Extract top recurring noun-based keywords for resume/topic summarization.
     """
-    doc = nlp(text)
+    return keywords_from_doc(get_pipeline("keywords")(text), top_n=top_n)
+
+
+def keywords_from_doc(doc, top_n: int = 10) -> List[str]:
+    """Rank noun-chunk keywords of an already parsed Doc."""
     freq = Counter(
         chunk.text.lower().strip()
         for chunk in doc.noun_chunks
@@ -140,24 +183,86 @@ def recommend_path(technical_skills: List[str]) -> str:
 # ------------------------------------------------------------------
 # 🔹 MASTER PIPELINE FUNCTION
 # ------------------------------------------------------------------
-def analyze_resume(text: str) -> Dict[str, Any]:
+# Each stage reads the shared Doc and declares the spaCy components it needs
+ENTITY_STAGE = Stage(
+    "entities",
+    lambda doc, result: {"entities": entities_from_doc(doc)},
+    components=tuple(TASK_COMPONENTS["entities"]),
+)
+SKILL_STAGE = Stage(
+    "skills",
+    lambda doc, result: get_skill_matcher()(doc),  # tokens only
+)
+KEYWORD_STAGE = Stage(
+    "keywords",
+    lambda doc, result: {"keywords": keywords_from_doc(doc)},
+    components=tuple(TASK_COMPONENTS["keywords"]),  # noun_chunks
+)
+PATH_STAGE = Stage(
+    "path",
+    lambda doc, result: {"recommended_path": recommend_path(result.get("technical_skills", []))},
+)
+
+resume_pipeline = ResumePipeline(
+    [ENTITY_STAGE, SKILL_STAGE, KEYWORD_STAGE, PATH_STAGE],
+    preprocess=clean_text,
+)
+
+
+def analyze_resume(text: str, debug: bool = False) -> Dict[str, Any]:
     """
     Full pipeline to extract skills, entities, keywords, and recommendations.
+    The text is cleaned and parsed once; set `debug` for per-stage timings.
     Ideal for /api/recommendation endpoint.
     """
-    cleaned = clean_text(text)
-    entities = extract_entities(cleaned)
-    skills = extract_skills(cleaned)
-    keywords = extract_keywords(cleaned)
-    recommended_path = recommend_path(skills["technical_skills"])
-
-    return {
-        "entities": entities,
-        "technical_skills": skills["technical_skills"],
-        "soft_skills": skills["soft_skills"],
-        "keywords": keywords,
-        "recommended_path": recommended_path,
-    }
+    return resume_pipeline.run(text, debug=debug)
+
+
+def iter_analyze_resume(
+    texts: Iterable[str],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    n_process: int = DEFAULT_N_PROCESS,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream `analyze_resume` over many texts, yielding one result per text
+    in input order. Each text is parsed once by nlp.pipe.
+    """
+    return resume_pipeline.pipe(texts, batch_size=batch_size, n_process=n_process)
+
+
+def analyze_resume_batch(
+    texts: Iterable[str],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    n_process: int = DEFAULT_N_PROCESS,
+    stream: bool = False,
+) -> Union[List[Dict[str, Any]], Iterator[Dict[str, Any]]]:
+    """
+    Batched `analyze_resume` built on nlp.pipe.
+    Returns a list of results in input order, or a generator when `stream` is set.
+    """
+    results = iter_analyze_resume(texts, batch_size=batch_size, n_process=n_process)
+    return results if stream else list(results)
+
+def warmup() -> None:
+    """
+    Load the spaCy model and compile the skill matcher up front.
+    Call before forking workers so they share both copy-on-write.
+    """
+    get_skill_matcher()
+    warmup_models()
+
+
+def __getattr__(name: str):
+    # Backwards compatible module attributes, resolved lazily
+    if name == "nlp":
+        return get_model()
+    if name == "TECHNICAL_SKILLS":
+        return list(get_taxonomy().technical)
+    if name == "SOFT_SKILLS":
+        return list(get_taxonomy().soft)
+    if name == "TAXONOMY_VERSION":
+        return get_taxonomy().version
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # ------------------------------------------------------------------
 # 🔹 EXAMPLE USAGE
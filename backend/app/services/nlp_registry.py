@@ -0,0 +1,117 @@
+"""
+spaCy Model Registry
+--------------------
+Process-wide registry that loads each spaCy model lazily on first use and
+shares the single loaded copy between `app.services.nlp` and
+`resume_parser`. Callers ask for a task-specific view of the pipeline,
+which runs with the components that task does not need disabled.
+
+For pre-fork servers (gunicorn with preload_app), call `warmup()` in the
+master process so workers inherit the loaded model copy-on-write.
+"""
+
+import gc
+import threading
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+
+import spacy
+from spacy.language import Language
+from spacy.tokens import Doc
+
+DEFAULT_MODEL = "en_core_web_sm"
+
+# Components each task reads; everything else is disabled for that task
+TASK_COMPONENTS: Dict[str, Optional[Sequence[str]]] = {
+    "tokenize": (),
+    "skills": (),
+    "entities": ("ner",),
+    "keywords": ("tok2vec", "tagger", "attribute_ruler", "parser"),
+    "full": None,  # every component
+}
+
+_models: Dict[str, Language] = {}
+_load_lock = threading.Lock()
+
+
+def _load(name: str) -> Language:
+    """Load a spaCy model, downloading it first if it is not installed."""
+    try:
+        return spacy.load(name)
+    except OSError:
+        print(f"SpaCy model '{name}' not found. Downloading...")
+        spacy.cli.download(name)
+        return spacy.load(name)
+
+
+def get_model(name: str = DEFAULT_MODEL) -> Language:
+    """Return the shared pipeline for `name`, loading it on first use."""
+    model = _models.get(name)
+    if model is not None:
+        return model
+
+    with _load_lock:
+        model = _models.get(name)
+        if model is None:
+            model = _load(name)
+            _models[name] = model
+    return model
+
+
+def is_loaded(name: str = DEFAULT_MODEL) -> bool:
+    return name in _models
+
+
+class TaskPipeline:
+    """View of a shared pipeline that runs with some components disabled."""
+
+    def __init__(self, nlp: Language, disable: List[str]):
+        self.nlp = nlp
+        self.disable = disable
+
+    def __call__(self, text: str) -> Doc:
+        # Per-call `disable` leaves the shared pipeline untouched (thread-safe)
+        return self.nlp(text, disable=self.disable)
+
+    def pipe(self, texts: Iterable[str], **kwargs) -> Iterator[Doc]:
+        kwargs.setdefault("disable", self.disable)
+        return self.nlp.pipe(texts, **kwargs)
+
+    def make_doc(self, text: str) -> Doc:
+        return self.nlp.make_doc(text)
+
+    @property
+    def vocab(self):
+        return self.nlp.vocab
+
+
+def disabled_for(nlp: Language, components: Optional[Iterable[str]]) -> List[str]:
+    """Components of `nlp` outside `components` (None keeps everything)."""
+    if components is None:
+        return []
+    needed = set(components)
+    return [name for name in nlp.pipe_names if name not in needed]
+
+
+def get_pipeline(task: str = "full", model: str = DEFAULT_MODEL) -> TaskPipeline:
+    """
+    Return a view of the shared `model` pipeline for `task`
+    (one of TASK_COMPONENTS) with unneeded components disabled.
+    """
+    if task not in TASK_COMPONENTS:
+        raise ValueError(f"Unknown NLP task '{task}'. Expected one of: {', '.join(TASK_COMPONENTS)}")
+    nlp = get_model(model)
+    return TaskPipeline(nlp, disabled_for(nlp, TASK_COMPONENTS[task]))
+
+
+def warmup(models: Sequence[str] = (DEFAULT_MODEL,), freeze: bool = True) -> None:
+    """
+    Load `models` eagerly and run one document through each, so a pre-fork
+    master holds fully initialized pipelines. With `freeze`, the loaded
+    objects are moved out of the GC's reach so collections in the workers
+    do not touch (and un-share) their pages.
+    """
+    for name in models:
+        get_model(name)("warmup")
+    if freeze:
+        gc.collect()
+        gc.freeze()
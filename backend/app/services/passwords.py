@@ -0,0 +1,184 @@
+"""
+Password Hashing
+----------------
+Runs Werkzeug's password hashing (scrypt/pbkdf2, deliberately slow) in a
+small dedicated thread pool instead of inline on the request thread.
+
+- hashlib releases the GIL while it hashes, so the pool's threads hash in
+  parallel while request threads keep serving other requests; the pool
+  size caps how many cores a login spike can take.
+- Backpressure: at most `max_pending` hashes may be queued or running.
+  Beyond that `PasswordHasherBusy` is raised right away (routes answer 503)
+  instead of letting requests pile up behind the pool.
+- The cost profile (`PASSWORD_HASH_METHOD`, e.g. "scrypt:32768:8:1" or
+  "pbkdf2:sha256:600000") is configurable per environment. Hashes stored
+  with other parameters are recognised by `needs_rehash()` so login can
+  upgrade them transparently.
+- A request that waits longer than `timeout` for its hash also gets
+  `PasswordHasherBusy`; the hash still finishes in the pool and frees its
+  slot then.
+
+With `workers=0` hashing runs inline (still bounded by `max_pending`).
+"""
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, Optional
+
+from werkzeug.security import DEFAULT_PBKDF2_ITERATIONS, check_password_hash, generate_password_hash
+
+DEFAULT_METHOD = "scrypt:32768:8:1"
+DEFAULT_WORKERS = 2
+DEFAULT_MAX_PENDING = 32
+DEFAULT_TIMEOUT = 10.0  # seconds a request waits for its hash
+
+
+class PasswordHasherBusy(RuntimeError):
+    """Too many password hashes are queued; the caller should retry later."""
+
+
+def method_prefix(method: str) -> str:
+    """
+    The method with its parameters as Werkzeug writes them into hashes
+    ("scrypt" -> "scrypt:32768:8:1"), using Werkzeug's defaults for
+    omitted parameters.
+
+    Raises:
+        ValueError: for a method Werkzeug cannot hash with
+    """
+    name, *args = method.split(":")
+    if name == "scrypt":
+        if not args:
+            return "scrypt:32768:8:1"
+        if len(args) != 3:
+            raise ValueError("'scrypt' takes 3 arguments.")
+        n, r, p = map(int, args)
+        return f"scrypt:{n}:{r}:{p}"
+    if name == "pbkdf2":
+        if len(args) > 2:
+            raise ValueError("'pbkdf2' takes 2 arguments.")
+        hash_name = args[0] if args else "sha256"
+        iterations = int(args[1]) if len(args) == 2 else DEFAULT_PBKDF2_ITERATIONS
+        return f"pbkdf2:{hash_name}:{iterations}"
+    raise ValueError(f"Invalid hash method '{method}'.")
+
+
+class PasswordHasher:
+    """Bounded pool for password hashing and verification."""
+
+    def __init__(self, method: str = DEFAULT_METHOD, workers: int = DEFAULT_WORKERS,
+                 max_pending: int = DEFAULT_MAX_PENDING, timeout: float = DEFAULT_TIMEOUT):
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._configure(method, workers, max_pending, timeout)
+        self._reset_counters()
+
+    def configure(self, method: Optional[str] = None, workers: Optional[int] = None,
+                  max_pending: Optional[int] = None, timeout: Optional[float] = None) -> None:
+        with self._lock:
+            old = self._executor
+            self._configure(
+                method if method is not None else self.method,
+                workers if workers is not None else self.workers,
+                max_pending if max_pending is not None else self.max_pending,
+                timeout if timeout is not None else self.timeout,
+            )
+        if old is not None:
+            old.shutdown(wait=False)
+
+    def _configure(self, method: str, workers: int, max_pending: int, timeout: float) -> None:
+        self.method = method
+        self.method_prefix = method_prefix(method)
+        self.workers = workers
+        self.max_pending = max(max_pending, 1)
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        self._executor = ThreadPoolExecutor(workers, thread_name_prefix="password-hash") if workers > 0 else None
+
+    # ------------------------------------------------------------------
+    # Hashing
+    # ------------------------------------------------------------------
+    def hash(self, password: str) -> str:
+        return self._run(generate_password_hash, password, self.method)
+
+    def verify(self, stored_hash: str, password: str) -> bool:
+        return self._run(check_password_hash, stored_hash, password)
+
+    def needs_rehash(self, stored_hash: str) -> bool:
+        """True when `stored_hash` was made with other parameters than the configured method."""
+        return stored_hash.split("$", 1)[0] != self.method_prefix
+
+    def upgrade(self, stored_hash: str, password: str) -> Optional[str]:
+        """
+        A new hash of `password` (already verified against `stored_hash`)
+        when the stored one uses outdated parameters, otherwise None.
+        """
+        if not self.needs_rehash(stored_hash):
+            return None
+        new_hash = self.hash(password)
+        with self._lock:
+            self.rehashed += 1
+        return new_hash
+
+    def _run(self, fn: Callable, *args) -> Any:
+        slots = self._slots
+        if not slots.acquire(blocking=False):
+            with self._lock:
+                self.rejected += 1
+            raise PasswordHasherBusy("Too many password operations in progress.")
+        start = time.perf_counter()
+        executor = self._executor
+        if executor is None:
+            try:
+                return fn(*args)
+            finally:
+                self._finish(slots, start)
+        try:
+            future: Future = executor.submit(fn, *args)
+        except RuntimeError:
+            # Pool replaced by configure() meanwhile
+            self._finish(slots, start)
+            raise
+        # The slot is only freed once the hash is done, even if the caller stops waiting
+        future.add_done_callback(lambda _: self._finish(slots, start))
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            with self._lock:
+                self.timed_out += 1
+            raise PasswordHasherBusy("Timed out waiting for password hashing.") from None
+
+    def _finish(self, slots: threading.BoundedSemaphore, start: float) -> None:
+        slots.release()
+        with self._lock:
+            self.completed += 1
+            self.total_seconds += time.perf_counter() - start
+
+    # ------------------------------------------------------------------
+    # Stats
+    # ------------------------------------------------------------------
+    def _reset_counters(self) -> None:
+        self.completed = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self.rehashed = 0
+        self.total_seconds = 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "method": self.method_prefix,
+                "workers": self.workers,
+                "max_pending": self.max_pending,
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "timed_out": self.timed_out,
+                "rehashed": self.rehashed,
+                "avg_ms": round(self.total_seconds / self.completed * 1000, 2) if self.completed else 0.0,
+            }
+
+
+# Shared hasher (configured in create_app)
+password_hasher = PasswordHasher()
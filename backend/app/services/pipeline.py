@@ -0,0 +1,119 @@
+"""
+Single-Parse Analysis Pipeline
+------------------------------
+Parses each text once and hands the shared spaCy Doc to a sequence of
+pluggable stages. Each stage declares the spaCy components it reads;
+components that no stage needs are disabled for the parse. The spaCy
+model comes from the shared registry and is loaded on first use.
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from spacy.language import Language
+from spacy.tokens import Doc
+
+from app.services.nlp_registry import DEFAULT_MODEL, disabled_for, get_model
+
+# Stage callable: (doc, results so far) -> fields to merge into the result
+StageFunc = Callable[[Doc, Dict[str, Any]], Dict[str, Any]]
+
+
+@dataclass(frozen=True)
+class Stage:
+    """One step of the analysis pipeline."""
+    name: str
+    func: StageFunc
+    components: Tuple[str, ...] = field(default_factory=tuple)
+
+
+class ResumePipeline:
+    """Runs a list of stages over one shared Doc per text."""
+
+    def __init__(
+        self,
+        stages: Sequence[Stage],
+        preprocess: Optional[Callable[[str], str]] = None,
+        model: str = DEFAULT_MODEL,
+    ):
+        """
+        Args:
+            stages: Stages to run, in order
+            preprocess: Optional text cleaning applied before parsing
+            model: Registry name of the spaCy model used for the single parse
+        """
+        self.stages = list(stages)
+        self.preprocess = preprocess
+        self.model = model
+
+    @property
+    def nlp(self) -> Language:
+        return get_model(self.model)
+
+    @property
+    def stage_names(self) -> List[str]:
+        return [stage.name for stage in self.stages]
+
+    def disabled_components(self) -> List[str]:
+        """Pipeline components that no stage reads."""
+        needed = {name for stage in self.stages for name in stage.components}
+        return disabled_for(self.nlp, needed)
+
+    def with_stages(self, names: Iterable[str]) -> "ResumePipeline":
+        """Return a pipeline restricted to the named stages (kept in pipeline order)."""
+        names = set(names)
+        unknown = names - set(self.stage_names)
+        if unknown:
+            raise ValueError(f"Unknown pipeline stage(s): {', '.join(sorted(unknown))}")
+        stages = [stage for stage in self.stages if stage.name in names]
+        return ResumePipeline(stages, self.preprocess, self.model)
+
+    def run(self, text: str, debug: bool = False) -> Dict[str, Any]:
+        """
+        Parse `text` once and run every stage over the Doc.
+        When `debug` is set, per-stage timings (ms) are added under "timings".
+        """
+        start = time.perf_counter()
+        if self.preprocess:
+            text = self.preprocess(text)
+        doc = self.nlp(text, disable=self.disabled_components())
+        parse_ms = (time.perf_counter() - start) * 1000
+        return self._run_stages(doc, debug, parse_ms)
+
+    def pipe(
+        self,
+        texts: Iterable[str],
+        batch_size: int = 256,
+        n_process: int = 1,
+        debug: bool = False,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream the pipeline over many texts with nlp.pipe, yielding results
+        in input order. Timings, when requested, cover the stages only.
+        """
+        if self.preprocess:
+            texts = (self.preprocess(text) for text in texts)
+        docs = self.nlp.pipe(
+            texts,
+            batch_size=batch_size,
+            n_process=n_process,
+            disable=self.disabled_components(),
+        )
+        for doc in docs:
+            yield self._run_stages(doc, debug)
+
+    def _run_stages(self, doc: Doc, debug: bool, parse_ms: Optional[float] = None) -> Dict[str, Any]:
+        result: Dict[str, Any] = {}
+        timings: Dict[str, float] = {}
+        if parse_ms is not None:
+            timings["parse"] = round(parse_ms, 3)
+
+        for stage in self.stages:
+            start = time.perf_counter()
+            result.update(stage.func(doc, result))
+            timings[stage.name] = round((time.perf_counter() - start) * 1000, 3)
+
+        if debug:
+            result["timings"] = timings
+        return result
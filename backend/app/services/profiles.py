@@ -0,0 +1,203 @@
+"""
+Profile Read Model
+------------------
+Serialized user profiles for the profile routes, loaded in one round trip
+and cached per user.
+
+- `load_user()` fetches a user together with their skills in one joined
+  query, so serializing never triggers a lazy load per access.
+- The serialized profile (education/experience JSON already parsed) is
+  cached per user id and tagged with the user's `profile_version`. Every
+  profile write calls `mark_changed()`, which bumps the version and drops
+  the local entry. Each read checks the cached copy against the version
+  stored in the database (one single-column lookup by primary key), not
+  against the possibly older token snapshot, so a write made by any
+  worker is seen by the next read on every worker.
+- A user deleted elsewhere is noticed by the same lookup; their cached
+  tokens are dropped and the request is unauthorized.
+- Changed users are dropped from this worker's caches (profiles and
+  authenticated tokens) when the write is made and again once it commits,
+  so a request racing the commit cannot leave an old copy behind.
+"""
+
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+DEFAULT_PROFILE_CACHE_SIZE = 4096
+
+_CHANGED_KEY = "profile_changed"
+_installed = False
+
+
+def load_user(user_id: int):
+    """The user with their skills eagerly loaded (one query), or None."""
+    from app.models import db, User
+    from sqlalchemy.orm import joinedload
+
+    return db.session.execute(
+        db.select(User).options(joinedload(User.skills)).where(User.id == user_id)
+        .execution_options(populate_existing=True)
+    ).unique().scalar_one_or_none()
+
+
+def current_version(user_id: int) -> Optional[int]:
+    """The user's stored profile_version (0 when unset), or None when the user no longer exists."""
+    from app.models import db, User
+
+    row = db.session.execute(db.select(User.profile_version).where(User.id == user_id)).first()
+    if row is None:
+        return None
+    return row[0] or 0
+
+
+def serialize_skills(user) -> List[Dict[str, str]]:
+    return [{"name": s.name, "type": s.type or "technical"} for s in user.skills]
+
+
+def serialize_profile(user) -> Dict[str, Any]:
+    return {
+        'id': user.id,
+        'name': user.username,
+        'email': user.email,
+        'location': user.location,
+        'bio': user.bio,
+        'skills': serialize_skills(user),
+        'education': json.loads(user.education) if user.education else [],
+        'experience': json.loads(user.experience) if user.experience else [],
+        'resume_url': user.resume_url,
+        'image_url': user.image_url
+    }
+
+
+class ProfileCache:
+    """Bounded LRU of serialized profiles keyed by user id, checked against `profile_version`."""
+
+    def __init__(self, maxsize: int = DEFAULT_PROFILE_CACHE_SIZE):
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[int, Tuple[int, Dict[str, Any]]]" = OrderedDict()
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def configure(self, maxsize: Optional[int] = None) -> None:
+        with self._lock:
+            if maxsize is not None:
+                self.maxsize = maxsize
+                self._evict()
+
+    def get(self, user) -> Optional[Dict[str, Any]]:
+        """
+        Serialized profile of `user` (a model or token snapshot; only its
+        id is used), from the cache when the cached copy has the version
+        stored in the database. Returned values are shared; treat them as
+        read-only. None when the user no longer exists (their cached
+        tokens are dropped).
+        """
+        version = current_version(user.id)
+        if version is None:
+            # Deleted since the token snapshot was cached (possibly by another worker)
+            invalidate_user(user.id)
+            return None
+        with self._lock:
+            entry = self._entries.get(user.id)
+            if entry is not None and entry[0] == version:
+                self._entries.move_to_end(user.id)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        # Miss: reload the user with their skills in one joined query
+        loaded = load_user(user.id)
+        if loaded is None:
+            invalidate_user(user.id)
+            return None
+        profile = serialize_profile(loaded)
+        with self._lock:
+            self._entries[user.id] = ((loaded.profile_version or 0), profile)
+            self._entries.move_to_end(user.id)
+            self._evict()
+        return profile
+
+    def invalidate(self, user_id: int) -> None:
+        with self._lock:
+            if self._entries.pop(user_id, None) is not None:
+                self.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _evict(self) -> None:
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+# Shared profile cache (configured in create_app)
+profile_cache = ProfileCache()
+
+
+def invalidate_user(user_id: int) -> None:
+    """Drop every cached copy of the user in this worker."""
+    from app.services.auth_cache import token_cache
+
+    profile_cache.invalidate(user_id)
+    token_cache.invalidate_user(user_id)
+
+
+def note_changed(user_ids: Iterable[int]) -> None:
+    """Invalidate users whose profile the current transaction changes, now and after it commits."""
+    from app.models import db
+
+    pending = db.session.info.setdefault(_CHANGED_KEY, set())
+    for user_id in user_ids:
+        pending.add(user_id)
+        invalidate_user(user_id)
+
+
+def mark_changed(user) -> None:
+    """
+    Record a write to `user`'s profile or skills. Call before committing
+    so the version bump lands in the same transaction.
+    """
+    user.profile_version = (user.profile_version or 0) + 1
+    note_changed([user.id])
+
+
+# ------------------------------------------------------------------
+# 🔹 SESSION EVENTS
+# ------------------------------------------------------------------
+def _after_commit(session: Session) -> None:
+    for user_id in session.info.pop(_CHANGED_KEY, ()):
+        invalidate_user(user_id)
+
+
+def _after_rollback(session: Session) -> None:
+    session.info.pop(_CHANGED_KEY, None)
+
+
+def install() -> None:
+    """Register the session event hooks (idempotent)."""
+    global _installed
+    if _installed:
+        return
+    event.listen(Session, "after_commit", _after_commit)
+    event.listen(Session, "after_rollback", _after_rollback)
+    _installed = True
@@ -1 +1,438 @@
-# This file is intentionally left blank.
\ No newline at end of file
+"""
+Job Board Scraper
+-----------------
+Asyncio crawler that fetches job board pages and feeds the postings it
+finds into the job catalog importer.
+
+- Fetching: a shared requests session with a bounded connection pool,
+  driven from asyncio worker tasks (requests runs in a thread pool of the
+  same size). A global semaphore caps connections, per-host semaphores
+  cap concurrency per site, and a per-host token bucket enforces the
+  request rate.
+- Retries: connection errors, timeouts, 429 and 5xx are retried with
+  exponential backoff and jitter (Retry-After is honoured).
+- Conditional GETs: ETag / Last-Modified validators are remembered per URL
+  and sent back, so unchanged pages cost a 304 and are not parsed again.
+  `load_validators` / `save_validators` keep them in a JSON state file so
+  they survive between runs of the scrape command.
+- Parsing: BeautifulSoup runs in a process pool. Postings come from
+  schema.org JobPosting data (JSON-LD or microdata); links on the same host
+  are followed up to `max_pages`.
+"""
+
+import asyncio
+import json
+import os
+import random
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urldefrag, urljoin, urlparse
+
+import requests
+from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+@dataclass
+class ScraperConfig:
+    max_connections: int = 20          # connection pool size and global in-flight cap
+    per_host: int = 4                  # concurrent requests per host
+    rate_per_host: float = 5.0         # requests per second per host
+    retries: int = 3
+    backoff: float = 0.5               # first retry delay (seconds), doubled each attempt
+    timeout: float = 10.0
+    max_pages: int = 1000
+    follow_links: bool = True
+    parse_workers: Optional[int] = None  # process pool size (cpu count when None)
+    user_agent: str = "SkillBridgeBot/1.0"
+
+
+@dataclass
+class CrawlStats:
+    pages: int = 0
+    not_modified: int = 0
+    failed: int = 0
+    retries: int = 0
+    bytes: int = 0
+    postings: int = 0
+    started: float = field(default_factory=time.perf_counter)
+    finished: Optional[float] = None
+
+    @property
+    def elapsed(self) -> float:
+        return (self.finished or time.perf_counter()) - self.started
+
+    @property
+    def pages_per_sec(self) -> float:
+        return self.pages / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def bytes_per_sec(self) -> float:
+        return self.bytes / self.elapsed if self.elapsed else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"{self.pages} pages ({self.not_modified} not modified, {self.failed} failed, "
+            f"{self.retries} retries), {self.postings} postings in {self.elapsed:.2f}s: "
+            f"{self.pages_per_sec:.1f} pages/s, {self.bytes_per_sec / 1024:.1f} KiB/s"
+        )
+
+
+class RateLimiter:
+    """Token bucket: `rate` requests per second with bursts of up to `burst`."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.capacity = float(max(burst, 1))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+# ------------------------------------------------------------------
+# 🔹 PARSING (runs in worker processes)
+# ------------------------------------------------------------------
+def _text(value: Any) -> str:
+    """Plain text of a schema.org value (nested Thing, list or HTML string)."""
+    if isinstance(value, dict):
+        value = value.get("name") or value.get("value") or ""
+    if isinstance(value, list):
+        return ", ".join(_text(v) for v in value if v)
+    value = str(value)
+    if "<" in value:
+        # Descriptions are often embedded HTML
+        return BeautifulSoup(value, "html.parser").get_text(" ", strip=True)
+    return value.strip()
+
+
+def _location(value: Any) -> str:
+    """Flatten schema.org jobLocation (Place / PostalAddress, possibly a list)."""
+    if isinstance(value, list):
+        return " / ".join(filter(None, (_location(v) for v in value)))
+    if isinstance(value, dict):
+        address = value.get("address", value)
+        if isinstance(address, dict):
+            parts = (address.get("addressLocality"), address.get("addressRegion"), address.get("addressCountry"))
+            return ", ".join(_text(p) for p in parts if p)
+        return _text(address)
+    return _text(value or "")
+
+
+def _salary(value: Any) -> str:
+    if not isinstance(value, dict):
+        return _text(value or "")
+    currency = value.get("currency", "")
+    amount = value.get("value", value)
+    if isinstance(amount, dict):
+        low, high = amount.get("minValue"), amount.get("maxValue")
+        if low is not None and high is not None:
+            return f"{currency} {low} - {high}".strip()
+        amount = amount.get("value", low if low is not None else high)
+    return f"{currency} {amount}".strip() if amount is not None else ""
+
+
+def _from_json_ld(data: Any) -> Iterable[Dict[str, Any]]:
+    if isinstance(data, list):
+        for item in data:
+            yield from _from_json_ld(item)
+        return
+    if not isinstance(data, dict):
+        return
+    if "@graph" in data:
+        yield from _from_json_ld(data["@graph"])
+    types = data.get("@type")
+    if types == "JobPosting" or (isinstance(types, list) and "JobPosting" in types):
+        skills = data.get("skills") or []
+        yield {
+            "title": _text(data.get("title", "")),
+            "description": _text(data.get("description", "")),
+            "company": _text(data.get("hiringOrganization", "")),
+            "location": _location(data.get("jobLocation")),
+            "salary_range": _salary(data.get("baseSalary")),
+            "requirements": _text(data.get("qualifications") or data.get("experienceRequirements") or "").split("\n"),
+            "skills": skills if isinstance(skills, list) else [s.strip() for s in str(skills).split(",")],
+        }
+
+
+def _from_microdata(soup: BeautifulSoup) -> Iterable[Dict[str, Any]]:
+    for node in soup.select('[itemtype$="schema.org/JobPosting"]'):
+        def prop(name):
+            found = node.select_one(f'[itemprop="{name}"]')
+            return found.get("content") or found.get_text(" ", strip=True) if found else ""
+        yield {
+            "title": prop("title"),
+            "description": prop("description"),
+            "company": prop("hiringOrganization"),
+            "location": prop("jobLocation"),
+            "salary_range": prop("baseSalary"),
+            "requirements": [prop("qualifications")],
+            "skills": [s.get("content") or s.get_text(strip=True) for s in node.select('[itemprop="skills"]')],
+        }
+
+
+def parse_page(url: str, html: str) -> Tuple[List[Dict[str, Any]], List[str]]:
+    """
+    Extract job postings and outgoing links from one page.
+
+    Returns:
+        Tuple of (raw posting records for the importer, absolute link URLs)
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    postings: List[Dict[str, Any]] = []
+    for script in soup.find_all("script", type="application/ld+json"):
+        try:
+            postings.extend(_from_json_ld(json.loads(script.string or "")))
+        except ValueError:
+            continue
+    postings.extend(_from_microdata(soup))
+    for posting in postings:
+        posting["source_url"] = url
+
+    links = []
+    for anchor in soup.find_all("a", href=True):
+        link = urldefrag(urljoin(url, anchor["href"]))[0]
+        if link.startswith(("http://", "https://")):
+            links.append(link)
+    return postings, links
+
+
+# ------------------------------------------------------------------
+# 🔹 CRAWLER
+# ------------------------------------------------------------------
+class Scraper:
+    """Crawls from seed URLs and yields the job postings found."""
+
+    def __init__(self, config: Optional[ScraperConfig] = None,
+                 validators: Optional[Dict[str, Dict[str, str]]] = None,
+                 parse_executor: Optional[Executor] = None):
+        self.config = config or ScraperConfig()
+        # url -> {"etag", "last_modified", "links"}; keep it between crawls for conditional GETs
+        self.validators: Dict[str, Dict[str, str]] = validators if validators is not None else {}
+        self._parse_executor = parse_executor
+        self.stats = CrawlStats()
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.config.max_connections,
+                              pool_maxsize=self.config.max_connections, pool_block=True)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers["User-Agent"] = self.config.user_agent
+
+        self._host_slots: Dict[str, asyncio.Semaphore] = {}
+        self._host_rates: Dict[str, RateLimiter] = {}
+
+    def close(self) -> None:
+        self.session.close()
+
+    # ---- fetching -----------------------------------------------------
+    def _request(self, url: str) -> requests.Response:
+        headers = {}
+        cached = self.validators.get(url, {})
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+        return self.session.get(url, headers=headers, timeout=self.config.timeout)
+
+    async def fetch(self, url: str, connections: asyncio.Semaphore,
+                    io_executor: Optional[Executor] = None) -> Optional[requests.Response]:
+        """GET `url` with the host's limits, retrying transient failures. None when it finally fails."""
+        host = urlparse(url).netloc
+        host_slots = self._host_slots.setdefault(host, asyncio.Semaphore(self.config.per_host))
+        host_rate = self._host_rates.setdefault(
+            host, RateLimiter(self.config.rate_per_host, burst=self.config.per_host)
+        )
+
+        for attempt in range(self.config.retries + 1):
+            delay = self.config.backoff * (2 ** attempt) * (0.5 + random.random())
+            async with host_slots, connections:
+                await host_rate.acquire()
+                try:
+                    response = await asyncio.get_running_loop().run_in_executor(io_executor, self._request, url)
+                except (requests.ConnectionError, requests.Timeout):
+                    response = None
+            if response is not None and response.status_code not in RETRY_STATUSES:
+                return response
+            if attempt == self.config.retries:
+                break
+            if response is not None and response.headers.get("Retry-After", "").isdigit():
+                delay = float(response.headers["Retry-After"])
+            self.stats.retries += 1
+            await asyncio.sleep(delay)
+        return None
+
+    # ---- crawling -----------------------------------------------------
+    async def crawl(self, seeds: Iterable[str]) -> AsyncIterator[Dict[str, Any]]:
+        """Crawl from `seeds`, yielding raw posting records as pages are parsed."""
+        seeds = [urldefrag(url)[0] for url in seeds]
+        allowed_hosts = {urlparse(url).netloc for url in seeds}
+        seen = set(seeds)
+        queue: asyncio.Queue = asyncio.Queue()
+        found: asyncio.Queue = asyncio.Queue()
+        for url in seeds:
+            queue.put_nowait(url)
+
+        connections = asyncio.Semaphore(self.config.max_connections)
+        loop = asyncio.get_running_loop()
+        # requests is blocking: one thread per allowed connection
+        io_executor = ThreadPoolExecutor(self.config.max_connections, thread_name_prefix="scraper")
+        executor = self._parse_executor or ProcessPoolExecutor(self.config.parse_workers or os.cpu_count())
+        self.stats = CrawlStats()
+
+        async def handle(url: str) -> None:
+            response = await self.fetch(url, connections, io_executor)
+            if response is None:
+                self.stats.failed += 1
+                return
+            self.stats.pages += 1
+            self.stats.bytes += len(response.content)
+            if response.status_code == 304:
+                # Unchanged: nothing new to import, but still walk the links seen last time
+                self.stats.not_modified += 1
+                links = self.validators.get(url, {}).get("links", [])
+            elif response.status_code == 200 and "html" in response.headers.get("Content-Type", "html"):
+                postings, links = await loop.run_in_executor(executor, parse_page, url, response.text)
+                self.validators[url] = {
+                    "etag": response.headers.get("ETag", ""),
+                    "last_modified": response.headers.get("Last-Modified", ""),
+                    "links": links,
+                }
+                for posting in postings:
+                    await found.put(posting)
+            else:
+                return
+
+            if self.config.follow_links:
+                for link in links:
+                    if link not in seen and urlparse(link).netloc in allowed_hosts and len(seen) < self.config.max_pages:
+                        seen.add(link)
+                        queue.put_nowait(link)
+
+        async def worker() -> None:
+            while True:
+                url = await queue.get()
+                try:
+                    await handle(url)
+                except Exception as e:
+                    self.stats.failed += 1
+                    print(f"Scraping {url} failed: {e}")
+                finally:
+                    queue.task_done()
+
+        workers = [asyncio.create_task(worker()) for _ in range(self.config.max_connections)]
+        done = asyncio.create_task(queue.join())
+        try:
+            while True:
+                getter = asyncio.create_task(found.get())
+                finished, _ = await asyncio.wait({getter, done}, return_when=asyncio.FIRST_COMPLETED)
+                if getter in finished:
+                    self.stats.postings += 1
+                    yield getter.result()
+                    continue
+                getter.cancel()
+                while not found.empty():
+                    self.stats.postings += 1
+                    yield found.get_nowait()
+                break
+        finally:
+            for task in workers + [done]:
+                task.cancel()
+            await asyncio.gather(*workers, done, return_exceptions=True)
+            io_executor.shutdown(wait=False, cancel_futures=True)
+            if self._parse_executor is None:
+                executor.shutdown(wait=False, cancel_futures=True)
+            self.stats.finished = time.perf_counter()
+
+
+# ------------------------------------------------------------------
+# 🔹 CRAWL STATE
+# ------------------------------------------------------------------
+def load_validators(path: str) -> Dict[str, Dict[str, Any]]:
+    """Validators saved by a previous run; empty when the file is missing or unreadable."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        print(f"Ignoring scraper state {path}: {e}")
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def save_validators(path: str, validators: Dict[str, Dict[str, Any]]) -> None:
+    """Write validators to `path`, replacing it atomically so a crash never leaves half a file."""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    temp = f"{path}.{os.getpid()}.tmp"
+    with open(temp, "w", encoding="utf-8") as f:
+        json.dump(validators, f)
+    os.replace(temp, path)
+
+
+# ------------------------------------------------------------------
+# 🔹 CATALOG INGEST
+# ------------------------------------------------------------------
+async def scrape_into_catalog(
+    seeds: Iterable[str],
+    config: Optional[ScraperConfig] = None,
+    batch_size: int = 200,
+    extract_skills: bool = True,
+    progress: Optional[Callable[[CrawlStats], None]] = None,
+    scraper: Optional[Scraper] = None,
+):
+    """
+    Crawl `seeds` and stream the postings into the job catalog, one
+    importer batch at a time while the crawl continues. Requires an
+    application context.
+
+    Returns:
+        Tuple of (CrawlStats, importer ImportStats)
+    """
+    from app.services import importer
+
+    scraper = scraper or Scraper(config)
+    import_stats = importer.ImportStats()
+    batch: List[Dict[str, Any]] = []
+
+    async def flush() -> None:
+        records = []
+        for raw in batch:
+            import_stats.read += 1
+            try:
+                records.append(importer.normalize_record(raw))
+            except ValueError as e:
+                import_stats.error(f"{raw.get('source_url')}: {e}")
+        batch.clear()
+        if records:
+            # Database writes and skill extraction are blocking, keep them off the loop
+            await asyncio.to_thread(importer.import_records, records, len(records), extract_skills, None, import_stats)
+        if progress:
+            progress(scraper.stats)
+
+    try:
+        async for raw in scraper.crawl(seeds):
+            batch.append(raw)
+            if len(batch) >= batch_size:
+                await flush()
+        await flush()
+    finally:
+        scraper.close()
+    return scraper.stats, import_stats
@@ -0,0 +1,258 @@
+"""
+Job Posting Full-Text Search
+----------------------------
+Ranked keyword search over job posting titles, companies and descriptions.
+
+On SQLite the postings are indexed in an FTS5 table (`job_posting_fts`)
+that uses `job_posting` as its external content, so the index only stores
+tokens, not a second copy of every description. Triggers on `job_posting`
+keep it in sync, which also covers the Core bulk paths (importer, dedupe)
+that bypass the ORM session. Results are ranked with BM25 and carry a
+highlighted snippet of the matching text.
+
+Other engines fall back to case-insensitive LIKE matching, ordered by id
+and without a relevance score.
+"""
+
+import html
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import column, table, text
+from sqlalchemy.exc import OperationalError
+
+FTS_TABLE = "job_posting_fts"
+
+# BM25 column weights: title, company, description
+TITLE_WEIGHT = 10.0
+COMPANY_WEIGHT = 2.0
+DESCRIPTION_WEIGHT = 1.0
+
+SNIPPET_TOKENS = 16
+MAX_TERMS = 16
+
+# Highlight markers that cannot occur in posting text, swapped for <mark>
+# tags once the snippet has been HTML-escaped
+_OPEN, _CLOSE = "\x02", "\x03"
+_TERM = re.compile(r"\w+\*?")
+
+_FTS_DDL = [
+    f"""CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        title, company, description,
+        content='job_posting', content_rowid='id',
+        tokenize='porter unicode61 remove_diacritics 2',
+        prefix='2 3'
+    )""",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON job_posting BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, title, company, description)
+        VALUES (new.id, new.title, new.company, new.description);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON job_posting BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, company, description)
+        VALUES ('delete', old.id, old.title, old.company, old.description);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE OF title, company, description ON job_posting BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, company, description)
+        VALUES ('delete', old.id, old.title, old.company, old.description);
+        INSERT INTO {FTS_TABLE}(rowid, title, company, description)
+        VALUES (new.id, new.title, new.company, new.description);
+    END""",
+]
+
+# Engine URL -> whether the FTS5 index is usable there
+_fts_engines: Dict[str, bool] = {}
+
+
+class SearchQueryError(ValueError):
+    """The search text has no searchable terms."""
+
+
+# ------------------------------------------------------------------
+# 🔹 INDEX SETUP
+# ------------------------------------------------------------------
+def install(engine) -> bool:
+    """
+    Create the FTS5 table and its sync triggers if they are missing, and
+    index the postings that already exist when the table is new. Safe to
+    call on every startup. Returns False (LIKE fallback) on engines other
+    than SQLite or SQLite builds without FTS5.
+    """
+    key = str(engine.url)
+    if engine.dialect.name != "sqlite":
+        _fts_engines[key] = False
+        return False
+
+    try:
+        with engine.begin() as conn:
+            exists = conn.execute(
+                text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"), {"name": FTS_TABLE}
+            ).first() is not None
+            for statement in _FTS_DDL:
+                conn.execute(text(statement))
+            if not exists:
+                conn.execute(text(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')"))
+    except OperationalError as e:
+        print(f"⚠️ Full-text search unavailable, falling back to LIKE: {e}")
+        _fts_engines[key] = False
+        return False
+
+    _fts_engines[key] = True
+    return True
+
+
+def rebuild(engine) -> None:
+    """Re-index every posting from the job_posting table."""
+    with engine.begin() as conn:
+        conn.execute(text(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')"))
+        conn.execute(text(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('optimize')"))
+
+
+def fts_enabled(engine) -> bool:
+    return _fts_engines.get(str(engine.url), False)
+
+
+# ------------------------------------------------------------------
+# 🔹 QUERY PARSING
+# ------------------------------------------------------------------
+def parse_terms(query: str) -> List[Tuple[str, bool]]:
+    """
+    Split search text into (term, is_prefix) pairs. A trailing `*` makes a
+    prefix term ("pyth*"); everything else that is not a word character is
+    ignored, so user input can never inject FTS5 query syntax.
+    """
+    terms = []
+    for match in _TERM.findall(query or ""):
+        prefix = match.endswith("*")
+        word = match.rstrip("*")
+        if word:
+            terms.append((word, prefix))
+    if not terms:
+        raise SearchQueryError("Search query must contain at least one word.")
+    return terms[:MAX_TERMS]
+
+
+def fts_match_expression(terms: Iterable[Tuple[str, bool]]) -> str:
+    """FTS5 MATCH expression requiring every term (quoted, prefix terms starred)."""
+    return " ".join(f'"{word}"*' if prefix else f'"{word}"' for word, prefix in terms)
+
+
+def _highlight(snippet: str) -> str:
+    return html.escape(snippet).replace(_OPEN, "<mark>").replace(_CLOSE, "</mark>")
+
+
+# ------------------------------------------------------------------
+# 🔹 SEARCH
+# ------------------------------------------------------------------
+def search_postings(
+    query: str,
+    skills: Iterable[str] = (),
+    location: Optional[str] = None,
+    limit: int = 20,
+    offset: int = 0,
+) -> Tuple[List[dict], bool]:
+    """
+    Postings matching every term of `query` and requiring every skill in
+    `skills`, best match first. Requires an application context.
+
+    Returns:
+        (results, has_more) where each result has id, title, company,
+        location, score (higher is better; None on the LIKE fallback) and
+        snippet (HTML-escaped, matches wrapped in <mark>)
+    """
+    from app.models import db, JobPosting, RequiredSkill
+
+    terms = parse_terms(query)
+    filters = []
+    for skill in skills:
+        # Served from the (skill_name, job_posting_id) index
+        filters.append(JobPosting.id.in_(
+            db.select(RequiredSkill.job_posting_id).where(RequiredSkill.skill_name == skill)
+        ))
+    if location:
+        filters.append(JobPosting.location == location)
+
+    if fts_enabled(db.engine):
+        rows = _fts_search(terms, filters, limit + 1, offset)
+    else:
+        rows = _like_search(terms, filters, limit + 1, offset)
+    return rows[:limit], len(rows) > limit
+
+
+def _fts_search(terms, filters, limit: int, offset: int) -> List[dict]:
+    from app.models import db, JobPosting
+
+    fts = table(FTS_TABLE, column("rowid"), column(FTS_TABLE))
+    # bm25() is lower for better matches
+    rank = db.func.bm25(fts.c[FTS_TABLE], TITLE_WEIGHT, COMPANY_WEIGHT, DESCRIPTION_WEIGHT)
+    snippet = db.func.snippet(fts.c[FTS_TABLE], 2, _OPEN, _CLOSE, "…", SNIPPET_TOKENS)
+    query = (
+        db.select(JobPosting.id, JobPosting.title, JobPosting.company, JobPosting.location,
+                  rank.label("rank"), snippet.label("snippet"))
+        .select_from(fts)
+        .join(JobPosting, JobPosting.id == fts.c.rowid)
+        .where(fts.c[FTS_TABLE].op("MATCH")(fts_match_expression(terms)))
+        .where(*filters)
+        .order_by(rank, JobPosting.id)
+        .limit(limit)
+        .offset(offset)
+    )
+    return [
+        {
+            "id": row.id,
+            "title": row.title,
+            "company": row.company,
+            "location": row.location,
+            "score": -row.rank,
+            "snippet": _highlight(row.snippet or ""),
+        }
+        for row in db.session.execute(query)
+    ]
+
+
+def _like_search(terms, filters, limit: int, offset: int) -> List[dict]:
+    from app.models import db, JobPosting
+
+    conditions = []
+    for word, prefix in terms:
+        # Substring match already covers prefixes; whole words are not enforced
+        pattern = f"%{_escape_like(word)}%"
+        conditions.append(db.or_(
+            JobPosting.title.ilike(pattern, escape="\\"),
+            JobPosting.company.ilike(pattern, escape="\\"),
+            JobPosting.description.ilike(pattern, escape="\\"),
+        ))
+    query = (
+        db.select(JobPosting.id, JobPosting.title, JobPosting.company, JobPosting.location,
+                  JobPosting.description)
+        .where(*conditions, *filters)
+        .order_by(JobPosting.id)
+        .limit(limit)
+        .offset(offset)
+    )
+    return [
+        {
+            "id": row.id,
+            "title": row.title,
+            "company": row.company,
+            "location": row.location,
+            "score": None,
+            "snippet": _highlight(_like_snippet(row.description or "", [w for w, _ in terms])),
+        }
+        for row in db.session.execute(query)
+    ]
+
+
+def _escape_like(word: str) -> str:
+    return word.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _like_snippet(description: str, words: List[str], width: int = 120) -> str:
+    """Window of the description around the first matching term, matches marked."""
+    lowered = description.lower()
+    hits = [lowered.find(w.lower()) for w in words]
+    hits = [h for h in hits if h >= 0]
+    start = max(min(hits) - width // 3, 0) if hits else 0
+    window = description[start:start + width]
+    pattern = re.compile("|".join(re.escape(w) for w in words), re.IGNORECASE)
+    marked = pattern.sub(lambda m: f"{_OPEN}{m.group(0)}{_CLOSE}", window)
+    return ("…" if start else "") + marked + ("…" if start + width < len(description) else "")
@@ -0,0 +1,128 @@
+"""
+Vectorized Skill Similarity
+---------------------------
+Fuzzy skill similarity with the same scores as difflib's
+`SequenceMatcher.ratio()` on normalized skill names, without running
+SequenceMatcher for every pair.
+
+Skills are turned into character count vectors and difflib's
+`quick_ratio()` - 2 * |common characters| / (len(a) + len(b)), an upper
+bound of `ratio()` - is computed for the whole (targets x candidates)
+matrix at once. Only the pairs whose bound reaches the threshold are
+scored exactly, so thresholds and top-k results are those of the
+per-pair difflib loop.
+"""
+
+from difflib import SequenceMatcher
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.services.taxonomy import normalize_skill_name
+
+# Upper bound on elements of the (chunk x candidates x characters) array
+# built per step of quick_ratio_matrix()
+MAX_CHUNK_ELEMENTS = 4_000_000
+
+
+def _char_counts(names: Sequence[str], vocab: Dict[str, int]) -> np.ndarray:
+    counts = np.zeros((len(names), len(vocab)), dtype=np.int32)
+    for row, name in enumerate(names):
+        for char in name:
+            counts[row, vocab[char]] += 1
+    return counts
+
+
+def quick_ratio_matrix(targets: Sequence[str], candidates: Sequence[str]) -> np.ndarray:
+    """
+    difflib's quick_ratio() of every normalized target against every
+    normalized candidate; an upper bound of ratio().
+    """
+    vocab: Dict[str, int] = {}
+    for name in list(targets) + list(candidates):
+        for char in name:
+            vocab.setdefault(char, len(vocab))
+    t = _char_counts(targets, vocab)
+    c = _char_counts(candidates, vocab)
+
+    common = np.empty((len(targets), len(candidates)), dtype=np.int32)
+    chunk = max(1, MAX_CHUNK_ELEMENTS // max(1, len(candidates) * len(vocab)))
+    for start in range(0, len(targets), chunk):
+        block = t[start:start + chunk, None, :]
+        common[start:start + chunk] = np.minimum(block, c[None, :, :]).sum(axis=2)
+
+    sizes = t.sum(axis=1)[:, None] + c.sum(axis=1)[None, :]
+    return np.divide(2.0 * common, sizes, out=np.ones(common.shape), where=sizes > 0)
+
+
+def similarity_matrix(
+    targets: Sequence[str],
+    candidates: Sequence[str],
+    threshold: float = 0.0,
+) -> np.ndarray:
+    """
+    SequenceMatcher ratio of every normalized target against every
+    normalized candidate.
+
+    Pairs whose quick_ratio() bound is below `threshold` cannot reach it
+    and are left at 0.0; with the default threshold every pair is scored.
+
+    Returns:
+        Array of shape (len(targets), len(candidates)) with scores in [0, 1]
+    """
+    scores = np.zeros((len(targets), len(candidates)), dtype=np.float64)
+    if not targets or not candidates:
+        return scores
+
+    target_names = [normalize_skill_name(s) for s in targets]
+    candidate_names = [normalize_skill_name(s) for s in candidates]
+    bounds = quick_ratio_matrix(target_names, candidate_names)
+
+    # ratio() is not symmetric, so targets stay the first sequence as in
+    # SequenceMatcher(None, target, candidate); the matcher caches its
+    # analysis of the second one, so walk the pairs candidate by candidate
+    cols, rows = np.nonzero(bounds.T >= threshold)
+    matcher = SequenceMatcher(None)
+    last_col = -1
+    for col, row in zip(cols.tolist(), rows.tolist()):
+        if col != last_col:
+            matcher.set_seq2(candidate_names[col])
+            last_col = col
+        matcher.set_seq1(target_names[row])
+        scores[row, col] = matcher.ratio()
+    return scores
+
+
+def find_similar(
+    targets: Iterable[str],
+    candidates: Sequence[str],
+    threshold: float = 0.7,
+    top_k: Optional[int] = None,
+    exclude_identical: bool = False,
+) -> Dict[str, List[Tuple[str, float]]]:
+    """
+    For each target, the candidates scoring at least `threshold`,
+    sorted by similarity (descending) and optionally cut to `top_k`.
+    With `exclude_identical`, candidates with the same normalized name as
+    the target are left out.
+
+    Returns:
+        Dict of target -> list of (candidate, similarity_score)
+    """
+    targets = list(targets)
+    candidates = list(candidates)
+    scores = similarity_matrix(targets, candidates, threshold)
+    candidate_names = [normalize_skill_name(s) for s in candidates] if exclude_identical else None
+
+    results: Dict[str, List[Tuple[str, float]]] = {}
+    for row, target in enumerate(targets):
+        hits = np.flatnonzero(scores[row] >= threshold)
+        if candidate_names is not None:
+            target_name = normalize_skill_name(target)
+            hits = hits[[candidate_names[i] != target_name for i in hits]] if len(hits) else hits
+        # Stable sort keeps candidate order for equal scores, like list.sort
+        hits = hits[np.argsort(-scores[row, hits], kind="stable")]
+        if top_k is not None:
+            hits = hits[:top_k]
+        results[target] = [(candidates[i], float(scores[row, i])) for i in hits]
+    return results
@@ -0,0 +1,117 @@
+"""
+Compiled Skill Matcher
+----------------------
+Compiles the skill taxonomy into a spaCy PhraseMatcher so that every
+single- and multi-word skill is found in one linear pass over the tokens,
+instead of comparing each token against each taxonomy entry.
+
+A matcher is compiled once per taxonomy version and reused afterwards.
+"""
+
+import hashlib
+import threading
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from spacy.language import Language
+from spacy.matcher import PhraseMatcher
+from spacy.tokens import Doc
+
+TECHNICAL = "technical"
+SOFT = "soft"
+
+
+def taxonomy_version(technical_skills: Iterable[str], soft_skills: Iterable[str]) -> str:
+    """Stable content hash identifying a technical/soft skill taxonomy."""
+    digest = hashlib.sha1()
+    for kind, skills in ((TECHNICAL, technical_skills), (SOFT, soft_skills)):
+        for skill in skills:
+            digest.update(f"{kind}\x1f{skill}\x1e".encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+class SkillMatcher:
+    """PhraseMatcher compiled from a technical and a soft skill list."""
+
+    def __init__(
+        self,
+        nlp: Language,
+        technical_skills: Iterable[str],
+        soft_skills: Iterable[str],
+        normalize: Callable[[str], str] = str.lower,
+        version: Optional[str] = None,
+        aliases: Optional[Mapping[str, Iterable[str]]] = None,
+    ):
+        """
+        Args:
+            nlp: Pipeline whose tokenizer is used for the patterns
+            technical_skills: Technical skill names
+            soft_skills: Soft skill names
+            normalize: Text normalization applied to input documents, so the
+                patterns are normalized the same way before tokenizing
+            version: Taxonomy version; a content hash is used when omitted
+            aliases: Optional canonical skill -> alternative names; a match
+                on an alias reports the canonical skill
+        """
+        technical_skills = list(technical_skills)
+        soft_skills = list(soft_skills)
+
+        self.version = version or taxonomy_version(technical_skills, soft_skills)
+        self._matcher = PhraseMatcher(nlp.vocab, attr="LOWER")
+        self._labels: Dict[int, Tuple[str, str]] = {}
+
+        aliases = aliases or {}
+
+        for kind, skills in ((TECHNICAL, technical_skills), (SOFT, soft_skills)):
+            for skill in skills:
+                forms = [normalize(form) for form in (skill, *aliases.get(skill, ()))]
+                patterns = [doc for doc in nlp.tokenizer.pipe(forms) if len(doc)]
+                if not patterns:
+                    continue
+                key = f"{kind}:{skill}"
+                self._matcher.add(key, patterns)
+                self._labels[nlp.vocab.strings[key]] = (kind, skill)
+
+        self.size = len(self._labels)
+
+    def __call__(self, doc: Doc) -> Dict[str, List[str]]:
+        """
+        Find all taxonomy skills in an already tokenized (normalized) Doc.
+        Returns structured dict of technical & soft skills.
+        """
+        found = {TECHNICAL: set(), SOFT: set()}
+        for match_id, _start, _end in self._matcher(doc):
+            kind, skill = self._labels[match_id]
+            found[kind].add(skill)
+
+        return {
+            "technical_skills": sorted(found[TECHNICAL]),
+            "soft_skills": sorted(found[SOFT]),
+        }
+
+
+# ------------------------------------------------------------------
+# 🔹 COMPILED MATCHER CACHE (one per taxonomy version)
+# ------------------------------------------------------------------
+_compiled: Dict[str, SkillMatcher] = {}
+_compile_lock = threading.Lock()
+
+
+def get_compiled_matcher(
+    version: str,
+    build: Callable[[], SkillMatcher],
+) -> SkillMatcher:
+    """
+    Return the matcher compiled for `version`, building it on first use.
+    Matchers for older taxonomy versions are dropped once a new one is built.
+    """
+    matcher = _compiled.get(version)
+    if matcher is not None:
+        return matcher
+
+    with _compile_lock:
+        matcher = _compiled.get(version)
+        if matcher is None:
+            matcher = build()
+            _compiled.clear()
+            _compiled[version] = matcher
+    return matcher
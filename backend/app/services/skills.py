@@ -0,0 +1,308 @@
+"""
+Canonical Skill Catalog
+-----------------------
+Every distinct skill is stored once in `canonical_skill` (keyed by its
+normalized name) and linked to users through `user_skill`, so skill
+strings are not repeated per user and "users with skill X" or cohort
+questions are indexed joins.
+
+Names the skill taxonomy knows (including aliases: "JS" -> "JavaScript")
+resolve to the taxonomy's canonical name, type and category; other names
+are kept as entered, with the type the user gave and a keyword category.
+
+`sync_user_skills()` applies skill changes for one or many users as a
+diff against the stored links: one set-based INSERT for the new links and
+one DELETE per user for the dropped ones, so unchanged skills are never
+rewritten.
+
+`migrate_legacy_skills()` moves the free-text rows of the old per-user
+`skill` table into the catalog; it runs at startup and is a single cheap
+query once the old table is empty.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+
+from sqlalchemy import delete, insert, update
+from sqlalchemy.exc import IntegrityError
+
+from app.services.taxonomy import SOFT, TECHNICAL, get_taxonomy, normalize_skill_name
+
+MIGRATION_BATCH_SIZE = 1000
+
+
+def _describe(name: str, skill_type: Optional[str]) -> Optional[dict]:
+    """Canonical column values for a skill name as entered, or None when it is blank."""
+    from app.services.categorizer import get_categorizer
+
+    if not isinstance(name, (str, type(None))) or not isinstance(skill_type, (str, type(None))):
+        raise ValueError("Skill name and type must be strings.")
+    name = " ".join((name or "").split())
+    if not name:
+        return None
+    taxonomy = get_taxonomy()
+    canonical = taxonomy.canonical(name)
+    if canonical:
+        entry = taxonomy.skills[canonical]
+        return {
+            "name": canonical,
+            "normalized_name": normalize_skill_name(canonical),
+            "type": entry.type,
+            "category": entry.category or get_categorizer().category_of(canonical),
+        }
+    skill_type = (skill_type or TECHNICAL).lower()
+    return {
+        "name": name,
+        "normalized_name": normalize_skill_name(name),
+        "type": skill_type if skill_type in (TECHNICAL, SOFT) else TECHNICAL,
+        "category": get_categorizer().category_of(name),
+    }
+
+
+def skill_entries(raw: object) -> List[Tuple[str, str]]:
+    """
+    (name, type) pairs from a request's skills list of {"name": str,
+    "type": str} objects (type defaults to technical).
+
+    Raises:
+        ValueError: when `raw` is not such a list
+    """
+    if not isinstance(raw, list):
+        raise ValueError("Skills must be a list.")
+    entries = []
+    for skill in raw:
+        if not isinstance(skill, dict) or not isinstance(skill.get('name'), str) \
+                or not isinstance(skill.get('type', TECHNICAL), str):
+            raise ValueError("Each skill needs a string name and an optional string type.")
+        entries.append((skill['name'], skill.get('type', TECHNICAL)))
+    return entries
+
+
+def canonical_key(name: str) -> Optional[str]:
+    """Normalized name of the canonical skill `name` resolves to (None when blank)."""
+    described = _describe(name, None)
+    return described["normalized_name"] if described else None
+
+
+def resolve_skills(entries: Iterable[Tuple[str, Optional[str]]]) -> List["Skill"]:
+    """
+    Canonical skills for (name, type) pairs, created when missing, in input
+    order without duplicates. New skills are shared reference data and are
+    committed right away in their own transaction, independent of the
+    caller's session.
+    """
+    from app.models import db, Skill
+
+    wanted: Dict[str, dict] = {}
+    for name, skill_type in entries:
+        described = _describe(name, skill_type)
+        if described and described["normalized_name"] not in wanted:
+            wanted[described["normalized_name"]] = described
+    if not wanted:
+        return []
+
+    def load(names):
+        query = db.select(Skill).where(Skill.normalized_name.in_(list(names)))
+        return {skill.normalized_name: skill for skill in db.session.scalars(query)}
+
+    found = load(wanted)
+    missing = [values for normalized, values in wanted.items() if normalized not in found]
+    if missing:
+        try:
+            with db.engine.begin() as conn:
+                conn.execute(insert(Skill), missing)
+        except IntegrityError:
+            # Another request created some of them concurrently; the unique index decides
+            for values in missing:
+                try:
+                    with db.engine.begin() as conn:
+                        conn.execute(insert(Skill), values)
+                except IntegrityError:
+                    pass
+        found.update(load(values["normalized_name"] for values in missing))
+    return [found[normalized] for normalized in wanted]
+
+
+def find_skill(name: str) -> Optional["Skill"]:
+    """The stored canonical skill for a name or taxonomy alias, if any."""
+    from app.models import db, Skill
+
+    described = _describe(name, None)
+    if described is None:
+        return None
+    return db.session.scalars(
+        db.select(Skill).where(Skill.normalized_name == described["normalized_name"])
+    ).first()
+
+
+# ------------------------------------------------------------------
+# 🔹 BULK SKILL SYNC
+# ------------------------------------------------------------------
+@dataclass
+class SkillSyncResult:
+    inserted: int = 0
+    deleted: int = 0
+    added: Dict[int, List[str]] = field(default_factory=dict)  # user id -> names of new skills
+    changed_users: Set[int] = field(default_factory=set)
+
+
+def sync_user_skills(desired: Mapping[int, Sequence["Skill"]], replace: bool = True) -> SkillSyncResult:
+    """
+    Make each user's skills match `desired` (user id -> canonical skills).
+    With replace=False skills are only added, never removed. Only the
+    difference to the stored links is written; affected users get their
+    profile version bumped. Runs in the caller's session without
+    committing, so several users can be synced in one transaction.
+    """
+    from app.models import db, User, UserSkill
+    from app.services.profiles import note_changed
+
+    result = SkillSyncResult()
+    if not desired:
+        return result
+
+    stored: Dict[int, Set[int]] = {user_id: set() for user_id in desired}
+    user_ids = list(desired)
+    for i in range(0, len(user_ids), MIGRATION_BATCH_SIZE):
+        for user_id, skill_id in db.session.execute(
+            db.select(UserSkill.user_id, UserSkill.skill_id)
+            .where(UserSkill.user_id.in_(user_ids[i:i + MIGRATION_BATCH_SIZE]))
+        ):
+            stored[user_id].add(skill_id)
+
+    inserts = []
+    for user_id, skills in desired.items():
+        wanted = {skill.id: skill.name for skill in skills}
+        new_ids = [skill_id for skill_id in wanted if skill_id not in stored[user_id]]
+        result.added[user_id] = [wanted[skill_id] for skill_id in new_ids]
+        inserts.extend({"user_id": user_id, "skill_id": skill_id} for skill_id in new_ids)
+        if new_ids:
+            result.changed_users.add(user_id)
+
+        dropped = stored[user_id] - set(wanted) if replace else set()
+        if dropped:
+            db.session.execute(delete(UserSkill).where(UserSkill.user_id == user_id)
+                               .where(UserSkill.skill_id.in_(dropped)))
+            result.deleted += len(dropped)
+            result.changed_users.add(user_id)
+
+    if inserts:
+        db.session.execute(_insert_ignore(UserSkill), inserts)
+        result.inserted = len(inserts)
+
+    if result.changed_users:
+        db.session.execute(update(User).where(User.id.in_(result.changed_users)).values(
+            profile_version=db.func.coalesce(User.profile_version, 0) + 1
+        ))
+        note_changed(result.changed_users)
+    return result
+
+
+def _insert_ignore(model):
+    """INSERT that skips rows hitting a unique key, where the dialect supports it."""
+    from app.models import db
+
+    dialect = db.engine.dialect.name
+    if dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    elif dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    else:
+        # The diff already leaves out stored links; only concurrent writers can collide
+        return insert(model)
+    return dialect_insert(model).on_conflict_do_nothing()
+
+
+# ------------------------------------------------------------------
+# 🔹 INDEXED SKILL QUERIES
+# ------------------------------------------------------------------
+def users_with_skills(names: Sequence[str], match_all: bool = True) -> List[int]:
+    """IDs of users who have all (or, with match_all=False, any) of the named skills."""
+    from app.models import db, Skill, UserSkill
+
+    normalized = {d["normalized_name"] for d in (_describe(n, None) for n in names) if d}
+    if not normalized:
+        return []
+    query = (
+        db.select(UserSkill.user_id)
+        .join(Skill, Skill.id == UserSkill.skill_id)
+        .where(Skill.normalized_name.in_(normalized))
+        .group_by(UserSkill.user_id)
+        .order_by(UserSkill.user_id)
+    )
+    if match_all:
+        query = query.having(db.func.count() == len(normalized))
+    return list(db.session.scalars(query))
+
+
+def skill_distribution(user_ids: Optional[Iterable[int]] = None) -> Dict[str, int]:
+    """
+    {skill name -> users who have it} across a cohort of users (everyone
+    when `user_ids` is None), for comparing a cohort against market demand.
+    """
+    from app.models import db, Skill, UserSkill
+
+    query = (
+        db.select(Skill.name, db.func.count(UserSkill.user_id))
+        .join(UserSkill, UserSkill.skill_id == Skill.id)
+        .group_by(Skill.id, Skill.name)
+    )
+    if user_ids is not None:
+        query = query.where(UserSkill.user_id.in_(list(user_ids)))
+    return {name: users for name, users in db.session.execute(query)}
+
+
+# ------------------------------------------------------------------
+# 🔹 MIGRATION FROM PER-USER SKILL ROWS
+# ------------------------------------------------------------------
+def migrate_legacy_skills(batch_size: int = MIGRATION_BATCH_SIZE) -> int:
+    """
+    Link every user to the canonical skills of their rows in the old
+    `skill` table, then delete those rows. Each batch commits on its own,
+    so an interrupted run resumes where it stopped. Requires an
+    application context.
+
+    Returns:
+        Number of old rows migrated
+    """
+    from app.models import db, LegacySkill, User, UserSkill
+    from app.services.profiles import note_changed
+
+    migrated = 0
+    while True:
+        rows = db.session.execute(
+            db.select(LegacySkill.id, LegacySkill.user_id, LegacySkill.name, LegacySkill.type)
+            .order_by(LegacySkill.id).limit(batch_size)
+        ).all()
+        if not rows:
+            break
+
+        skill_ids = {
+            skill.normalized_name: skill.id
+            for skill in resolve_skills((name, skill_type) for _, _, name, skill_type in rows)
+        }
+        user_ids = {user_id for _, user_id, _, _ in rows}
+        linked = {tuple(pair) for pair in db.session.execute(
+            db.select(UserSkill.user_id, UserSkill.skill_id).where(UserSkill.user_id.in_(user_ids))
+        )}
+
+        links = []
+        for _, user_id, name, skill_type in rows:
+            described = _describe(name, skill_type)
+            if described is None:
+                continue
+            pair = (user_id, skill_ids[described["normalized_name"]])
+            if pair not in linked:
+                linked.add(pair)
+                links.append({"user_id": pair[0], "skill_id": pair[1]})
+        if links:
+            db.session.execute(insert(UserSkill), links)
+        db.session.execute(delete(LegacySkill).where(LegacySkill.id.in_([row[0] for row in rows])))
+        # Same effect as mark_changed() for every user in the batch
+        db.session.execute(update(User).where(User.id.in_(user_ids)).values(
+            profile_version=db.func.coalesce(User.profile_version, 0) + 1
+        ))
+        note_changed(user_ids)
+        db.session.commit()
+        migrated += len(rows)
+    return migrated
@@ -0,0 +1,207 @@
+"""
+Skill Taxonomy
+--------------
+Loads the versioned skill taxonomy (app/data/skill_taxonomy.json) into an
+immutable index with the normalized forms, alias -> canonical map and
+category lookup precomputed once.
+
+The current index is swapped atomically on reload: readers grab one
+reference with `get_taxonomy()` and keep using it for the whole request,
+while a new index is built off to the side. The data file is re-checked
+for changes at most every `reload_interval` seconds, so workers pick up
+a new taxonomy without a restart.
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+DEFAULT_TAXONOMY_PATH = Path(__file__).resolve().parent.parent / "data" / "skill_taxonomy.json"
+DEFAULT_RELOAD_INTERVAL = 30.0  # seconds between data file change checks
+
+TECHNICAL = "technical"
+SOFT = "soft"
+
+
+def normalize_skill_name(skill: str) -> str:
+    """
+    Normalize skill names for better matching.
+
+    Args:
+        skill: Raw skill name
+
+    Returns:
+        Normalized skill name
+    """
+    # Remove special characters and normalize whitespace
+    normalized = re.sub(r'[^\w\s+#.]', '', skill)
+    normalized = re.sub(r'\s+', ' ', normalized).strip()
+    return normalized.lower()
+
+
+@dataclass(frozen=True)
+class SkillEntry:
+    """One canonical skill of the taxonomy."""
+    name: str
+    type: str
+    category: Optional[str]
+    aliases: Tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class SkillTaxonomy:
+    """Immutable, pre-indexed view of one taxonomy version."""
+    version: str
+    skills: Mapping[str, SkillEntry]  # canonical name -> entry
+    technical: Tuple[str, ...]
+    soft: Tuple[str, ...]
+    aliases: Mapping[str, Tuple[str, ...]]  # canonical name -> aliases
+    canonical_by_normalized: Mapping[str, str]  # normalized name/alias -> canonical
+    category_by_skill: Mapping[str, str]  # canonical name -> category
+    category_rules: Tuple[Tuple[str, Tuple[str, ...]], ...]  # ordered (category, keywords)
+
+    @property
+    def categories(self) -> Tuple[str, ...]:
+        return tuple(name for name, _ in self.category_rules)
+
+    def canonical(self, skill: str) -> Optional[str]:
+        """Canonical taxonomy name for a skill or alias, if known."""
+        return self.canonical_by_normalized.get(normalize_skill_name(skill))
+
+    def category_of(self, skill: str) -> Optional[str]:
+        """Declared category of a known skill or alias."""
+        canonical = self.canonical(skill)
+        return self.category_by_skill.get(canonical) if canonical else None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], fingerprint: str = "") -> "SkillTaxonomy":
+        """Build and validate the index from the parsed data file."""
+        skills: Dict[str, SkillEntry] = {}
+        canonical_by_normalized: Dict[str, str] = {}
+
+        for raw in data.get("skills", []):
+            name = raw["name"]
+            skill_type = raw.get("type", TECHNICAL)
+            if skill_type not in (TECHNICAL, SOFT):
+                raise ValueError(f"Skill '{name}' has unknown type '{skill_type}'")
+            if name in skills:
+                raise ValueError(f"Duplicate skill '{name}' in taxonomy")
+            entry = SkillEntry(
+                name=name,
+                type=skill_type,
+                category=raw.get("category"),
+                aliases=tuple(raw.get("aliases", [])),
+            )
+            skills[name] = entry
+            for form in (name,) + entry.aliases:
+                normalized = normalize_skill_name(form)
+                owner = canonical_by_normalized.setdefault(normalized, name)
+                if owner != name:
+                    raise ValueError(f"'{form}' is claimed by both '{owner}' and '{name}'")
+
+        version = str(data.get("version", "0"))
+        if fingerprint:
+            version = f"{version}+{fingerprint}"
+
+        return cls(
+            version=version,
+            skills=MappingProxyType(skills),
+            technical=tuple(n for n, e in skills.items() if e.type == TECHNICAL),
+            soft=tuple(n for n, e in skills.items() if e.type == SOFT),
+            aliases=MappingProxyType({n: e.aliases for n, e in skills.items() if e.aliases}),
+            canonical_by_normalized=MappingProxyType(canonical_by_normalized),
+            category_by_skill=MappingProxyType({n: e.category for n, e in skills.items() if e.category}),
+            category_rules=tuple(
+                (c["name"], tuple(k.lower() for k in c.get("keywords", [])))
+                for c in data.get("categories", [])
+            ),
+        )
+
+
+def load_taxonomy(path: os.PathLike) -> SkillTaxonomy:
+    """Read and index a taxonomy data file."""
+    raw = Path(path).read_bytes()
+    fingerprint = hashlib.sha1(raw).hexdigest()[:8]
+    return SkillTaxonomy.from_dict(json.loads(raw), fingerprint=fingerprint)
+
+
+# ------------------------------------------------------------------
+# 🔹 CURRENT TAXONOMY (atomic swap + throttled hot reload)
+# ------------------------------------------------------------------
+_path = Path(os.environ.get("TAXONOMY_PATH", DEFAULT_TAXONOMY_PATH))
+_reload_interval = DEFAULT_RELOAD_INTERVAL
+_current: Optional[SkillTaxonomy] = None
+_current_mtime: Optional[float] = None
+_next_check = 0.0
+_reload_lock = threading.Lock()
+
+
+def configure(path: Optional[os.PathLike] = None, reload_interval: Optional[float] = None) -> None:
+    """Point the taxonomy at another data file and/or change the check interval."""
+    global _reload_interval, _next_check
+    if reload_interval is not None:
+        _reload_interval = reload_interval
+        _next_check = 0.0
+    if path is not None and Path(path) != _path:
+        reload_taxonomy(path)
+
+
+def get_taxonomy() -> SkillTaxonomy:
+    """
+    Return the current taxonomy index, loading it on first use and
+    picking up data file changes at most every reload interval.
+    """
+    current = _current
+    if current is None:
+        return reload_taxonomy()
+    if _reload_interval >= 0 and time.monotonic() >= _next_check:
+        _maybe_reload()
+    return _current
+
+
+def _maybe_reload() -> None:
+    global _next_check
+    # Only one thread checks; everyone else keeps serving the current index
+    if not _reload_lock.acquire(blocking=False):
+        return
+    try:
+        _next_check = time.monotonic() + _reload_interval
+        try:
+            mtime = _path.stat().st_mtime
+        except OSError:
+            return
+        if mtime != _current_mtime:
+            try:
+                _swap(_path, mtime)
+            except (OSError, ValueError, KeyError) as e:
+                # Keep serving the last good taxonomy
+                print(f"Taxonomy reload failed, keeping version {_current.version}: {e}")
+    finally:
+        _reload_lock.release()
+
+
+def reload_taxonomy(path: Optional[os.PathLike] = None) -> SkillTaxonomy:
+    """
+    Build a fresh index from the data file (optionally switching to `path`)
+    and swap it in atomically.
+    """
+    global _path
+    with _reload_lock:
+        if path is not None:
+            _path = Path(path)
+        return _swap(_path, _path.stat().st_mtime)
+
+
+def _swap(path: Path, mtime: float) -> SkillTaxonomy:
+    global _current, _current_mtime, _next_check
+    taxonomy = load_taxonomy(path)  # built before anyone can see it
+    _current, _current_mtime = taxonomy, mtime
+    _next_check = time.monotonic() + _reload_interval
+    return taxonomy
@@ -1,8 +1,9 @@
-import re
-import difflib
-
-from typing import List, Dict, Set, Tuple, Any
+from typing import List, Dict, Set, Tuple, Any, Optional
 from app.services import nlp
+from app.services import similarity
+from app.services.categorizer import get_categorizer
+from app.services.interner import get_skill_interner
+from app.services.taxonomy import normalize_skill_name
 
 
 def some_utility_function():
@@ -19,31 +20,13 @@ def compare_skills(user_skills: List[str], market_skills: List[str]) -> List[str
     Returns:
         List of skills that are missing from user's skillset
     """
-    user_skills_normalized = {normalize_skill_name(skill) for skill in user_skills}
-    market_skills_normalized = {normalize_skill_name(skill) for skill in market_skills}
-    missing_skills = market_skills_normalized - user_skills_normalized
+    # Skills compare by their interning key (aliases resolved with the
+    # current taxonomy); nothing is interned, so arbitrary input cannot
+    # grow the shared table
+    interner = get_skill_interner()
+    user_keys = {interner.key(skill) for skill in user_skills}
     # Return original case market skills that are missing
-    missing_original = []
-    for market_skill in market_skills:
-        if normalize_skill_name(market_skill) in missing_skills:
-            missing_original.append(market_skill)
-    return missing_original
-
-
-def normalize_skill_name(skill: str) -> str:
-    """
-    Normalize skill names for better matching.
-    
-    Args:
-        skill: Raw skill name
-    
-    Returns:
-        Normalized skill name
-    """
-    # Remove special characters and normalize whitespace
-    normalized = re.sub(r'[^\w\s+#.]', '', skill)
-    normalized = re.sub(r'\s+', ' ', normalized).strip()
-    return normalized.lower()
+    return [market_skill for market_skill in market_skills if interner.key(market_skill) not in user_keys]
 
 
 def calculate_skill_similarity(skill1: str, skill2: str) -> float:
@@ -57,13 +40,11 @@ def calculate_skill_similarity(skill1: str, skill2: str) -> float:
     Returns:
         Similarity score between 0 and 1
     """
-    normalized1 = normalize_skill_name(skill1)
-    normalized2 = normalize_skill_name(skill2)
-    
-    return difflib.SequenceMatcher(None, normalized1, normalized2).ratio()
+    return float(similarity.similarity_matrix([skill1], [skill2])[0, 0])
 
 
-def find_similar_skills(target_skill: str, skill_list: List[str], threshold: float = 0.7) -> List[Tuple[str, float]]:
+def find_similar_skills(target_skill: str, skill_list: List[str], threshold: float = 0.7,
+                        top_k: Optional[int] = None) -> List[Tuple[str, float]]:
     """
     Find skills similar to the target skill.
     
@@ -71,21 +52,28 @@ def find_similar_skills(target_skill: str, skill_list: List[str], threshold: flo
         target_skill: The skill to find matches for
         skill_list: List of skills to search in
         threshold: Minimum similarity threshold (0-1)
+        top_k: Maximum number of matches to return (all when None)
     
     Returns:
         List of tuples (skill, similarity_score) sorted by similarity
     """
-    similarities = []
-    
-    for skill in skill_list:
-        similarity = calculate_skill_similarity(target_skill, skill)
-        if similarity >= threshold:
-            similarities.append((skill, similarity))
+    return similarity.find_similar([target_skill], skill_list, threshold, top_k)[target_skill]
+
+
+def find_similar_skills_bulk(target_skills: List[str], skill_list: List[str], threshold: float = 0.7,
+                             top_k: Optional[int] = None,
+                             exclude_identical: bool = False) -> Dict[str, List[Tuple[str, float]]]:
+    """
+    `find_similar_skills` for many targets at once, computed as a single
+    targets x skill_list similarity matrix.
     
-    # Sort by similarity score (descending)
-    similarities.sort(key=lambda x: x[1], reverse=True)
+    Args:
+        exclude_identical: Leave out skills with the same normalized name as the target
     
-    return similarities
+    Returns:
+        Dict of target skill -> list of tuples (skill, similarity_score) sorted by similarity
+    """
+    return similarity.find_similar(target_skills, skill_list, threshold, top_k, exclude_identical)
 
 
 def extract_skills_from_text(text: str, skill_keywords: List[str] = None) -> List[str]:
@@ -169,35 +157,23 @@ def categorize_skills(skills: List[str]) -> Dict[str, List[str]]:
     Returns:
         Dictionary with skill categories as keys and skill lists as values
     """
-    # Predefined skill categories with common keywords
-    categories = {
-        'Programming Languages': ['python', 'java', 'javascript', 'c++', 'c#', 'php', 'ruby', 'go', 'rust', 'scala'],
-        'Web Technologies': ['html', 'css', 'react', 'angular', 'vue', 'nodejs', 'express', 'django', 'flask'],
-        'Databases': ['sql', 'mysql', 'postgresql', 'mongodb', 'redis', 'sqlite', 'oracle'],
-        'Cloud Platforms': ['aws', 'azure', 'gcp', 'docker', 'kubernetes', 'terraform'],
-        'Data Science': ['pandas', 'numpy', 'sklearn', 'tensorflow', 'pytorch', 'tableau', 'power bi'],
-        'Tools & DevOps': ['git', 'jenkins', 'ci/cd', 'linux', 'bash', 'vim', 'jira'],
-        'Soft Skills': ['communication', 'leadership', 'teamwork', 'problem solving', 'project management']
-    }
-    
-    categorized = {category: [] for category in categories.keys()}
-    categorized['Other'] = []
+    categorized, _ = categorize_skills_indexed(skills)
+    return categorized
+
+
+def categorize_skills_indexed(skills: List[str]) -> Tuple[Dict[str, List[str]], Dict[str, str]]:
+    """
+    Categorize skills and also return the reverse skill -> category map,
+    so callers can look up a skill's category without re-scanning.
     
-    for skill in skills:
-        skill_lower = skill.lower()
-        categorized_flag = False
-        
-        for category, keywords in categories.items():
-            if any(keyword in skill_lower for keyword in keywords):
-                categorized[category].append(skill)
-                categorized_flag = True
-                break
-        
-        if not categorized_flag:
-            categorized['Other'].append(skill)
+    Args:
+        skills: List of skills to categorize
     
-    # Remove empty categories
-    return {k: v for k, v in categorized.items() if v}
+    Returns:
+        Tuple of (category -> skills without empty categories, skill -> category)
+    """
+    # Built once per taxonomy version; memoizes each skill's category
+    return get_categorizer().categorize(skills)
 
 
 # Additional utility functions can be added here as needed.
\ No newline at end of file
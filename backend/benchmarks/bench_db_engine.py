@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Benchmark: read/write throughput of concurrent worker processes against
+one local SQLite file, with default SQLite settings vs. the tuned WAL
+profile (and a PostgreSQL pool when --postgres-url is given).
+
+Each worker process opens its own engine, like a gunicorn worker, and
+runs a mix of catalog page reads and posting inserts for a fixed time.
+
+Usage (from backend/):
+    python benchmarks/bench_db_engine.py [--workers 8] [--seconds 10] [--write-ratio 0.2]
+"""
+
+import argparse
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import time
+
+# Add the backend directory to Python path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.exc import OperationalError
+
+from app.models import db, JobPosting, RequiredSkill
+from app.services import db_engine, search
+
+SKILLS = ["Python", "SQL", "React", "Docker", "AWS", "Kubernetes", "Pandas", "Java"]
+
+
+def make_engine(url, profile):
+    engine = create_engine(url, **db_engine.engine_options(url))
+    db_engine.install(engine, db_engine.SQLiteTuning() if profile == "wal" else None)
+    return engine
+
+
+def write_posting(conn, rng):
+    posting_id = conn.execute(
+        insert(JobPosting).returning(JobPosting.id),
+        [{"title": f"Engineer {rng.randint(1, 500)}", "company": "Bench Co",
+          "description": "Build and run services " * rng.randint(5, 30)}],
+    ).scalar_one()
+    conn.execute(insert(RequiredSkill),
+                 [{"skill_name": s, "job_posting_id": posting_id} for s in rng.sample(SKILLS, 3)])
+
+
+def read_page(conn, rng, max_id):
+    start = rng.randint(0, max_id)
+    conn.execute(
+        select(JobPosting.id, JobPosting.title, RequiredSkill.skill_name)
+        .outerjoin(RequiredSkill, RequiredSkill.job_posting_id == JobPosting.id)
+        .where(JobPosting.id > start).order_by(JobPosting.id).limit(50)
+    ).all()
+
+
+def worker(url, profile, seconds, write_ratio, seed, max_id, results):
+    rng = random.Random(seed)
+    engine = make_engine(url, profile)
+    reads = writes = errors = 0
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        try:
+            if rng.random() < write_ratio:
+                with engine.begin() as conn:
+                    write_posting(conn, rng)
+                writes += 1
+            else:
+                with engine.connect() as conn:
+                    read_page(conn, rng, max_id)
+                reads += 1
+        except OperationalError:
+            # "database is locked" once the busy timeout runs out
+            errors += 1
+    engine.dispose()
+    results.put((reads, writes, errors))
+
+
+def seed(url, postings):
+    engine = make_engine(url, "wal")
+    db.metadata.drop_all(engine)
+    db.metadata.create_all(engine)
+    search.install(engine)
+    rng = random.Random(1)
+    with engine.begin() as conn:
+        for _ in range(postings):
+            write_posting(conn, rng)
+    if engine.dialect.name == "sqlite":
+        # Start every profile from the same rollback-journal file state
+        with engine.connect() as conn:
+            conn.exec_driver_sql("PRAGMA journal_mode = DELETE")
+    engine.dispose()
+
+
+def run(url, profile, args):
+    seed(url, args.postings)
+    results = multiprocessing.Queue()
+    processes = [
+        multiprocessing.Process(target=worker, args=(url, profile, args.seconds, args.write_ratio,
+                                                     i, args.postings, results))
+        for i in range(args.workers)
+    ]
+    for process in processes:
+        process.start()
+    totals = [sum(values) for values in zip(*(results.get() for _ in processes))]
+    for process in processes:
+        process.join()
+    reads, writes, errors = totals
+    print(f"{profile:>9} {reads / args.seconds:>10,.0f} {writes / args.seconds:>10,.0f} {errors:>8,}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--write-ratio", type=float, default=0.2)
+    parser.add_argument("--postings", type=int, default=5_000, help="postings seeded before each run")
+    parser.add_argument("--postgres-url", help="also run against this (scratch!) PostgreSQL database")
+    args = parser.parse_args()
+
+    print(f"{args.workers} workers, {args.seconds:g}s, {args.write_ratio:.0%} writes")
+    print(f"{'profile':>9} {'reads/s':>10} {'writes/s':>10} {'errors':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+        run(url, "default", args)
+        run(url, "wal", args)
+    if args.postgres_url:
+        run(db_engine.normalize_url(args.postgres_url), "postgres", args)
+
+
+if __name__ == "__main__":
+    main()
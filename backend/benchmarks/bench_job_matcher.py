@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Benchmark: inverted-index top-k job matching vs. a brute-force scan that
+scores every posting and sorts the full list.
+
+Usage (from backend/):
+    python benchmarks/bench_job_matcher.py [--postings 100000] [--queries 50]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+# Add the backend directory to Python path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.interner import SkillInterner
+from app.services.job_matcher import COVERAGE_WEIGHT, OVERLAP_WEIGHT, JobMatcher
+
+
+def synthetic_skills(size):
+    return [f"skill-{i}" for i in range(size)]
+
+
+def zipf_weights(size, offset=10):
+    # Zipf-like popularity so common skills appear in many postings
+    return [1.0 / (rank + offset) for rank in range(size)]
+
+
+def sample_skills(vocabulary, weights, rng, low, high):
+    count = rng.randint(low, high)
+    picked = set()
+    while len(picked) < count:
+        picked.update(rng.choices(vocabulary, weights, k=count - len(picked)))
+    return sorted(picked)
+
+
+def brute_force_top_k(postings, user_skills, k):
+    """Score every posting against the user (unweighted overlap), then sort everything."""
+    user = set(user_skills)
+    scored = []
+    for posting_id, (title, required) in postings.items():
+        shared = len(required & user)
+        if not shared:
+            continue
+        coverage = shared / len(required)
+        score = COVERAGE_WEIGHT * coverage + OVERLAP_WEIGHT * shared / len(user)
+        scored.append((score, posting_id))
+    scored.sort(reverse=True)
+    return scored[:k]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--postings", type=int, default=100_000)
+    parser.add_argument("--vocabulary", type=int, default=5_000)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("-k", type=int, default=10)
+    args = parser.parse_args()
+    rng = random.Random(11)
+
+    vocabulary = synthetic_skills(args.vocabulary)
+    weights = zipf_weights(len(vocabulary))
+    postings = {
+        i: (f"Job {i}", set(sample_skills(vocabulary, weights, rng, 3, 12)))
+        for i in range(args.postings)
+    }
+    queries = [sample_skills(vocabulary, weights, rng, 5, 25) for _ in range(args.queries)]
+
+    matcher = JobMatcher(SkillInterner())
+    start = time.perf_counter()
+    for posting_id, (title, skills) in postings.items():
+        matcher.add_posting(posting_id, title, skills)
+    build = time.perf_counter() - start
+    print(f"index build: {len(matcher):,} postings in {build:.2f}s")
+
+    start = time.perf_counter()
+    for skills in queries:
+        brute_force_top_k(postings, skills, args.k)
+    brute = (time.perf_counter() - start) / len(queries)
+
+    start = time.perf_counter()
+    for skills in queries:
+        matcher.top_k(skills, args.k)
+    indexed = (time.perf_counter() - start) / len(queries)
+
+    print(f"{'path':>12} {'ms/query':>10}")
+    print(f"{'brute force':>12} {brute * 1000:>10.2f}")
+    print(f"{'inverted':>12} {indexed * 1000:>10.2f}")
+    print(f"speedup: {brute / indexed:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
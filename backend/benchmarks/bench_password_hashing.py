@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Benchmark: login throughput under concurrent load, and how much a login
+spike slows down other requests, with password hashing inline on the
+request threads vs. in the bounded hashing pool.
+
+Client threads post to /api/auth/login for a fixed time while a probe
+thread times a cheap request on the same app.
+
+Usage (from backend/):
+    python benchmarks/bench_password_hashing.py [--clients 16] [--seconds 5] [--method scrypt:32768:8:1]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+# Add the backend directory to Python path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import Flask, jsonify
+
+from app.models import db, User
+from app.routes.auth import auth_bp
+from app.services.passwords import password_hasher
+
+USERS = 20
+
+
+def make_app(tmp):
+    app = Flask(__name__)
+    app.config["SECRET_KEY"] = "bench"
+    app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+    db.init_app(app)
+    app.register_blueprint(auth_bp, url_prefix="/api/auth")
+
+    @app.route("/ping")
+    def ping():
+        return jsonify({"ok": True})
+
+    return app
+
+
+def run(app, mode, args):
+    password_hasher.configure(
+        method=args.method,
+        workers=0 if mode == "inline" else args.workers,
+        # Inline has no pool to protect, so never reject there
+        max_pending=10_000 if mode == "inline" else args.max_pending,
+    )
+    counts = {"ok": 0, "busy": 0}
+    lock = threading.Lock()
+    stop = threading.Event()
+
+    def client(i):
+        test_client = app.test_client()
+        while not stop.is_set():
+            status = test_client.post("/api/auth/login",
+                                      json={"email": f"u{i % USERS}@x", "password": "secret"}).status_code
+            with lock:
+                counts["ok" if status == 200 else "busy"] += 1
+            if status == 503:
+                time.sleep(0.05)  # honour Retry-After, scaled down
+
+    probe_latencies = []
+
+    def probe():
+        test_client = app.test_client()
+        while not stop.is_set():
+            start = time.perf_counter()
+            test_client.get("/ping")
+            probe_latencies.append(time.perf_counter() - start)
+            time.sleep(0.01)
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(args.clients)]
+    threads.append(threading.Thread(target=probe))
+    for thread in threads:
+        thread.start()
+    time.sleep(args.seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    probe_latencies.sort()
+    p50 = statistics.median(probe_latencies)
+    p95 = probe_latencies[int(len(probe_latencies) * 0.95) - 1]
+    print(f"{mode:>7} {counts['ok'] / args.seconds:>9.1f} {counts['busy']:>6} "
+          f"{p50 * 1000:>10.2f} {p95 * 1000:>10.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--seconds", type=float, default=5)
+    parser.add_argument("--method", default="scrypt:32768:8:1")
+    parser.add_argument("--workers", type=int, default=2, help="hashing pool threads")
+    parser.add_argument("--max-pending", type=int, default=8)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        app = make_app(tmp)
+        with app.app_context():
+            db.create_all()
+            password_hasher.configure(method=args.method, workers=0)
+            for i in range(USERS):
+                user = User(username=f"u{i}", email=f"u{i}@x")
+                user.set_password("secret")
+                db.session.add(user)
+            db.session.commit()
+
+        print(f"{args.clients} login clients, {args.method}, {os.cpu_count()} CPUs")
+        print(f"{'mode':>7} {'logins/s':>9} {'503s':>6} {'probe p50':>10} {'probe p95':>10}")
+        run(app, "inline", args)
+        run(app, "pool", args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark: PDF extraction throughput (pages/s) of each extraction mode,
+against the previous behaviour of running table detection on every page.
+
+Generates synthetic resumes: text pages with a section divider, a link
+and a small photo, plus a ruled table on every `--table-every`th page.
+
+Usage (from backend/):
+    python benchmarks/bench_pdf_extract.py [--docs 20] [--pages 3] [--table-every 4] [--repeat 3]
+"""
+
+import argparse
+import base64
+import os
+import random
+import sys
+import time
+
+# Add the backend directory to Python path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pymupdf
+
+from resume_parser.main import EXTRACTION_MODES, PDFExtractor, page_may_have_tables
+
+WORDS = ("python sql docker react kubernetes built led designed shipped services pipelines "
+         "data platform team customers latency reliability migrated automated").split()
+
+
+def make_resume(rng, pages, table_every, page_counter):
+    doc = pymupdf.open()
+    photo = pymupdf.Pixmap(pymupdf.csRGB, pymupdf.IRect(0, 0, 200, 200), False)
+    photo.set_rect(photo.irect, (90, 120, 160))
+    for _ in range(pages):
+        page = doc.new_page()
+        page.insert_image(pymupdf.Rect(480, 40, 560, 120), pixmap=photo)
+        page.insert_text((50, 60), "Jane Doe - Software Engineer", fontsize=18, fontname="hebo")
+        page.insert_link({"kind": pymupdf.LINK_URI, "from": pymupdf.Rect(50, 70, 250, 84),
+                          "uri": "https://example.com/jane"})
+        page.insert_text((50, 80), "jane@example.com | example.com/jane", fontsize=10)
+        page.draw_line((50, 95), (560, 95))  # section divider
+        y = 120
+        for _ in range(38):
+            page.insert_text((50, y), " ".join(rng.choices(WORDS, k=12)), fontsize=10)
+            y += 14
+        page_counter[0] += 1
+        if page_counter[0] % table_every == 0:
+            rows, cols, top = 6, 4, 660
+            for r in range(rows + 1):
+                page.draw_line((50, top + r * 18), (530, top + r * 18))
+            for c in range(cols + 1):
+                page.draw_line((50 + c * 120, top), (50 + c * 120, top + rows * 18))
+            for r in range(rows):
+                for c in range(cols):
+                    page.insert_text((55 + c * 120, top + r * 18 + 13), rng.choice(WORDS), fontsize=9)
+    data = doc.tobytes()
+    doc.close()
+    # Base64, one of the two inputs PDFExtractor.extract() accepts
+    return base64.b64encode(data).decode()
+
+
+def open_resume(data):
+    return pymupdf.open(stream=base64.b64decode(data), filetype="pdf")
+
+
+def extract_previous(data):
+    """The extraction loop before modes existed: find_tables() on every page, images included."""
+    doc = open_resume(data)
+    for page in doc:
+        page.find_tables()
+        page.get_text("dict")
+    doc.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--docs", type=int, default=20)
+    parser.add_argument("--pages", type=int, default=3, help="pages per resume")
+    parser.add_argument("--table-every", type=int, default=4, help="put a ruled table on every Nth page")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(1)
+    counter = [0]
+    docs = [make_resume(rng, args.pages, args.table_every, counter) for _ in range(args.docs)]
+    total_pages = args.docs * args.pages
+
+    candidates = 0
+    for data in docs:
+        with open_resume(data) as doc:
+            candidates += sum(page_may_have_tables(page) for page in doc)
+    print(f"{args.docs} resumes, {total_pages} pages, {candidates} pass the table heuristic")
+
+    extractor = PDFExtractor()
+    runs = [("previous", extract_previous)]
+    runs += [(mode, lambda data, mode=mode: extractor.extract(data, mode=mode)) for mode in EXTRACTION_MODES]
+    print(f"{'mode':>10} {'pages/s':>9} {'ms/page':>9}")
+    for name, fn in runs:
+        best = float("inf")
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            for data in docs:
+                fn(data)
+            best = min(best, time.perf_counter() - start)
+        print(f"{name:>10} {total_pages / best:>9.1f} {best / total_pages * 1000:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Benchmark: crawl a local stand-in job board with canned pages, then crawl
+it again to show conditional GETs turning unchanged pages into 304s.
+
+The stand-in server adds a fixed latency per request and fails a share of
+first requests with 503, so the run exercises concurrency and retries.
+
+Usage (from backend/):
+    python benchmarks/bench_scraper.py [--pages 200] [--latency-ms 20]
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Add the backend directory to Python path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.scraper import Scraper, ScraperConfig
+
+SKILLS = ["Python", "SQL", "React", "Docker", "AWS", "Kubernetes", "Pandas", "Communication"]
+
+
+def canned_pages(count):
+    """Index pages linking to job detail pages carrying JSON-LD postings."""
+    pages = {}
+    per_index = 20
+    for index in range(0, count, per_index):
+        links = "".join(f'<li><a href="/jobs/{i}">Job {i}</a></li>' for i in range(index, min(index + per_index, count)))
+        next_link = f'<a href="/?page={index // per_index + 1}">next</a>' if index + per_index < count else ""
+        pages["/" if index == 0 else f"/?page={index // per_index}"] = f"<html><body><ul>{links}</ul>{next_link}</body></html>"
+    for i in range(count):
+        posting = {
+            "@context": "https://schema.org", "@type": "JobPosting",
+            "title": f"Engineer {i % 13}",
+            "description": f"<p>Work with {SKILLS[i % 8]} and {SKILLS[(i * 3) % 8]}.</p>" + "Lorem ipsum. " * 150,
+            "hiringOrganization": {"@type": "Organization", "name": f"Company {i % 40}"},
+            "jobLocation": {"@type": "Place", "address": {"addressLocality": "Nairobi", "addressCountry": "KE"}},
+            "baseSalary": {"currency": "KES", "value": {"minValue": 60000 + i, "maxValue": 90000 + i}},
+            "skills": [SKILLS[i % 8], SKILLS[(i * 3) % 8]],
+        }
+        pages[f"/jobs/{i}"] = (
+            f'<html><head><script type="application/ld+json">{json.dumps(posting)}</script></head>'
+            f'<body><h1>{posting["title"]}</h1><a href="/">back</a></body></html>'
+        )
+    return pages
+
+
+def make_handler(pages, latency, fail_every):
+    hits = {}
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            time.sleep(latency)
+            with lock:
+                hits[self.path] = hits.get(self.path, 0) + 1
+                first_hit = hits[self.path] == 1
+            body = pages.get(self.path)
+            if body is None:
+                self.send_error(404)
+                return
+            if fail_every and first_hit and int(hashlib.md5(self.path.encode()).hexdigest(), 16) % fail_every == 0:
+                self.send_response(503)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            etag = '"' + hashlib.md5(body.encode()).hexdigest() + '"'
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.end_headers()
+                return
+            data = body.encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(data)))
+            self.send_header("ETag", etag)
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+async def crawl(scraper, url):
+    return [posting async for posting in scraper.crawl([url])]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pages", type=int, default=200, help="job detail pages on the stand-in board")
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--fail-every", type=int, default=10, help="1 in N pages answers 503 once (0 disables)")
+    parser.add_argument("--connections", type=int, default=16)
+    parser.add_argument("--per-host", type=int, default=16)
+    parser.add_argument("--rate", type=float, default=0, help="requests/s per host (0 = unlimited)")
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(canned_pages(args.pages), args.latency_ms / 1000, args.fail_every))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/"
+
+    config = ScraperConfig(max_connections=args.connections, per_host=args.per_host,
+                           rate_per_host=args.rate, backoff=0.05, max_pages=args.pages * 2)
+    validators = {}
+    for label in ("cold crawl", "recrawl (conditional GETs)"):
+        scraper = Scraper(config, validators=validators)
+        postings = asyncio.run(crawl(scraper, url))
+        scraper.close()
+        print(f"{label}: {len(postings)} postings parsed; {scraper.stats.summary()}")
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Benchmark: full-text job search latency, FTS5 (BM25 ranking and snippets)
+vs. the LIKE fallback, over a synthetic catalog in a temporary SQLite file.
+
+Usage (from backend/):
+    python benchmarks/bench_search.py [--postings 1000000] [--queries 50] [--like-queries 8]
+"""
+
+import argparse
+import itertools
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+# Add the backend directory to Python path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import Flask
+
+from app.models import db
+from app.services import search
+
+TITLES = ["Software Engineer", "Data Analyst", "Backend Developer", "Frontend Developer",
+          "Data Engineer", "DevOps Engineer", "Product Manager", "Machine Learning Engineer",
+          "QA Engineer", "Mobile Developer", "Security Analyst", "Cloud Architect"]
+SKILLS = ["Python", "SQL", "React", "Docker", "AWS", "Kubernetes", "Pandas", "Java",
+          "Go", "TypeScript", "Terraform", "Communication", "Leadership", "Linux"]
+COMPANIES = [f"Company {i}" for i in range(2_000)]
+
+
+def vocabulary(size, rng):
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    words = set()
+    while len(words) < size:
+        words.add("".join(rng.choices(letters, k=rng.randint(4, 10))))
+    return sorted(words)
+
+
+def populate(engine, postings, rng, batch_size=10_000):
+    words = vocabulary(20_000, rng)
+    # Zipf-like popularity so common words appear in many descriptions
+    cum_weights = list(itertools.accumulate(1.0 / (rank + 10) for rank in range(len(words))))
+    raw = engine.raw_connection()
+    try:
+        cursor = raw.cursor()
+        for start in range(0, postings, batch_size):
+            rows, skills = [], []
+            for posting_id in range(start + 1, min(start + batch_size, postings) + 1):
+                picked = rng.sample(SKILLS, 3)
+                text = rng.choices(words, cum_weights=cum_weights, k=rng.randint(30, 80)) + picked
+                rng.shuffle(text)
+                rows.append((posting_id, rng.choice(TITLES), rng.choice(COMPANIES), " ".join(text)))
+                skills.extend((skill, posting_id) for skill in picked)
+            cursor.executemany(
+                "INSERT INTO job_posting (id, title, company, description) VALUES (?, ?, ?, ?)", rows)
+            cursor.executemany(
+                "INSERT INTO required_skill (skill_name, job_posting_id) VALUES (?, ?)", skills)
+            raw.commit()
+    finally:
+        raw.close()
+    return words
+
+
+def time_queries(queries, runs):
+    timings = []
+    for _ in range(runs):
+        for query, skills in queries:
+            start = time.perf_counter()
+            search.search_postings(query, skills=skills, limit=20)
+            timings.append(time.perf_counter() - start)
+    return timings
+
+
+def report(name, timings):
+    timings = sorted(timings)
+    p95 = timings[int(len(timings) * 0.95) - 1] if len(timings) >= 20 else timings[-1]
+    print(f"{name:>8} {statistics.median(timings) * 1000:>10.2f} {p95 * 1000:>10.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--postings", type=int, default=1_000_000)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--like-queries", type=int, default=8,
+                        help="LIKE scans the whole table, so run fewer of them")
+    args = parser.parse_args()
+    rng = random.Random(5)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        app = Flask(__name__)
+        app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+        db.init_app(app)
+        with app.app_context():
+            db.create_all()
+            search.install(db.engine)
+
+            start = time.perf_counter()
+            words = populate(db.engine, args.postings, rng)
+            print(f"indexed {args.postings:,} postings in {time.perf_counter() - start:.1f}s "
+                  f"(insert with FTS triggers)")
+
+            mid = words[len(words) // 20:len(words) // 4]
+            queries = []
+            for i in range(args.queries):
+                kind = i % 4
+                if kind == 0:
+                    queries.append((rng.choice(mid), []))                      # one word
+                elif kind == 1:
+                    queries.append((" ".join(rng.sample(words[:2_000], 2)), []))  # two words
+                elif kind == 2:
+                    queries.append((rng.choice(mid)[:3] + "*", []))            # prefix
+                else:
+                    queries.append((rng.choice(words[:2_000]), [rng.choice(SKILLS)]))  # with skill filter
+
+            time_queries(queries[:5], 1)  # warm the page cache
+            fts = time_queries(queries, 1)
+            search._fts_engines[str(db.engine.url)] = False
+            # Same mix of query kinds as the FTS run
+            step = max(len(queries) // args.like_queries, 1)
+            like = time_queries(queries[::step][:args.like_queries], 1)
+            db.session.remove()
+            db.engine.dispose()
+
+    print(f"{'path':>8} {'p50 ms':>10} {'p95 ms':>10}")
+    report("fts5", fts)
+    report("like", like)
+    print(f"speedup (p50): {statistics.median(like) / statistics.median(fts):.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Benchmark: vectorized similarity (quick_ratio bound matrix + exact ratio
+on the shortlist) vs. the original difflib loop used by `analyze_gap`
+(one find_similar_skills call per missing skill). Also checks that both
+return the same matches.
+
+Usage (from backend/):
+    python benchmarks/bench_similarity.py [--repeat 3]
+"""
+
+import argparse
+import difflib
+import os
+import random
+import sys
+import time
+
+# Add the backend directory to Python path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.similarity import find_similar
+from app.services.taxonomy import get_taxonomy, normalize_skill_name
+
+
+def difflib_find_similar_skills(target_skill, skill_list, threshold):
+    """The original per-pair SequenceMatcher path, kept for comparison."""
+    similarities = []
+    for skill in skill_list:
+        score = difflib.SequenceMatcher(
+            None, normalize_skill_name(target_skill), normalize_skill_name(skill)
+        ).ratio()
+        if score >= threshold:
+            similarities.append((skill, score))
+    similarities.sort(key=lambda x: x[1], reverse=True)
+    return similarities
+
+
+def skill_pool(size, rng):
+    """Taxonomy skills padded with plausible variants."""
+    base = list(get_taxonomy().skills)
+    suffixes = ["", " Developer", " Framework", " Engineering", " Basics", " Advanced", "js", " 2"]
+    pool = list(base)
+    while len(pool) < size:
+        pool.append(rng.choice(base) + rng.choice(suffixes) + f" {len(pool)}")
+    return pool[:size]
+
+
+def best_of(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=3, help="runs per measurement (best is kept)")
+    parser.add_argument("--threshold", type=float, default=0.5)
+    args = parser.parse_args()
+    rng = random.Random(7)
+
+    print(f"{'missing x user':>15} {'difflib ms':>11} {'matrix ms':>10} {'speedup':>8}")
+    for missing_n, user_n in ((10, 20), (50, 50), (200, 100), (1000, 300)):
+        missing = skill_pool(missing_n, rng)
+        user = skill_pool(user_n, rng)
+        rng.shuffle(user)
+
+        legacy = best_of(
+            lambda: [difflib_find_similar_skills(s, user, args.threshold) for s in missing], args.repeat
+        )
+        vectorized = best_of(lambda: find_similar(missing, user, args.threshold), args.repeat)
+
+        expected = {s: difflib_find_similar_skills(s, user, args.threshold) for s in missing}
+        assert find_similar(missing, user, args.threshold) == expected, "results differ from difflib"
+
+        print(
+            f"{f'{missing_n} x {user_n}':>15} {legacy * 1000:>11.2f} {vectorized * 1000:>10.2f} "
+            f"{legacy / vectorized:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Benchmark: compiled PhraseMatcher vs. the original per-token taxonomy loop
+used by `nlp.extract_skills`, at 50, 500 and 5,000 taxonomy entries.
+
+Usage (from backend/):
+    python benchmarks/bench_skill_matcher.py [--docs 200] [--repeat 3]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import spacy
+
+# Add the backend directory to Python path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.nlp import TECHNICAL_SKILLS, SOFT_SKILLS, clean_text
+from app.services.skill_matcher import SkillMatcher
+
+SAMPLE_RESUME = """
+John is a passionate software engineer skilled in Python, React, and Docker.
+He has experience in building REST APIs with Flask and deploying to AWS and
+Google Cloud. He works on machine learning pipelines with Pandas, NumPy and
+PyTorch, and has strong communication, leadership, and teamwork abilities.
+Contributed to open source projects on GitHub, mentored juniors, and led
+data visualization initiatives with attention to detail and time management.
+"""
+
+
+def legacy_extract_skills(tokenizer, text, technical_skills, soft_skills):
+    """The original token x taxonomy loop, kept verbatim for comparison."""
+    cleaned = clean_text(text)
+    doc = tokenizer(cleaned)
+
+    found_technical = set()
+    found_soft = set()
+
+    for token in doc:
+        token_text = token.text.lower()
+        for skill in technical_skills:
+            if skill.lower() == token_text:
+                found_technical.add(skill)
+        for skill in soft_skills:
+            if skill.lower() == token_text:
+                found_soft.add(skill)
+
+    for skill in technical_skills + soft_skills:
+        if " " in skill and skill.lower() in cleaned:
+            if skill in technical_skills:
+                found_technical.add(skill)
+            else:
+                found_soft.add(skill)
+
+    return {
+        "technical_skills": sorted(found_technical),
+        "soft_skills": sorted(found_soft),
+    }
+
+
+def synthetic_taxonomy(size):
+    """Real skills padded with synthetic single- and multi-word entries."""
+    technical = list(TECHNICAL_SKILLS)
+    soft = list(SOFT_SKILLS)
+    i = 0
+    while len(technical) + len(soft) < size:
+        if i % 3 == 0:
+            soft.append(f"Synthetic Soft Skill {i}")
+        elif i % 3 == 1:
+            technical.append(f"Framework{i}")
+        else:
+            technical.append(f"Platform {i} Engineering")
+        i += 1
+    # Trim to the exact size requested
+    overflow = len(technical) + len(soft) - size
+    if overflow > 0:
+        technical = technical[:len(technical) - overflow]
+    return technical, soft
+
+
+def timed(fn, docs, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for doc in docs:
+            fn(doc)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--docs", type=int, default=200, help="documents per run")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per measurement (best is kept)")
+    args = parser.parse_args()
+
+    # Tokenizer-only pipeline so both paths pay the same tokenization cost
+    nlp = spacy.blank("en")
+    docs = [SAMPLE_RESUME * (1 + i % 4) for i in range(args.docs)]
+
+    print(f"{'entries':>8} {'legacy ms/doc':>14} {'compiled ms/doc':>16} {'build ms':>9} {'speedup':>8}")
+    for size in (50, 500, 5000):
+        technical, soft = synthetic_taxonomy(size)
+
+        start = time.perf_counter()
+        matcher = SkillMatcher(nlp, technical, soft, clean_text)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        legacy = timed(lambda text: legacy_extract_skills(nlp.make_doc, text, technical, soft), docs, args.repeat)
+        compiled = timed(lambda text: matcher(nlp.make_doc(clean_text(text))), docs, args.repeat)
+
+        print(
+            f"{size:>8} {legacy / len(docs) * 1000:>14.3f} {compiled / len(docs) * 1000:>16.3f} "
+            f"{build_ms:>9.1f} {legacy / compiled:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
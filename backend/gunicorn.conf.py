@@ -0,0 +1,23 @@
+# Gunicorn settings for SkillBridge backend: `gunicorn -c gunicorn.conf.py run:app`
+import multiprocessing
+import os
+
+bind = os.environ.get("BIND", "0.0.0.0:5000")
+workers = int(os.environ.get("WEB_CONCURRENCY", multiprocessing.cpu_count() * 2 + 1))
+
+# Load the app (and the spaCy model, via NLP_PRELOAD) once in the master,
+# so forked workers share the model pages copy-on-write.
+preload_app = True
+os.environ.setdefault("NLP_PRELOAD", "1")
+
+
+def post_fork(server, worker):
+    # The preloaded app opened database connections in the master; drop the
+    # inherited pool (without closing the master's connections) so every
+    # worker opens its own. (The analysis cache's SQLite tier reopens itself
+    # per process, see services/cache.py.)
+    from app.models import db
+    from run import app
+
+    with app.app_context():
+        db.engine.dispose(close=False)
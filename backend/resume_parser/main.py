@@ -5,7 +5,6 @@ Simplified version for SkillBridge - only handles PDF text extraction.
 
 import json
 import sys
-import spacy
 import base64
 import fitz  # PyMuPDF
 import unicodedata
@@ -36,12 +35,53 @@ class TableInfo:
 # Constants
 DEFAULT_HEADER_SIZE_THRESHOLD = 11.0
 
+# Extraction modes, cheapest first:
+#   text-only - text lines with font size, boldness and position
+#   layout    - also the links of each page (the default)
+#   full      - also table detection (page.find_tables(), by far the slowest
+#               step, so callers opt in)
+MODE_TEXT_ONLY = "text-only"
+MODE_LAYOUT = "layout"
+MODE_FULL = "full"
+EXTRACTION_MODES = (MODE_TEXT_ONLY, MODE_LAYOUT, MODE_FULL)
+DEFAULT_MODE = MODE_LAYOUT
+
+# get_text("dict") without image blocks; only text lines are read, and
+# embedded images (e.g. a photo) would otherwise be copied into the result
+TEXT_FLAGS = fitz.TEXTFLAGS_DICT & ~fitz.TEXT_PRESERVE_IMAGES
+
+# Line drawings within this many points of level/plumb count as ruling lines
+RULING_TOLERANCE = 3.0
+
+
+def page_may_have_tables(page) -> bool:
+    """
+    Cheap check whether `find_tables()` can find anything on `page`.
+
+    Table detection builds cells from the page's vector graphics, so a table
+    needs both horizontal and vertical ruling lines (or rectangles). Pages
+    without them - most resume pages - are skipped.
+    """
+    has_horizontal = has_vertical = False
+    for drawing in page.get_drawings():
+        for item in drawing["items"]:
+            kind = item[0]
+            if kind in ("re", "qu"):
+                return True
+            if kind == "l":
+                start, end = item[1], item[2]
+                has_horizontal = has_horizontal or abs(start.y - end.y) <= RULING_TOLERANCE
+                has_vertical = has_vertical or abs(start.x - end.x) <= RULING_TOLERANCE
+                if has_horizontal and has_vertical:
+                    return True
+    return False
+
 
 class PDFExtractor:
     """Extracts text and metadata from PDF files."""
     
-    def __init__(self, nlp):
-        """Initialize PDF extractor."""
+    def __init__(self, nlp=None):
+        """Initialize PDF extractor (`nlp` is kept for compatibility; extraction does not use it)."""
         self.nlp = nlp
     
     def normalize_text(self, text: str) -> str:
@@ -80,12 +120,14 @@ class PDFExtractor:
             # For primitive types, return as-is
             return obj
     
-    def extract(self, pdf_path: str) -> Tuple[List[LineMetadata], float, Dict[str, Any]]:
+    def extract(self, pdf_path: str, mode: str = DEFAULT_MODE) -> Tuple[List[LineMetadata], float, Dict[str, Any]]:
         """
         Extracts text and associated metadata from a PDF.
         
         Args:
-            pdf_path (str): The file path to the PDF resume or base64 encoded data
+            pdf_path (str): The file path to the PDF resume, base64 encoded data or PDF bytes
+            mode (str): One of EXTRACTION_MODES; tables are only detected in "full"
+                mode, links from "layout" on
             
         Returns:
             Tuple containing:
@@ -93,6 +135,9 @@ class PDFExtractor:
                 - Header size threshold
                 - Table registry
         """
+        if mode not in EXTRACTION_MODES:
+            raise ValueError(f"Unknown extraction mode '{mode}', expected one of {', '.join(EXTRACTION_MODES)}")
+
         resume_raw_lines_with_metadata = []
         header_size_threshold = DEFAULT_HEADER_SIZE_THRESHOLD
         table_registry = {
@@ -103,8 +148,10 @@ class PDFExtractor:
         }
 
         try:
-            # Handle base64 encoded data or file path
-            if isinstance(pdf_path, str) and len(pdf_path) > 500:  # Likely base64
+            # Handle raw PDF bytes, base64 encoded data or file path
+            if isinstance(pdf_path, (bytes, bytearray)):
+                doc = fitz.open(stream=pdf_path, filetype="pdf")
+            elif isinstance(pdf_path, str) and len(pdf_path) > 500:  # Likely base64
                 try:
                     decoded_bytes = base64.b64decode(pdf_path)
                     doc = fitz.open(stream=decoded_bytes, filetype="pdf")
@@ -117,10 +164,20 @@ class PDFExtractor:
 
             for page_num in range(len(doc)):
                 page = doc.load_page(page_num)
-                
-                
-                # Extract tables
-                tables = page.find_tables()
+
+                # Extract links
+                if mode != MODE_TEXT_ONLY:
+                    for link in page.get_links():
+                        link_info = {
+                            "page_num": page_num,
+                            "uri": link.get("uri"),
+                            "bbox": tuple(link["from"]),
+                        }
+                        table_registry["links"].append(link_info)
+                        table_registry["page_link_map"].setdefault(page_num, []).append(link_info)
+
+                # Extract tables (only on pages with ruling lines)
+                tables = page.find_tables() if mode == MODE_FULL and page_may_have_tables(page) else []
                 for i, table in enumerate(tables):
                     table_id = f"page_{page_num}_table_{i}"
                     # Convert bbox to tuple if it's a Rect object
@@ -133,7 +190,7 @@ class PDFExtractor:
                     table_registry["page_table_map"][page_num].append(table_info)
 
                 # Extract text with formatting
-                blocks = page.get_text("dict")
+                blocks = page.get_text("dict", flags=TEXT_FLAGS)
                 
                 for block in blocks["blocks"]:
                     if "lines" in block:
@@ -194,35 +251,35 @@ class ResumeParser:
         Args:
             spacy_model: SpaCy model to use for NLP processing
         """
-        self.spacy_model = spacy_model            
-        self.nlp = self._load_spacy_model()
-        
-        # Initialize only PDF extractor
-        self.pdf_extractor = PDFExtractor(self.nlp)
-    
+        self.spacy_model = spacy_model
+
+        # Initialize only PDF extractor; it does not need the SpaCy model
+        self.pdf_extractor = PDFExtractor()
+
+    @property
+    def nlp(self):
+        """SpaCy model, loaded on first access from the shared model registry."""
+        return self._load_spacy_model()
+
     def _load_spacy_model(self):
-        """Load SpaCy model."""
-        try:
-            nlp = spacy.load(self.spacy_model)
-            return nlp
-        except OSError:
-            print(f"SpaCy model '{self.spacy_model}' not found. Downloading...")
-            spacy.cli.download(self.spacy_model)
-            nlp = spacy.load(self.spacy_model)
-            return nlp
-        
-    def extract_pdf_content(self, pdf_path: str) -> str:
+        """Load SpaCy model (shared with app.services.nlp, downloaded if missing)."""
+        from app.services.nlp_registry import get_model
+        return get_model(self.spacy_model)
+
+    def extract_pdf_content(self, pdf_path: str, mode: str = DEFAULT_MODE) -> str:
         """
         Extract raw content from PDF with metadata.
 
         Args:
             pdf_path: The file path to the PDF resume or base64 encoded data
+            mode: One of EXTRACTION_MODES; the table registry only lists
+                tables in "full" mode
 
         Returns:
             JSON string containing the extracted raw PDF content and metadata
         """
         # Extract text and metadata from PDF
-        resume_raw_lines, header_size_threshold, table_registry = self.pdf_extractor.extract(pdf_path)
+        resume_raw_lines, header_size_threshold, table_registry = self.pdf_extractor.extract(pdf_path, mode=mode)
         
         if not resume_raw_lines:
             return json.dumps({
@@ -247,13 +304,17 @@ class ResumeParser:
                 "table_id": table.table_id,
                 "bbox": table.bbox
             })
+        serializable_page_table_map = {
+            page_num: [{"table_id": table.table_id, "bbox": table.bbox} for table in tables]
+            for page_num, tables in table_registry["page_table_map"].items()
+        }
 
         result_data = {
             "raw_lines": extracted_lines,
             "header_size_threshold": header_size_threshold,
             "table_registry": {
                 "tables": serializable_tables,
-                "page_table_map": table_registry["page_table_map"],
+                "page_table_map": serializable_page_table_map,
                 "links": table_registry["links"],
                 "page_link_map": table_registry["page_link_map"]
             },
@@ -281,19 +342,21 @@ class ResumeParser:
                         print(f"    - {key}[0]: {type(value[0])}")
             raise
 
-    def extract_pdf_content_for_llm(self, pdf_path: str) -> str:
+    def extract_pdf_content_for_llm(self, pdf_path: str, mode: str = MODE_TEXT_ONLY) -> str:
         """
         Extract and clean PDF content specifically for LLM processing.
         Removes irrelevant metadata and focuses on content and formatting.
 
         Args:
             pdf_path: The file path to the PDF resume or base64 encoded data
+            mode: One of EXTRACTION_MODES; tables and links are not part of
+                the result, so text-only is enough
 
         Returns:
             JSON string containing cleaned data optimized for LLM processing
         """
-        # First extract all the raw data
-        resume_raw_lines, header_size_threshold, table_registry = self.pdf_extractor.extract(pdf_path)
+        # First extract the text lines
+        resume_raw_lines, header_size_threshold, table_registry = self.pdf_extractor.extract(pdf_path, mode=mode)
         
         if not resume_raw_lines:
             return json.dumps({
@@ -324,50 +387,78 @@ class ResumeParser:
 
 
 # CLI compatibility function
-def extract_pdf_content(pdf_path: str) -> str:
+def extract_pdf_content(pdf_path: str, mode: str = DEFAULT_MODE) -> str:
     """
     CLI-compatible function for extracting PDF content.
     Args:
         pdf_path: Path to PDF file
+        mode: One of EXTRACTION_MODES ("full" to detect tables)
         
     Returns:
         JSON string with extracted PDF content and metadata
     """
     parser = ResumeParser()
-    return parser.extract_pdf_content(pdf_path)
+    return parser.extract_pdf_content(pdf_path, mode=mode)
 
 
-def extract_pdf_content_for_llm(pdf_path: str) -> str:
+def extract_pdf_content_for_llm(pdf_path: str, mode: str = MODE_TEXT_ONLY) -> str:
     """
     CLI-compatible function for extracting PDF content optimized for LLM.
     Args:
         pdf_path: Path to PDF file
+        mode: One of EXTRACTION_MODES
         
     Returns:
         JSON string with cleaned PDF content for LLM processing
     """
     parser = ResumeParser()
-    return parser.extract_pdf_content_for_llm(pdf_path)
+    return parser.extract_pdf_content_for_llm(pdf_path, mode=mode)
+
+
+def _pop_mode(args: List[str], default: str) -> str:
+    """Remove a `--mode <mode>` / `--mode=<mode>` option from `args` and return its value."""
+    for i, arg in enumerate(args):
+        if arg == "--mode" and i + 1 < len(args):
+            del args[i]
+            return args.pop(i)
+        if arg.startswith("--mode="):
+            del args[i]
+            return arg.split("=", 1)[1]
+    return default
 
 
 def main():
     """CLI entry point."""
-    if len(sys.argv) > 1:
-        function_name = sys.argv[1]
-        file_data = sys.stdin.buffer.read()
-        if function_name == "extract_pdf_content":
-            if len(sys.argv) > 2:
-                pdf_path = sys.argv[2]
-                print(extract_pdf_content(pdf_path))
-            elif file_data:
-                print(extract_pdf_content(file_data))
-            else:
-                print("Error: PDF path argument missing for extract_pdf_content.")
-        else:
+    functions = {
+        "extract_pdf_content": (extract_pdf_content, DEFAULT_MODE),
+        "extract_pdf_content_for_llm": (extract_pdf_content_for_llm, MODE_TEXT_ONLY),
+    }
+    args = sys.argv[1:]
+    if args:
+        function_name = args.pop(0)
+        if function_name not in functions:
             print(f"Error: Unknown function '{function_name}'")
+            return
+        function, default_mode = functions[function_name]
+        mode = _pop_mode(args, default_mode)
+        if mode not in EXTRACTION_MODES:
+            print(f"Error: Unknown mode '{mode}', expected one of {', '.join(EXTRACTION_MODES)}")
+            return
+        # The PDF comes as a path argument or on stdin (PDF bytes or base64)
+        if args:
+            file_data = args[0]
+        else:
+            file_data = sys.stdin.buffer.read()
+            if not file_data.startswith(b"%PDF"):
+                file_data = file_data.decode("ascii", errors="ignore").strip()
+        if file_data:
+            print(function(file_data, mode=mode))
+        else:
+            print(f"Error: PDF path argument missing for {function_name}.")
     else:
-        print("Usage: python main.py <function_name> [args...]")
-        print("Available functions: extract_pdf_content")
+        print("Usage: python main.py <function_name> [--mode text-only|layout|full] [pdf_path]")
+        print("Available functions: extract_pdf_content, extract_pdf_content_for_llm")
+        print(f"Tables are only detected with --mode {MODE_FULL}")
 
 
 # For CLI usage
@@ -0,0 +1,74 @@
+import json
+
+import pytest
+
+from app import create_app
+from app.services import job_matcher, market_index, taxonomy
+from app.services.auth_cache import token_cache
+from app.services.profiles import profile_cache
+
+ADMIN_KEY = "test-admin-key"
+
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    """An app on a fresh SQLite file, without the sample catalog and with cheap password hashing."""
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'test.db'}")
+    monkeypatch.setenv("SEED_JOB_CATALOG", "0")
+    monkeypatch.setenv("PASSWORD_HASH_METHOD", "pbkdf2:sha256:1000")
+    monkeypatch.setenv("ADMIN_API_KEY", ADMIN_KEY)
+    app = create_app()
+    app.config["TESTING"] = True
+    yield app
+    # Per-process caches and indexes outlive the app
+    profile_cache.clear()
+    token_cache.clear()
+    index = market_index._market_index
+    if index is not None:
+        market_index.catalog_events.unsubscribe(index.on_catalog_change)
+        market_index._market_index = None
+    matcher = job_matcher._job_matcher
+    if matcher is not None:
+        job_matcher.catalog_events.unsubscribe(matcher.on_catalog_change)
+        job_matcher._job_matcher = None
+    with app.app_context():
+        from app.models import db
+        db.session.remove()
+        db.engine.dispose()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def register(client):
+    """Register a user and log in; returns (user id, Authorization headers)."""
+    def register(username="alice", password="secret"):
+        email = f"{username}@example.com"
+        response = client.post("/api/auth/register",
+                               json={"username": username, "email": email, "password": password})
+        assert response.status_code == 201, response.get_json()
+        response = client.post("/api/auth/login", json={"email": email, "password": password})
+        assert response.status_code == 200, response.get_json()
+        body = response.get_json()
+        return body["user"]["id"], {"Authorization": f"Bearer {body['token']}"}
+    return register
+
+
+@pytest.fixture
+def edit_taxonomy(tmp_path):
+    """Reload the skill taxonomy from an edited copy: edit(fn) applies fn to the parsed data."""
+    original = taxonomy._path
+
+    def edit(change):
+        data = json.loads(original.read_text())
+        change(data)
+        path = tmp_path / f"taxonomy-{len(list(tmp_path.glob('taxonomy-*')))}.json"
+        path.write_text(json.dumps(data))
+        taxonomy.configure(path=path)
+        return taxonomy.get_taxonomy()
+
+    yield edit
+    taxonomy.configure(path=original)
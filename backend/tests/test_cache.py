@@ -0,0 +1,44 @@
+import os
+
+import pytest
+
+from app.services.cache import ResultCache
+
+
+def test_disk_entries_are_scoped_by_taxonomy_version(tmp_path):
+    path = str(tmp_path / "results.db")
+    old, new = ResultCache(path=path), ResultCache(path=path)  # two workers on different versions
+
+    assert old.get_or_compute("skills", "python", "v1", lambda text: ["v1", text]) == ["v1", "python"]
+    assert new.get_or_compute("skills", "python", "v2", lambda text: ["v2", text]) == ["v2", "python"]
+    # Neither wiped the other's entry
+    fresh = ResultCache(path=path)
+    assert fresh.get_or_compute("skills", "python", "v1", pytest.fail) == ["v1", "python"]
+    assert fresh.get_or_compute("skills", "python", "v2", pytest.fail) == ["v2", "python"]
+    assert fresh.stats()["disk_hits"] == 2
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs fork()")
+def test_forked_workers_open_their_own_connection(tmp_path):
+    cache = ResultCache(path=str(tmp_path / "results.db"))
+    cache.get_or_compute("skills", "sql", "v1", lambda text: [text])
+    parent_connection = cache._db
+
+    read, write = os.pipe()
+    pid = os.fork()
+    if pid == 0:  # the worker
+        try:
+            cache._memory.clear()
+            hit = cache.get_or_compute("skills", "sql", "v1", lambda text: None) == ["sql"]
+            cache.get_or_compute("skills", "go", "v1", lambda text: [text])
+            os.write(write, b"1" if hit and cache._db is not parent_connection else b"0")
+        finally:
+            os._exit(0)
+    os.close(write)
+    assert os.read(read, 1) == b"1"
+    os.waitpid(pid, 0)
+
+    # The parent's connection still works and sees the worker's entry
+    cache._memory.clear()
+    assert cache._db is parent_connection
+    assert cache.get_or_compute("skills", "go", "v1", pytest.fail) == ["go"]
@@ -0,0 +1,128 @@
+from app.models import db, JobPosting, RequiredSkill, SkillDemand
+from app.services import demand, importer
+
+
+def seed(app, postings):
+    records = [importer.normalize_record(p) for p in postings]
+    with app.app_context():
+        importer.import_records(records, extract_skills=False, dedupe_policy="off")
+
+
+POSTINGS = [
+    {"title": "Backend Developer", "description": "Services in Python", "location": "Nairobi",
+     "skills": ["Python", "SQL"]},
+    {"title": "Backend Developer", "description": "APIs in Python", "location": "Remote", "skills": ["Python"]},
+    {"title": "Data Analyst", "description": "Reports", "location": "Nairobi", "skills": ["SQL", "Excel"]},
+]
+
+
+def test_demand_endpoint_reads_the_table(app, client):
+    seed(app, POSTINGS)
+    body = client.get("/api/market/demand").get_json()
+    assert body["total_postings"] == 3
+    assert body["demand"] == [{"skill": "Python", "count": 2}, {"skill": "SQL", "count": 2},
+                              {"skill": "Excel", "count": 1}]
+
+    body = client.get("/api/market/demand", query_string={"by": "location", "limit": 1}).get_json()
+    assert body["demand"] == {"Nairobi": [{"skill": "SQL", "count": 2}], "Remote": [{"skill": "Python", "count": 1}]}
+
+    body = client.get("/api/market/demand", query_string={"by": "title", "value": "Data Analyst"}).get_json()
+    assert [d["skill"] for d in body["demand"]] == ["Excel", "SQL"]
+    assert client.get("/api/market/demand", query_string={"by": "company"}).status_code == 400
+
+
+def test_demand_limit_is_validated_and_capped(app, client):
+    seed(app, POSTINGS)
+    for limit in (0, -1, "ten"):
+        for query in ({}, {"by": "title"}):
+            assert client.get("/api/market/demand", query_string={**query, "limit": limit}).status_code == 400
+    body = client.get("/api/market/demand", query_string={"limit": 10 ** 9}).get_json()
+    assert len(body["demand"]) == 3
+
+
+def test_total_postings_is_kept_with_the_counts(app, client):
+    seed(app, POSTINGS + [{"title": "Intern", "description": "Learn on the job", "skills": []}])
+    with app.app_context():
+        assert demand.total_postings() == 4
+        db.session.delete(db.session.get(JobPosting, 1))
+        db.session.add(JobPosting(title="Tester", description="Manual testing"))
+        db.session.add(JobPosting(title="Designer", description="Figma"))
+        db.session.commit()
+        assert demand.check() == []
+
+        # Read from the table: a stale count shows up in the endpoint until rebuilt
+        db.session.execute(db.update(SkillDemand).where(SkillDemand.scope == demand.SCOPE_TOTAL).values(postings=9))
+        db.session.commit()
+    assert client.get("/api/market/demand").get_json()["total_postings"] == 9
+    with app.app_context():
+        assert demand.check() == ["total postings: table 9, database 5"]
+        demand.rebuild()
+    assert client.get("/api/market/demand").get_json()["total_postings"] == 5
+
+
+def test_orm_writes_keep_the_table_consistent(app):
+    seed(app, POSTINGS)
+    with app.app_context():
+        posting = db.session.get(JobPosting, 1)
+        posting.title = "Platform Engineer"
+        posting.required_skills.append(RequiredSkill(skill_name="Docker"))
+        db.session.commit()
+        db.session.delete(db.session.get(JobPosting, 3))
+        db.session.commit()
+        db.session.add(JobPosting(title="Data Analyst", description="Dashboards", location="Remote",
+                                  required_skills=[RequiredSkill(skill_name="Excel")]))
+        db.session.commit()
+
+        assert demand.check() == []
+        assert demand.top_demand("title", "Platform Engineer") == [("Docker", 1), ("Python", 1), ("SQL", 1)]
+        assert demand.top_demand("location", "Remote") == [("Excel", 1), ("Python", 1)]
+
+
+def test_rolled_back_writes_leave_the_table_alone(app):
+    seed(app, POSTINGS)
+    with app.app_context():
+        posting = db.session.get(JobPosting, 2)
+        posting.required_skills.append(RequiredSkill(skill_name="Go"))
+        db.session.flush()
+        db.session.rollback()
+        assert demand.check() == []
+
+
+def test_dedupe_and_merge_keep_the_table_consistent(app):
+    with app.app_context():
+        description = "Build and operate data pipelines in Python for our analytics platform " * 3
+        importer.import_records([
+            importer.normalize_record({"title": "Data Engineer", "description": description, "skills": ["Python"]}),
+            importer.normalize_record({"title": "Data Engineer", "description": description, "skills": ["Airflow"]}),
+        ], extract_skills=False, dedupe_policy="merge")
+        assert db.session.scalar(db.select(db.func.count(JobPosting.id))) == 1
+        assert demand.check() == []
+        assert demand.top_demand() == [("Airflow", 1), ("Python", 1)]
+
+
+def test_catalog_dedupe_keeps_the_table_consistent(app):
+    description = "Design and run cloud infrastructure with Terraform and Kubernetes " * 3
+    postings = [{"title": "DevOps Engineer", "description": description, "location": "Remote", "skills": [skill]}
+                for skill in ("Terraform", "Kubernetes", "Terraform")]
+    seed(app, postings)
+    result = app.test_cli_runner().invoke(args=["dedupe-jobs", "--merge"])
+    assert "2 duplicates removed" in result.output
+    with app.app_context():
+        assert demand.check() == []
+        assert demand.top_demand("location", "Remote") == [("Kubernetes", 1), ("Terraform", 1)]
+
+
+def test_rebuild_command_repairs_the_shared_table(app):
+    seed(app, POSTINGS)
+    with app.app_context():
+        db.session.execute(db.update(SkillDemand).where(SkillDemand.skill_name == "SQL").values(postings=7))
+        db.session.commit()
+        assert len(demand.check()) == 4  # overall, both titles and Nairobi
+
+    runner = app.test_cli_runner()
+    result = runner.invoke(args=["rebuild-demand", "--check-only"])
+    assert "4 mismatching demand counts" in result.output
+    result = runner.invoke(args=["rebuild-demand"])
+    assert "0 mismatches left" in result.output
+    with app.app_context():
+        assert demand.check() == []
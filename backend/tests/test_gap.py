@@ -0,0 +1,11 @@
+import pytest
+
+
+@pytest.mark.parametrize("payload", [
+    {"job_titles": "Data Analyst"},
+    {"job_titles": [["Data Analyst"]]},
+    {"job_titles": ["Data Analyst", {"title": "x"}]},
+    {"resume_text": ["Python"]},
+])
+def test_bulk_gap_rejects_invalid_requests(client, payload):
+    assert client.post("/api/gap/analyze/bulk", json=payload).status_code == 400
@@ -0,0 +1,98 @@
+import json
+
+import pytest
+
+from app.models import db, JobPosting, RequiredSkill
+from app.services import importer
+
+
+def write_jsonl(path, records):
+    path.write_text("\n".join(r if isinstance(r, str) else json.dumps(r) for r in records) + "\n")
+    return path
+
+
+def test_normalize_record_coerces_fields():
+    record = importer.normalize_record({
+        "title": " Data Engineer ",
+        "description": "Build pipelines",
+        "salary_range": "Ksh.80,000 - Ksh.120,000",
+        "skills": "Python; SQL",
+    })
+    assert record["title"] == "Data Engineer"
+    assert (record["salary_min"], record["salary_max"]) == (80000, 120000)
+    assert record["skills"] == ["Python", "SQL"]
+    assert record["company"] is None
+
+
+@pytest.mark.parametrize("raw", [
+    {"title": 5, "description": "x"},
+    {"title": "Dev", "description": ["x"]},
+    {"title": "Dev", "description": "x", "company": {"name": "Acme"}},
+    {"title": "Dev", "description": "x", "salary_range": 80000},
+    {"title": "Dev", "description": "x", "skills": 3},
+    {"title": "Dev", "description": "x", "salary_min": "a lot"},
+    {"title": "", "description": "x"},
+])
+def test_normalize_record_rejects_invalid_values(raw):
+    with pytest.raises(ValueError):
+        importer.normalize_record(raw)
+
+
+def test_bad_lines_are_counted_not_fatal(app, tmp_path):
+    path = write_jsonl(tmp_path / "jobs.jsonl", [
+        {"title": "Backend Developer", "description": "Python APIs and SQL databases", "skills": ["Python", "SQL"]},
+        {"title": 5, "description": "numeric title"},
+        "not json",
+        ["not", "an", "object"],
+        {"title": "Frontend Developer", "description": "React user interfaces", "skills": ["React"]},
+    ])
+    with app.app_context():
+        stats = importer.import_file(path, extract_skills=False, dedupe_policy="off")
+        assert (stats.read, stats.imported, stats.skipped) == (5, 2, 3)
+        assert [e.split(":")[1] for e in stats.errors] == ["2", "3", "4"]
+        assert db.session.scalar(db.select(db.func.count(JobPosting.id))) == 2
+        skills = db.session.scalars(db.select(RequiredSkill.skill_name).order_by(RequiredSkill.skill_name)).all()
+        assert skills == ["Python", "React", "SQL"]
+
+
+def test_import_commits_per_batch(app):
+    records = [
+        importer.normalize_record({"title": f"Role {i}", "description": f"Unique description number {i} " * 5})
+        for i in range(5)
+    ]
+    batches = []
+    with app.app_context():
+        stats = importer.import_records(records, batch_size=2, extract_skills=False, dedupe_policy="off",
+                                        progress=lambda s: batches.append(s.imported))
+        assert stats.batches == 3
+        assert batches == [2, 4, 5]
+
+
+def test_skills_are_extracted_outside_the_write_transaction(app, monkeypatch):
+    checked_out = []
+
+    def extract(batch):
+        checked_out.append(db.engine.pool.checkedout())
+        for record in batch:
+            record["skills"] = record["skills"] + ["Python"]
+
+    monkeypatch.setattr(importer, "_with_extracted_skills", extract)
+    records = [importer.normalize_record({"title": "Developer", "description": f"Build services, team {i} " * 5})
+               for i in range(3)]
+    with app.app_context():
+        db.engine.dispose()
+        stats = importer.import_records(records, extract_skills=True, dedupe_policy="skip")
+        assert stats.imported == 3
+        assert checked_out == [0]
+        assert db.session.scalar(db.select(db.func.count(RequiredSkill.id))) == 3
+
+
+def test_explicit_zero_threshold_is_not_replaced_by_the_default(app, monkeypatch):
+    thresholds = []
+    split = importer._split_duplicates
+    monkeypatch.setattr(importer, "_split_duplicates",
+                        lambda conn, batch, threshold: thresholds.append(threshold) or split(conn, batch, threshold))
+    records = [importer.normalize_record({"title": "Developer", "description": "Build services"})]
+    with app.app_context():
+        importer.import_records(records, extract_skills=False, dedupe_policy="skip", dedupe_threshold=0.0)
+    assert thresholds == [0.0]
@@ -0,0 +1,57 @@
+from app.services import importer
+from app.services.interner import get_skill_interner
+from app.services.job_matcher import get_job_matcher
+from app.services.market_index import get_market_index
+from app.utils import compare_skills
+
+
+def add_alias(skill, alias):
+    def change(data):
+        next(s for s in data["skills"] if s["name"] == skill)["aliases"].append(alias)
+    return change
+
+
+def test_compare_skills_follows_taxonomy_reloads(edit_taxonomy):
+    assert compare_skills(["py"], ["Python", "SQL"]) == ["Python", "SQL"]
+    before = get_skill_interner()
+
+    edit_taxonomy(add_alias("Python", "py"))
+    assert get_skill_interner() is not before
+    assert get_skill_interner().version != before.version
+    assert compare_skills(["py"], ["Python", "SQL"]) == ["SQL"]
+
+
+def test_compare_skills_interns_nothing():
+    interner = get_skill_interner()
+    size = len(interner)
+    compare_skills([f"user skill {i}" for i in range(100)], [f"market skill {i}" for i in range(100)])
+    assert len(interner) == size
+
+
+def test_job_matcher_is_rebuilt_after_a_reload(app, edit_taxonomy):
+    records = [importer.normalize_record({"title": "Backend Developer", "description": "APIs",
+                                          "skills": ["Python", "SQL"]})]
+    with app.app_context():
+        importer.import_records(records, extract_skills=False, dedupe_policy="off")
+        matcher = get_job_matcher()
+        assert matcher.top_k(["py"]) == []
+
+        edit_taxonomy(add_alias("Python", "py"))
+        rebuilt = get_job_matcher()
+        assert rebuilt is not matcher and len(rebuilt) == 1
+        assert [m.matched_skills for m in rebuilt.top_k(["py"])] == [["Python"]]
+
+
+def test_market_index_is_rebuilt_after_a_reload(app, client, edit_taxonomy):
+    records = [importer.normalize_record({"title": "Data Engineer", "description": "Pipelines",
+                                          "skills": ["Python", "py", "Airflow"]})]
+    with app.app_context():
+        importer.import_records(records, extract_skills=False, dedupe_policy="off")
+        before = get_market_index()
+        assert before.interner.to_names(before.title_bits("Data Engineer")) == ["Python", "py", "Airflow"]
+
+        edit_taxonomy(add_alias("Python", "py"))
+        index = get_market_index()
+        assert index is not before
+        # The two spellings are now one skill
+        assert index.interner.to_names(index.title_bits("Data Engineer")) == ["Python", "Airflow"]
@@ -0,0 +1,106 @@
+import math
+import random
+
+import pytest
+
+from app.models import db, JobPosting
+from app.services import importer
+from app.services.interner import SkillInterner
+from app.services.job_matcher import COVERAGE_WEIGHT, OVERLAP_WEIGHT, JobMatcher
+
+
+def seed(app, postings):
+    records = [importer.normalize_record(p) for p in postings]
+    with app.app_context():
+        importer.import_records(records, extract_skills=False, dedupe_policy="off")
+
+
+def brute_force(postings, user, k):
+    """Reference scoring: every posting, plain Python."""
+    total = len(postings)
+    df = {}
+    for skills in postings.values():
+        for skill in skills:
+            df[skill] = df.get(skill, 0) + 1
+    known = {s for s in user if s in df}
+    idf = {s: math.log((total + 1) / (df[s] + 1)) + 1.0 for s in known}
+    scored = []
+    for posting_id, skills in postings.items():
+        shared = known & skills
+        if shared:
+            score = (COVERAGE_WEIGHT * len(shared) / len(skills)
+                     + OVERLAP_WEIGHT * sum(idf[s] for s in shared) / sum(idf.values()))
+            scored.append((-score, -len(shared) / len(skills), posting_id))
+    return [posting_id for _, _, posting_id in sorted(scored)[:k]]
+
+
+def test_top_k_matches_brute_force_scoring():
+    rng = random.Random(7)
+    vocabulary = [f"skill-{i}" for i in range(40)]
+    matcher = JobMatcher(SkillInterner())
+    postings = {}
+    for posting_id in range(1, 301):
+        postings[posting_id] = set(rng.sample(vocabulary, rng.randint(1, 8)))
+        matcher.add_posting(posting_id, f"Job {posting_id}", postings[posting_id])
+    # Replaced and removed postings free their slots for reuse
+    for posting_id in rng.sample(sorted(postings), 50):
+        matcher.remove_posting(posting_id)
+        del postings[posting_id]
+    for posting_id in rng.sample(sorted(postings), 50):
+        postings[posting_id] = set(rng.sample(vocabulary, rng.randint(1, 8)))
+        matcher.add_posting(posting_id, f"Job {posting_id}", postings[posting_id])
+    assert len(matcher) == 250
+
+    for _ in range(20):
+        user = set(rng.sample(vocabulary, rng.randint(1, 10))) | {"unknown skill"}
+        matches = matcher.top_k(user, k=15)
+        assert [m.posting_id for m in matches] == brute_force(postings, user, 15)
+        for m in matches:
+            assert set(m.matched_skills) == user & postings[m.posting_id]
+            assert set(m.missing_skills) == postings[m.posting_id] - user
+
+
+def test_scores_and_aliases():
+    matcher = JobMatcher(SkillInterner())
+    matcher.add_posting(1, "Frontend Developer", ["JavaScript", "React"])
+    matcher.add_posting(2, "Backend Developer", ["Python", "SQL"])
+
+    [match] = matcher.top_k(["JS", "React"])
+    assert (match.posting_id, match.score, match.coverage) == (1, 1.0, 1.0)
+    assert match.to_dict()["coverage"] == 100.0
+    assert matcher.top_k(["Go"]) == []
+    assert matcher.top_k(["React"], k=0) == []
+    assert [m.posting_id for m in matcher.top_k(["React", "SQL"], min_score=0.9)] == []
+
+
+def test_match_endpoint_follows_the_catalog(app, client):
+    seed(app, [
+        {"title": "Backend Developer", "description": "APIs", "skills": ["Python", "SQL", "Docker"]},
+        {"title": "Data Analyst", "description": "Reports", "skills": ["SQL", "Excel"]},
+    ])
+    body = client.post("/api/jobs/match", json={"skills": ["Python", "SQL"], "k": 5}).get_json()
+    assert body["total_postings"] == 2
+    assert [m["title"] for m in body["matches"]] == ["Backend Developer", "Data Analyst"]
+    assert body["matches"][0]["missing_skills"] == ["Docker"]
+
+    # Imports and ORM writes reach the shared matcher
+    seed(app, [{"title": "Python Developer", "description": "Scripts", "skills": ["Python", "SQL"]}])
+    with app.app_context():
+        analyst = db.session.scalars(db.select(JobPosting).where(JobPosting.title == "Data Analyst")).one()
+        db.session.delete(analyst)
+        db.session.commit()
+    body = client.post("/api/jobs/match", json={"skills": ["Python", "SQL"]}).get_json()
+    assert body["total_postings"] == 2
+    assert [m["title"] for m in body["matches"]] == ["Python Developer", "Backend Developer"]
+    assert body["matches"][0]["score"] == 1.0
+
+
+@pytest.mark.parametrize("payload", [
+    {},
+    {"skills": "Python"},
+    {"skills": [5]},
+    {"skills": ["Python"], "resume_text": ["Python"]},
+    {"skills": ["Python"], "k": "ten"},
+])
+def test_match_endpoint_rejects_invalid_requests(client, payload):
+    assert client.post("/api/jobs/match", json=payload).status_code == 400
@@ -0,0 +1,105 @@
+import sqlite3
+
+from app import create_app
+from app.models import db, JobPosting
+from app.services import importer
+
+
+def seed(app, postings):
+    records = [importer.normalize_record(p) for p in postings]
+    with app.app_context():
+        importer.import_records(records, extract_skills=False, dedupe_policy="off")
+
+
+POSTINGS = [
+    {"title": "Backend Developer", "description": f"Posting {i} about services", "location": location,
+     "salary_range": salary, "skills": skills}
+    for i, (location, salary, skills) in enumerate([
+        ("Nairobi", "Ksh.80,000 - Ksh.120,000", ["Python", "SQL"]),
+        ("Remote", "Ksh.150,000 - Ksh.200,000", ["Python"]),
+        ("Nairobi", None, ["Go"]),
+        ("Remote", "Ksh.40,000 - Ksh.60,000", ["Python", "Docker"]),
+        ("Mombasa", "Ksh.90,000 - Ksh.110,000", ["SQL"]),
+    ])
+]
+
+
+def test_keyset_pages_cover_every_posting_once(app, client):
+    seed(app, POSTINGS)
+    seen, cursor, pages = [], None, 0
+    while True:
+        params = {"limit": 2, "fields": "id,title"}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get("/api/jobdata", query_string=params)
+        assert response.status_code == 200
+        seen += [p["id"] for p in response.get_json()]
+        pages += 1
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            assert "Link" not in response.headers
+            break
+        assert 'rel="next"' in response.headers["Link"]
+    assert pages == 3
+    assert seen == sorted(seen) and len(seen) == len(set(seen)) == 5
+
+
+def test_filters(app, client):
+    seed(app, POSTINGS)
+
+    def ids(**params):
+        return [p["id"] for p in client.get("/api/jobdata", query_string=params).get_json()]
+
+    assert ids(skill="Python") == [1, 2, 4]
+    assert ids(skill=["Python", "SQL"]) == [1]
+    assert ids(location="Nairobi") == [1, 3]
+    assert ids(min_salary=100000) == [1, 2, 5]
+    assert ids(min_salary=100000, max_salary=100000) == [1, 5]
+    assert client.get("/api/jobdata", query_string={"limit": "many"}).status_code == 400
+    assert client.get("/api/jobdata", query_string={"fields": "secret"}).status_code == 400
+
+
+def test_unchanged_page_answers_304(app, client):
+    seed(app, POSTINGS)
+    first = client.get("/api/jobdata")
+    assert first.headers["ETag"] and first.headers["Last-Modified"]
+    again = client.get("/api/jobdata", headers={"If-None-Match": first.headers["ETag"]})
+    assert again.status_code == 304
+
+
+def test_pagination_headers_are_exposed_to_other_origins(app, client):
+    seed(app, POSTINGS)
+    response = client.get("/api/jobdata", query_string={"limit": 1},
+                          headers={"Origin": "http://localhost:3000"})
+    exposed = {h.strip() for h in response.headers["Access-Control-Expose-Headers"].split(",")}
+    assert {"X-Next-Cursor", "Link", "ETag"} <= exposed
+
+
+def test_upgrade_backfills_columns_added_to_old_tables(tmp_path, monkeypatch):
+    path = tmp_path / "old.db"
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE job_posting (id INTEGER PRIMARY KEY, title VARCHAR(200) NOT NULL, "
+                 "description TEXT NOT NULL, company VARCHAR(200), location VARCHAR(200), "
+                 "salary_range VARCHAR(100), requirements TEXT)")
+    conn.executemany("INSERT INTO job_posting (title, description, salary_range) VALUES (?, ?, ?)", [
+        ("Analyst", "Reports", "Ksh.50,000 - Ksh.70,000"),
+        ("Intern", "Learning", None),
+    ])
+    conn.commit()
+    conn.close()
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{path}")
+    monkeypatch.setenv("SEED_JOB_CATALOG", "0")
+
+    app = create_app()
+    with app.app_context():
+        rows = db.session.execute(
+            db.select(JobPosting.title, JobPosting.salary_min, JobPosting.salary_max, JobPosting.updated_at)
+            .order_by(JobPosting.id)
+        ).all()
+        db.engine.dispose()
+    assert [(r.title, r.salary_min, r.salary_max) for r in rows] == [("Analyst", 50000, 70000), ("Intern", None, None)]
+    assert all(r.updated_at is not None for r in rows)
+
+    response = app.test_client().get("/api/jobdata", query_string={"max_salary": 60000})
+    assert [p["title"] for p in response.get_json()] == ["Analyst"]
+    assert response.headers["Last-Modified"]
@@ -0,0 +1,74 @@
+import threading
+
+import pytest
+from werkzeug.security import generate_password_hash
+
+from app.models import db, User
+from app.services import passwords
+from app.services.passwords import PasswordHasher, PasswordHasherBusy, password_hasher
+
+
+@pytest.mark.parametrize("method", ["scrypt", "scrypt:16384:8:1", "pbkdf2", "pbkdf2:sha512", "pbkdf2:sha256:1000"])
+def test_method_prefix_matches_werkzeug(method):
+    assert passwords.method_prefix(method) == generate_password_hash("x", method=method).split("$", 1)[0]
+
+
+def test_unknown_method_is_rejected_when_configured():
+    with pytest.raises(ValueError):
+        PasswordHasher(method="md5")
+
+
+def test_login_rehashes_outdated_hashes(app, client, register):
+    user_id, _ = register(password="secret")
+    password_hasher.configure(method="pbkdf2:sha256:2000")
+    assert client.post("/api/auth/login", json={"email": "alice@example.com", "password": "secret"}).status_code == 200
+    with app.app_context():
+        stored = db.session.get(User, user_id).password_hash
+    assert stored.startswith("pbkdf2:sha256:2000$")
+    assert password_hasher.stats()["rehashed"] == 1
+    # The upgraded hash still verifies and is not rehashed again
+    assert client.post("/api/auth/login", json={"email": "alice@example.com", "password": "secret"}).status_code == 200
+    assert password_hasher.stats()["rehashed"] == 1
+
+
+@pytest.fixture
+def blocked_hashing(monkeypatch):
+    """Hashes wait until `release` is set; `started` is set once one is running."""
+    started, release = threading.Event(), threading.Event()
+
+    def slow_hash(password, method):
+        started.set()
+        release.wait(5)
+        return generate_password_hash(password, method=method)
+
+    monkeypatch.setattr(passwords, "generate_password_hash", slow_hash)
+    yield started, release
+    release.set()
+
+
+def test_waiting_past_the_timeout_answers_503(client, blocked_hashing):
+    password_hasher.configure(timeout=0.01)
+    response = client.post("/api/auth/register",
+                           json={"username": "alice", "email": "alice@example.com", "password": "secret"})
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+    assert password_hasher.stats()["timed_out"] == 1
+
+
+def test_saturated_pool_answers_503(client, blocked_hashing):
+    password_hasher.configure(max_pending=1)
+    started, release = blocked_hashing
+    waiting = threading.Thread(target=password_hasher.hash, args=("other",))
+    waiting.start()
+    try:
+        assert started.wait(5)
+        response = client.post("/api/auth/register",
+                               json={"username": "alice", "email": "alice@example.com", "password": "secret"})
+        assert response.status_code == 503
+        # Callers outside a request get the exception the route turns into a 503
+        with pytest.raises(PasswordHasherBusy):
+            password_hasher.hash("third")
+        assert password_hasher.stats()["rejected"] == 2
+    finally:
+        release.set()
+        waiting.join()
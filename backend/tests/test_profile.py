@@ -0,0 +1,136 @@
+from contextlib import contextmanager
+
+from sqlalchemy import event
+
+from app.models import db
+from app.routes import profile as profile_routes
+from app.services import auth_cache, profiles
+from app.services.auth_cache import TokenCache, token_cache
+from app.services.profiles import ProfileCache, profile_cache
+
+
+@contextmanager
+def count_queries(app):
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    with app.app_context():
+        engine = db.engine
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
+def is_version_lookup(statement):
+    return statement.startswith("SELECT user.profile_version")
+
+
+def test_repeated_reads_only_check_the_version(app, client, register):
+    _, headers = register()
+    client.post("/api/profile/skills", headers=headers, json={"skills": [{"name": "Python"}]})
+    assert client.get("/api/profile/profile", headers=headers).status_code == 200
+
+    with count_queries(app) as statements:
+        for _ in range(3):
+            assert client.get("/api/profile/profile", headers=headers).get_json()["skills"] == [
+                {"name": "Python", "type": "technical"}]
+            assert client.get("/api/profile/skills", headers=headers).status_code == 200
+    assert len(statements) == 6 and all(is_version_lookup(s) for s in statements)
+    assert token_cache.stats()["hits"] >= 6
+    assert profile_cache.stats()["hits"] >= 6
+
+
+def test_profile_is_loaded_with_its_skills_in_one_query(app, client, register):
+    _, headers = register()
+    client.post("/api/profile/skills", headers=headers,
+                json={"skills": [{"name": "Python"}, {"name": "SQL"}, {"name": "Teamwork", "type": "soft"}]})
+    client.get("/api/profile/skills", headers=headers)
+    profile_cache.clear()  # token still cached
+    with count_queries(app) as statements:
+        body = client.get("/api/profile/profile", headers=headers).get_json()
+    assert len(body["skills"]) == 3
+    assert len(statements) == 2 and is_version_lookup(statements[0])
+
+
+def test_writes_invalidate_the_cached_profile(client, register):
+    _, headers = register()
+    client.get("/api/profile/profile", headers=headers)
+    response = client.put("/api/profile/profile", headers=headers,
+                          json={"bio": "Data engineer", "education": [{"school": "UoN"}]})
+    assert response.get_json()["profile"]["bio"] == "Data engineer"
+    body = client.get("/api/profile/profile", headers=headers).get_json()
+    assert (body["bio"], body["education"]) == ("Data engineer", [{"school": "UoN"}])
+
+    client.put("/api/profile/skills", headers=headers, json={"skills": [{"name": "Go"}]})
+    assert client.get("/api/profile/profile", headers=headers).get_json()["skills"][0]["name"] == "Go"
+
+
+def test_password_change_drops_cached_tokens(client, register):
+    _, headers = register(password="secret")
+    client.get("/api/profile/profile", headers=headers)
+    assert token_cache.stats()["size"] == 1
+    response = client.post("/api/password/change_password", headers=headers,
+                           json={"current": "secret", "new": "better", "confirm": "better"})
+    assert response.status_code == 200
+    assert token_cache.stats()["size"] == 0
+    assert client.post("/api/auth/login", json={"email": "alice@example.com", "password": "secret"}).status_code == 401
+    assert client.post("/api/auth/login", json={"email": "alice@example.com", "password": "better"}).status_code == 200
+
+
+def test_deleted_profile_is_unauthorized(client, register):
+    _, headers = register()
+    client.get("/api/profile/profile", headers=headers)
+    assert client.delete("/api/profile/profile", headers=headers).status_code == 200
+    assert client.get("/api/profile/profile", headers=headers).status_code == 401
+    assert client.get("/api/profile/skills", headers=headers).status_code == 401
+
+
+def test_user_deleted_by_another_worker_is_unauthorized(app, client, register):
+    user_id, headers = register()
+    client.get("/api/profile/profile", headers=headers)
+    # Another worker deletes the user: this worker's token cache still has them
+    with app.app_context():
+        db.session.execute(db.text("DELETE FROM user WHERE id = :id"), {"id": user_id})
+        db.session.commit()
+    profile_cache.clear()
+
+    assert client.get("/api/profile/skills", headers=headers).status_code == 401
+    assert token_cache.stats()["size"] == 0
+    assert client.get("/api/profile/profile", headers=headers).status_code == 401
+    assert client.put("/api/profile/profile", headers=headers, json={"bio": "x"}).status_code == 401
+
+
+@contextmanager
+def worker(monkeypatch, caches):
+    """Serve requests with one simulated worker's own token and profile caches."""
+    tokens, profiles_ = caches
+    with monkeypatch.context() as m:
+        m.setattr(auth_cache, "token_cache", tokens)
+        m.setattr(profile_routes, "token_cache", tokens)
+        m.setattr(profiles, "profile_cache", profiles_)
+        m.setattr(profile_routes, "profile_cache", profiles_)
+        yield
+
+
+def test_writes_on_one_worker_are_read_on_another(client, register, monkeypatch):
+    _, headers = register()
+    first, second = (TokenCache(), ProfileCache()), (TokenCache(), ProfileCache())
+    for caches in (first, second):
+        with worker(monkeypatch, caches):
+            assert client.get("/api/profile/profile", headers=headers).get_json()["bio"] is None
+            client.get("/api/profile/skills", headers=headers)
+
+    with worker(monkeypatch, first):
+        client.put("/api/profile/profile", headers=headers, json={"bio": "Data engineer"})
+        client.put("/api/profile/skills", headers=headers, json={"skills": [{"name": "Go"}]})
+
+    with worker(monkeypatch, second):
+        # The second worker's token snapshot still has the old profile_version
+        assert second[0].stats()["size"] == 1
+        assert client.get("/api/profile/profile", headers=headers).get_json()["bio"] == "Data engineer"
+        assert [s["name"] for s in client.get("/api/profile/skills", headers=headers).get_json()["skills"]] == ["Go"]
+        assert second[0].stats()["hits"] >= 2
@@ -0,0 +1,73 @@
+import base64
+import io
+import json
+import sys
+from pathlib import Path
+
+import fitz
+import pytest
+
+from resume_parser import main as cli
+from resume_parser.main import PDFExtractor, ResumeParser, extract_pdf_content
+
+
+@pytest.fixture
+def resume_pdf(tmp_path):
+    """A one-page resume with a link and a ruled 3x3 table."""
+    doc = fitz.open()
+    page = doc.new_page()
+    page.insert_text((50, 60), "Jane Doe - Software Engineer", fontsize=18, fontname="hebo")
+    page.insert_link({"kind": fitz.LINK_URI, "from": fitz.Rect(50, 70, 250, 84), "uri": "https://example.com/jane"})
+    page.insert_text((50, 80), "jane@example.com", fontsize=10)
+    top = 200
+    for r in range(4):
+        page.draw_line((50, top + r * 18), (410, top + r * 18))
+    for c in range(4):
+        page.draw_line((50 + c * 120, top), (50 + c * 120, top + 54))
+    for r in range(3):
+        for c in range(3):
+            page.insert_text((55 + c * 120, top + r * 18 + 13), f"cell {r}{c}", fontsize=9)
+    path = tmp_path / "resume.pdf"
+    doc.save(path)
+    doc.close()
+    return str(path)
+
+
+def test_tables_are_opt_in(resume_pdf):
+    lines, _, registry = PDFExtractor().extract(resume_pdf)
+    assert lines and registry["tables"] == []
+    assert [link["uri"] for link in registry["links"]] == ["https://example.com/jane"]
+
+    _, _, registry = PDFExtractor().extract(resume_pdf, mode="full")
+    assert len(registry["tables"]) == 1
+
+    _, _, registry = PDFExtractor().extract(resume_pdf, mode="text-only")
+    assert registry["links"] == [] and registry["tables"] == []
+
+    with pytest.raises(ValueError):
+        PDFExtractor().extract(resume_pdf, mode="tables")
+
+
+def test_mode_reaches_the_extractor(resume_pdf):
+    assert json.loads(extract_pdf_content(resume_pdf))["table_registry"]["tables"] == []
+    result = json.loads(ResumeParser().extract_pdf_content(resume_pdf, mode="full"))
+    assert [t["table_id"] for t in result["table_registry"]["tables"]] == ["page_0_table_0"]
+
+
+def test_cli_takes_a_mode(resume_pdf, monkeypatch, capsys):
+    def run_cli(*args, stdin=b""):
+        monkeypatch.setattr(sys, "argv", ["main.py", *args])
+        monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BytesIO(stdin)))
+        cli.main()
+        return capsys.readouterr().out
+
+    default = json.loads(run_cli("extract_pdf_content", resume_pdf))
+    assert default["table_registry"]["tables"] == []
+    full = json.loads(run_cli("extract_pdf_content", "--mode", "full", resume_pdf))
+    assert len(full["table_registry"]["tables"]) == 1
+    # PDF bytes on stdin instead of a path
+    piped = json.loads(run_cli("extract_pdf_content", "--mode=full", stdin=Path(resume_pdf).read_bytes()))
+    assert piped["table_registry"]["tables"] == full["table_registry"]["tables"]
+    encoded = base64.b64encode(Path(resume_pdf).read_bytes()) + b"\n"
+    assert json.loads(run_cli("extract_pdf_content", stdin=encoded))["total_lines"] == default["total_lines"]
+    assert "Unknown mode" in run_cli("extract_pdf_content", "--mode", "tables", resume_pdf)
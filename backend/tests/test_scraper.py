@@ -0,0 +1,90 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from app.models import db, JobPosting
+from app.services import scraper
+
+
+def job_page(title, skills):
+    posting = {"@context": "https://schema.org", "@type": "JobPosting", "title": title,
+               "description": f"<p>Work with {' and '.join(skills)}.</p>", "skills": skills}
+    return (f'<html><head><script type="application/ld+json">{json.dumps(posting)}</script></head>'
+            f'<body><a href="/">back</a></body></html>')
+
+
+@pytest.fixture
+def job_board():
+    """A local stand-in job board with canned pages that honours If-None-Match."""
+    pages = {
+        "/": '<html><body><a href="/jobs/1">One</a><a href="/jobs/2">Two</a></body></html>',
+        "/jobs/1": job_page("Data Engineer", ["Python", "SQL"]),
+        "/jobs/2": job_page("Frontend Developer", ["JavaScript", "React"]),
+    }
+    requests_seen = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = pages.get(self.path)
+            if body is None:
+                self.send_error(404)
+                return
+            etag = f'"{hash(body) & 0xffffffff:x}"'
+            requests_seen.append((self.path, self.headers.get("If-None-Match")))
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.end_headers()
+                return
+            data = body.encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(data)))
+            self.send_header("ETag", etag)
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/", pages, requests_seen
+    server.shutdown()
+    server.server_close()
+
+
+def test_validators_survive_between_scrape_runs(app, job_board, tmp_path):
+    url, pages, requests_seen = job_board
+    state = tmp_path / "scraper-state.json"
+    runner = app.test_cli_runner()
+
+    def scrape():
+        requests_seen.clear()
+        result = runner.invoke(args=["scrape-jobs", url, "--no-extract", "--state", str(state)])
+        assert result.exit_code == 0, result.output
+        with app.app_context():
+            return sorted(db.session.scalars(db.select(JobPosting.title)))
+
+    assert scrape() == ["Data Engineer", "Frontend Developer"]
+    assert all(etag is None for _, etag in requests_seen)
+    assert set(json.loads(state.read_text())) == {url, url + "jobs/1", url + "jobs/2"}
+
+    # A fresh command loads the saved validators: every page is a conditional GET answered with 304
+    assert scrape() == ["Data Engineer", "Frontend Developer"]
+    assert len(requests_seen) == 3 and all(etag for _, etag in requests_seen)
+
+    # Only the changed page is fetched and imported again
+    pages["/jobs/2"] = job_page("Backend Developer", ["Python", "Docker"])
+    assert scrape() == ["Backend Developer", "Data Engineer", "Frontend Developer"]
+
+
+def test_unreadable_state_starts_a_cold_crawl(tmp_path):
+    state = tmp_path / "state.json"
+    assert scraper.load_validators(str(state)) == {}
+    state.write_text("{not json")
+    assert scraper.load_validators(str(state)) == {}
+    scraper.save_validators(str(state), {"https://example.com/": {"etag": '"1"', "links": []}})
+    assert scraper.load_validators(str(state))["https://example.com/"]["etag"] == '"1"'
@@ -0,0 +1,115 @@
+import pytest
+
+from app.models import db, LegacySkill, Skill, User, UserSkill
+from app.services.skills import migrate_legacy_skills, users_with_skills
+
+from conftest import ADMIN_KEY
+
+
+def names(response):
+    return sorted(s["name"] for s in response.get_json()["skills"])
+
+
+def test_add_and_set_skills_share_canonical_rows(app, client, register):
+    _, alice = register("alice")
+    _, bob = register("bob")
+
+    response = client.post("/api/profile/skills", headers=alice,
+                           json={"skills": [{"name": "JS"}, {"name": "Teamwork", "type": "soft"}]})
+    assert response.status_code == 201
+    assert names(response) == ["JavaScript", "Teamwork"]
+    response = client.post("/api/profile/skills", headers=bob, json={"skills": [{"name": "javascript"}]})
+    assert response.get_json()["added"] == ["JavaScript"]
+    # Adding a skill the user already has writes nothing
+    response = client.post("/api/profile/skills", headers=bob, json={"skills": [{"name": "JavaScript"}]})
+    assert response.get_json()["added"] == []
+
+    response = client.put("/api/profile/skills", headers=alice, json={"skills": [{"name": "Python"}]})
+    assert names(response) == ["Python"]
+    body = client.get("/api/profile/skills", headers=bob).get_json()
+    assert [s["name"] for s in body["technical_skills"]] == ["JavaScript"]
+    with app.app_context():
+        assert db.session.scalar(db.select(db.func.count(Skill.id)).where(Skill.name == "JavaScript")) == 1
+
+
+@pytest.mark.parametrize("skills", [
+    "Python",
+    [{"name": 5}],
+    [{"name": "Python", "type": ["soft"]}],
+    [{"type": "technical"}],
+    ["Python"],
+])
+def test_invalid_skill_entries_are_rejected(client, register, skills):
+    _, headers = register()
+    assert client.post("/api/profile/skills", headers=headers, json={"skills": skills}).status_code == 400
+    assert client.put("/api/profile/skills", headers=headers, json={"skills": skills}).status_code == 400
+
+
+def test_remove_skill(client, register):
+    _, headers = register()
+    client.post("/api/profile/skills", headers=headers, json={"skills": [{"name": "Python"}, {"name": "SQL"}]})
+    response = client.delete("/api/profile/skills", headers=headers, json={"skill": "python"})
+    assert response.status_code == 200
+    assert names(response) == ["SQL"]
+    assert client.delete("/api/profile/skills", headers=headers, json={"skill": "Go"}).status_code == 404
+    assert client.delete("/api/profile/skills", headers=headers, json={"skill": ["SQL"]}).status_code == 400
+
+
+def test_admin_sync_replaces_and_adds_in_one_request(app, client, register):
+    alice_id, alice = register("alice")
+    bob_id, _ = register("bob")
+    client.post("/api/profile/skills", headers=alice, json={"skills": [{"name": "Excel"}]})
+
+    payload = {"users": [
+        {"user_id": alice_id, "skills": [{"name": "Python"}, {"name": "SQL"}]},
+        {"user_id": bob_id, "skills": [{"name": "Python"}, {"name": "Communication", "type": "soft"}]},
+    ]}
+    assert client.post("/api/admin/skills/sync", json=payload).status_code == 403
+    headers = {"X-Admin-Key": ADMIN_KEY}
+    body = client.post("/api/admin/skills/sync", headers=headers, json=payload).get_json()
+    assert (body["changed_users"], body["inserted"], body["deleted"]) == (2, 4, 1)
+    # Syncing the same skills again writes nothing
+    body = client.post("/api/admin/skills/sync", headers=headers, json=payload).get_json()
+    assert (body["changed_users"], body["inserted"], body["deleted"]) == (0, 0, 0)
+
+    with app.app_context():
+        assert users_with_skills(["Python"]) == [alice_id, bob_id]
+        assert users_with_skills(["SQL", "Communication"], match_all=False) == [alice_id, bob_id]
+        assert users_with_skills(["Python", "SQL"]) == [alice_id]
+
+
+@pytest.mark.parametrize("users", [
+    [{"user_id": 1, "skills": [{"name": 3}]}],
+    [{"user_id": 1, "skills": [{"name": "Python", "type": 1}]}],
+    [{"user_id": 1, "skills": ["Python"]}],
+    [{"user_id": "1", "skills": []}],
+    [{"user_id": 99, "skills": []}],
+    [],
+])
+def test_admin_sync_rejects_invalid_payloads(client, register, users):
+    register()
+    response = client.post("/api/admin/skills/sync", headers={"X-Admin-Key": ADMIN_KEY}, json={"users": users})
+    assert response.status_code == 400
+
+
+def test_legacy_skill_rows_are_migrated(app, register):
+    alice_id, _ = register("alice")
+    with app.app_context():
+        db.session.add_all([
+            LegacySkill(user_id=alice_id, name="JS", type="technical"),
+            LegacySkill(user_id=alice_id, name="javascript", type="technical"),
+            LegacySkill(user_id=alice_id, name="Public Speaking", type="soft"),
+            LegacySkill(user_id=alice_id, name="   ", type="technical"),
+        ])
+        db.session.commit()
+        version = db.session.get(User, alice_id).profile_version or 0
+
+        assert migrate_legacy_skills(batch_size=2) == 4
+        assert db.session.scalar(db.select(db.func.count(LegacySkill.id))) == 0
+        linked = db.session.execute(
+            db.select(Skill.name, Skill.type).join(UserSkill).where(UserSkill.user_id == alice_id)
+            .order_by(Skill.name)
+        ).all()
+        assert [tuple(row) for row in linked] == [("JavaScript", "technical"), ("Public Speaking", "soft")]
+        db.session.expire_all()
+        assert db.session.get(User, alice_id).profile_version > version
@@ -88,10 +88,17 @@ export const removeSkill = (skill) => {
 
 // ------------------- JOB DATA -------------------
 
-// Get job market data
-export const getJobData = () => {
+// Get job market data (one page; params: cursor, limit, fields, title, location, skill, min_salary, max_salary)
+// The next page's cursor is in the X-Next-Cursor response header
+export const getJobData = (params) => {
   // GET /api/jobdata
-  return api.get('/api/jobdata');
+  return api.get('/api/jobdata', { params });
+};
+
+// Get skill demand counts (params: by = 'title' | 'location', value, limit)
+export const getSkillDemand = (params) => {
+  // GET /api/market/demand
+  return api.get('/api/market/demand', { params });
 };
 
 // ------------------- GAP ANALYSIS -------------------
@@ -102,6 +109,12 @@ export const analyzeGap = (data) => {
   return api.post('/api/gap/analyze', data);
 };
 
+// Analyze skill gap against many job titles at once (all titles when none given)
+export const analyzeGapBulk = (data) => {
+  // POST /api/gap/analyze/bulk
+  return api.post('/api/gap/analyze/bulk', data);
+};
+
 // ------------------- RECOMMENDATIONS -------------------
 
 // Get learning recommendations (POST for detailed, GET for default)